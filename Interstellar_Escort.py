@@ -1,642 +1,4460 @@
 import pygame
+import argparse
+import array
+import collections
+import concurrent.futures
+import heapq
+import io
+import json
+import math
+import operator
 import random
 import os
+import queue
+import socket
+import struct
+import sys
+import threading
 import time
+import zlib
+
+try:
+    import numpy as np
+except ImportError:             # numpy is only needed for the optional VectorCollisions backend
+    np = None
+
+INPUT_LEFT = 1                  # input bit set while the left arrow key is held
+INPUT_RIGHT = 2                 # input bit set while the right arrow key is held
+
+class AssetCache:
+    '''Loads sounds, fonts and images once and hands out the same shared object on every later request.
+
+    Sounds and images are keyed by path, fonts by name, size and style. Every request counts as either a hit
+    (already loaded) or a miss (loaded from disk or looked up in the system fonts). Once a display exists,
+    images are converted to its pixel format so that blitting them doesn't convert every pixel each frame.
+    Sprites are smoothscaled to the resolution the playfield is shown at when they are loaded, and kept for
+    every size they've been scaled to, so nothing is scaled while frames are drawn.
+
+    Assets can also be loaded on worker threads with load_async() while the main thread keeps drawing. Workers
+    only read and decode files; what they load is put in the cache by poll() or wait() on the main thread, so the
+    cache is never touched by two threads. pygame fonts aren't safe to create off the main thread, so a worker
+    only scans the system fonts, which is the slow part of SysFont, and the fonts are created when installed. An asset that fails to load in the background is loaded again when it's
+    requested, raising the error where the asset is needed.
+
+    Attributes
+        sounds (dict): pygame Sounds keyed by path
+        fonts (dict): pygame fonts keyed by (name, size, bold, italic)
+        images (dict): pygame images keyed by path
+        music_files (dict): contents of music files keyed by path
+        sprites (dict): scaled pygame images keyed by (path, width, height)
+        converted (set): paths of images that have been converted to the display pixel format
+        hits (int): number of requests served from the cache
+        misses (int): number of requests that had to load the asset
+        load_time (float): seconds spent by the most recent call to load_sprites()
+        loader (ThreadPoolExecutor obj): worker threads of the background load, None when nothing is loading
+        pending (list): (cache, key, future) of background loads that haven't been put in the cache yet
+        queued (int): number of assets the background load started with
+        failed (list): keys of assets whose background load failed
+        async_start (float): perf_counter time of the most recent load_async()
+        async_time (float): seconds from load_async() until every asset it queued was loaded
+    '''
+    def __init__(self):
+        self.sounds = {}
+        self.fonts = {}
+        self.images = {}
+        self.music_files = {}
+        self.sprites = {}
+        self.converted = set()
+        self.hits = 0
+        self.misses = 0
+        self.load_time = 0
+        self.loader = None
+        self.pending = []
+        self.queued = 0
+        self.failed = []
+        self.async_time = 0
+        self.async_start = 0
+
+    def sound(self, path):
+        '''Shared pygame Sound for a sound file
+
+        Args
+            path (str): path of sound file
+
+        Returns
+            pygame Sound: loaded sound
+        '''
+        if path in self.sounds:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self.sounds[path] = pygame.mixer.Sound(path)
+        return self.sounds[path]
+
+    def font_key(self, name, size, bold=False, italic=False):
+        '''Key of a font in fonts
+
+        Returns
+            tuple: (name, size, bold, italic)
+        '''
+        return (name, size, bool(bold), bool(italic))
+
+    def music(self, path):
+        '''Music file for pygame.mixer.music.load(), read from memory so starting a track never waits on the disk
+
+        Args
+            path (str): path of music file
+
+        Returns
+            BytesIO obj: file object of the music, a new one every call since the mixer streams from it
+        '''
+        if path in self.music_files:
+            self.hits += 1
+        else:
+            self.misses += 1
+            with open(path, 'rb') as infile:
+                self.music_files[path] = infile.read()
+        return io.BytesIO(self.music_files[path])
+
+    def font(self, name, size, bold=False, italic=False):
+        '''Shared pygame SysFont
+
+        Args
+            name (str): system font name
+            size (int): font height
+            bold (bool): bold font
+            italic (bool): italic font
+
+        Returns
+            pygame font: loaded font
+        '''
+        key = self.font_key(name, size, bold, italic)
+        if key in self.fonts:
+            self.hits += 1
+        else:
+            self.misses += 1
+            if not pygame.font.get_init():
+                pygame.font.init()
+            self.fonts[key] = pygame.font.SysFont(name, size, bool(bold), bool(italic))
+        return self.fonts[key]
+
+    def image(self, path):
+        '''Shared pygame image for an image file, converted to the display pixel format if a display exists
+
+        Args
+            path (str): path of image file
+
+        Returns
+            pygame image: loaded image
+        '''
+        if path in self.images:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return self.load_image(path)
+
+    def load_image(self, path):
+        '''Image for an image file from the cache, loading and converting it if needed, without counting the request
+
+        Args
+            path (str): path of image file
+
+        Returns
+            pygame image: loaded image
+        '''
+        if path not in self.images:
+            self.images[path] = pygame.image.load(path)
+        if (path not in self.converted) and (pygame.display.get_surface() is not None):
+            self.images[path] = self.convert(self.images[path])
+            self.converted.add(path)
+        return self.images[path]
+
+    def sprite(self, path, size=None):
+        '''Shared image for an image file scaled from its size on the playfield to the size it is shown at
+
+        Args
+            path (str): path of image file
+            size (tuple): width and height of the image on the playfield, the size of the file if None
+
+        Returns
+            pygame image: image scaled by view.scale, the loaded image itself if that doesn't change its size
+        '''
+        loaded = path in self.images
+        image = self.load_image(path)                       # counted once below, as the image or the scaled sprite
+        width, height = size if size is not None else image.get_size()
+        scaled_size = (view.length(width), view.length(height))
+        if scaled_size == image.get_size():
+            if loaded:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return image
+        key = (path, *scaled_size)
+        if key in self.sprites:
+            self.hits += 1
+        else:
+            self.misses += 1
+            if image.get_bitsize() >= 24:                   # smoothscale only works on 24 and 32 bit images
+                self.sprites[key] = pygame.transform.smoothscale(image, scaled_size)
+            else:
+                self.sprites[key] = pygame.transform.scale(image, scaled_size)
+        return self.sprites[key]
+
+    def convert(self, image):
+        '''Convert an image to the display pixel format, keeping per-pixel transparency
+
+        Args
+            image (pygame image): image loaded from disk
+
+        Returns
+            pygame image: converted image
+        '''
+        if image.get_flags() & pygame.SRCALPHA:
+            return image.convert_alpha()
+        return image.convert()
+
+    def load_sprites(self):
+        '''Load every sprite into the class attributes that hold them.
+
+        Must be called after pygame.display.set_mode() so that each image is converted to the display pixel
+        format, and after the view has been set up so that sprites are scaled to the resolution the playfield
+        is shown at. Nothing is loaded when the module is imported.
+        '''
+        start = time.perf_counter()
+        self.load_background()
+        Mothership.image = self.sprite('Mothership/mothership_3_2.png', (view.width, 50))     # stretched across the playfield
+        Character.center_images = [self.sprite(f'main_sprite/planes_02A-center{x}.png') for x in range(1,5)]
+        Character.strafing_right_images = [self.sprite(f'main_sprite/planes_02A-strafe_right{x}.png') for x in range(5,9)]
+        Character.strafe_right_on = [self.sprite(f'main_sprite/planes_02A-R{x}.png') for x in range(9,13)]
+        Character.strafing_left_images = [self.sprite(f'main_sprite/planes_02A-strafe_left{x}.png') for x in range(5,9)]
+        Character.strafe_left_on = [self.sprite(f'main_sprite/planes_02A-L{x}.png') for x in range(9,13)]
+        Asteroid.asteroid_images = {width: [self.sprite(f'Asteroids/res{width}{suffix}.png') for suffix in ['', '_1', '_2', '_3', '_4']]
+                                    for width in Asteroid.width_options}
+        TimedPowerUp.power_ups = {'Insta-Kill': self.sprite('powerups/icon-powerup.png'), 'Double XP': self.sprite('powerups/icon-special.png')}
+        Health_PowerUp.health_image = self.sprite('powerups/icon-health.png')
+        Explosion.explosion_images = [self.sprite(f'explosions/explosion-{x}.png') for x in range(1,12)]
+        self.load_time = time.perf_counter() - start
+
+    def load_background(self):
+        '''Load the background, scaled to cover the playfield, into Boundary.back_ground. The title screen shows it
+        as soon as it's loaded, before the other sprites'''
+        background = self.image('Background_images/p.png')
+        cover = max(1, view.width / background.get_width(), view.height / background.get_height())
+        Boundary.back_ground = self.sprite('Background_images/p.png', (round(background.get_width() * cover),
+                                                                     round(background.get_height() * cover)))
+
+    def blit_savings(self, window, repeats=100):
+        '''Measure how much faster the converted images blit than the images as loaded from disk
+
+        Args
+            window (pygame Surface): display surface to blit to
+            repeats (int): number of times each image is blitted
+
+        Returns
+            dict: seconds spent blitting every image 'repeats' times, as loaded ('raw') and converted ('converted')
+        '''
+        times = {'raw': 0, 'converted': 0}
+        for path in self.converted:
+            for key, image in (('raw', pygame.image.load(path)), ('converted', self.images[path])):
+                start = time.perf_counter()
+                for _ in range(repeats):
+                    window.blit(image, (0, 0))
+                times[key] += time.perf_counter() - start
+        return times
+
+    def preload(self, manifest):
+        '''Load every asset listed in a manifest so none are loaded during game play
+
+        Args
+            manifest (dict): may contain 'sounds' and 'images' lists of paths and a 'fonts' list of
+                (name, size, bold) tuples. Font sizes are scaled by view.scale
+        '''
+        for path in manifest.get('sounds', []):
+            self.sound(path)
+        for name, size, *style in manifest.get('fonts', []):
+            self.font(name, view.length(size), *style)
+        for path in manifest.get('images', []):
+            self.image(path)
+        for path in manifest.get('music', []):
+            self.music(path)
+
+    def load_async(self, manifest, workers=4):
+        '''Start loading every asset listed in a manifest on worker threads. Assets are loaded in manifest order,
+        fonts first, then sounds, music and images
+
+        Args
+            manifest (dict): as for preload(), and a 'music' list of paths
+            workers (int): number of worker threads
+        '''
+        self.loader = concurrent.futures.ThreadPoolExecutor(workers, thread_name_prefix='asset loader')
+        self.async_start = time.perf_counter()
+        self.failed = []
+        fonts = [self.font_key(name, view.length(size), *style) for name, size, *style in manifest.get('fonts', [])]
+        fonts = [key for key in fonts if key not in self.fonts]
+        if fonts:
+            # one job for every font, the first lookup scans the system fonts and shouldn't run twice at once
+            self.pending.append((self.fonts, fonts, self.loader.submit(self.find_fonts, fonts)))
+        for cache, paths, load in [(self.sounds, manifest.get('sounds', []), pygame.mixer.Sound),
+                                   (self.music_files, manifest.get('music', []), self.read_file),
+                                   (self.images, manifest.get('images', []), pygame.image.load)]:
+            for path in paths:
+                if path not in cache:
+                    self.pending.append((cache, path, self.loader.submit(load, path)))
+        self.queued = len(self.pending)
+
+    def find_fonts(self, keys):
+        '''Look up fonts in pygame's table of system fonts, which is built by scanning the installed fonts on the
+        first lookup. Runs on a worker thread, the fonts are created by install() on the main thread
+
+        Args
+            keys (list): (name, size, bold, italic) of every font
+        '''
+        for name, _, bold, italic in keys:
+            pygame.font.match_font(name, bold, italic)
+
+    def read_file(self, path):
+        '''Read a whole file. Runs on a worker thread
+
+        Args
+            path (str): path of file
+
+        Returns
+            bytes: contents of the file
+        '''
+        with open(path, 'rb') as infile:
+            return infile.read()
+
+    def poll(self):
+        '''Put every asset the workers have finished loading in the cache
+
+        Returns
+            float: fraction of the background load done, 1 once everything is loaded
+        '''
+        for item in [item for item in self.pending if item[2].done()]:
+            self.pending.remove(item)
+            self.install(*item)
+        if self.loader is not None and not self.pending:
+            self.loader.shutdown()
+            self.loader = None
+            self.async_time = time.perf_counter() - self.async_start
+        return 1 - len(self.pending) / self.queued if self.queued else 1
+
+    def install(self, cache, key, future):
+        '''Put an asset loaded by a worker in its cache
+
+        Args
+            cache (dict): cache the asset belongs in
+            key: key of the asset in the cache, a list of keys for the fonts job
+            future (Future obj): finished load
+        '''
+        if future.exception() is not None:
+            self.failed.append(key)                         # loaded again, raising the error, when requested
+            return
+        if cache is self.fonts:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            for font_key in key:                            # the system fonts have been scanned, so this is quick
+                self.fonts[font_key] = pygame.font.SysFont(*font_key)
+            self.misses += len(key)
+        else:
+            cache[key] = future.result()
+            self.misses += 1
+
+    def wait(self):
+        '''Readiness barrier, block until every asset of the background load is loaded and in the cache'''
+        concurrent.futures.wait([future for _, _, future in self.pending])
+        self.poll()
+
+    def loaded(self, path):
+        '''Whether a sound, image or music file is in the cache
+
+        Args
+            path (str): path of asset
+
+        Returns
+            bool: True if requesting it won't load it
+        '''
+        return (path in self.sounds) or (path in self.images) or (path in self.music_files)
+
+    def font_loaded(self, name, size, bold=False, italic=False):
+        '''Whether a font is in the cache
+
+        Args
+            name (str): system font name
+            size (int): font height
+            bold (bool): bold font
+            italic (bool): italic font
+
+        Returns
+            bool: True if requesting it won't load it
+        '''
+        return self.font_key(name, size, bold, italic) in self.fonts
+
+    def stats(self):
+        '''Cache statistics
+
+        Returns
+            dict: hit and miss counts, number of cached sounds, fonts, images, music files and scaled sprites, and
+                number of background loads pending and failed
+        '''
+        return {'hits': self.hits, 'misses': self.misses, 'sounds': len(self.sounds),
+                'fonts': len(self.fonts), 'images': len(self.images), 'music': len(self.music_files),
+                'sprites': len(self.sprites), 'pending': len(self.pending), 'failed': len(self.failed)}
+
+assets = AssetCache()
+
+class TextCache:
+    '''Keeps rendered text surfaces so unchanged text isn't rendered again every frame.
+
+    Surfaces are keyed by font, text and color and the least recently used surface is dropped once the cache
+    is full. Numbers that change often (the score and +N popups) can be drawn with blit_number(), which
+    composes them from cached single character surfaces so a new score never has to be rendered as a whole.
+
+    Args
+        capacity (int): maximum number of surfaces kept
+
+    Attributes
+        capacity (int): storage of input argument capacity
+        surfaces (OrderedDict): rendered surfaces keyed by (font, text, color), least recently used first
+        hits (int): number of renders served from the cache
+        misses (int): number of renders that called font.render()
+        evictions (int): number of surfaces dropped to make room
+    '''
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self.surfaces = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, color):
+        '''Antialiased text surface, rendered only if it isn't already cached
+
+        Args
+            font (pygame font): font to render with
+            text (str): text to render
+            color (tuple): RGB value of text color
+
+        Returns
+            pygame Surface: rendered text
+        '''
+        key = (font, text, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = font.render(text, 1, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.capacity:
+            self.surfaces.popitem(last=False)           # drop least recently used surface
+            self.evictions += 1
+        return surface
+
+    def number_size(self, font, text, color):
+        '''Size of a number drawn by blit_number()
+
+        Args
+            font (pygame font): font to render with
+            text (str): digits, possibly with a leading '+' or '-'
+            color (tuple): RGB value of text color
+
+        Returns
+            tuple: (width, height) in pixels
+        '''
+        glyphs = [self.render(font, char, color) for char in text]
+        return sum(glyph.get_width() for glyph in glyphs), max(glyph.get_height() for glyph in glyphs)
+
+    def blit_number(self, window, font, text, color, position):
+        '''Draw a number one cached character at a time
+
+        Args
+            window (pygame Surface): surface to draw to
+            font (pygame font): font to render with
+            text (str): digits, possibly with a leading '+' or '-'
+            color (tuple): RGB value of text color
+            position (tuple): (x, y) of top left corner
+
+        Returns
+            pygame Rect: area of the screen drawn to
+        '''
+        x, y = position
+        rect = None
+        for char in text:
+            glyph = self.render(font, char, color)
+            glyph_rect = window.blit(glyph, (x, y))
+            rect = glyph_rect if rect is None else rect.union(glyph_rect)
+            x += glyph.get_width()
+        return rect
+
+    def hit_rate(self):
+        '''Fraction of renders served from the cache
+
+        Returns
+            float: hit rate, 0 if nothing has been rendered
+        '''
+        total = self.hits + self.misses
+        return self.hits / total if total else 0
+
+    def stats(self):
+        '''Cache statistics
+
+        Returns
+            dict: hits, misses, evictions, hit rate and number of cached surfaces
+        '''
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'hit_rate': self.hit_rate(), 'size': len(self.surfaces)}
+
+text_cache = TextCache()
+
+class VoicePool:
+    '''Plays sound effects on a fixed set of reserved mixer channels.
+
+    At most voices sounds play at once. When every voice is busy the oldest one playing a sound of the same or
+    lower priority is stolen, and if there is none the new sound is dropped. A sound started again within
+    repeat_window seconds of its last start is dropped as well, so a wave of explosions is heard as one
+    explosion rather than a pile of them. Music plays on its own stream and isn't affected.
+
+    Args
+        voices (int): number of mixer channels reserved for sound effects
+        repeat_window (float): seconds during which repeats of the same sound are dropped
+
+    Attributes
+        voices (int): storage of input argument voices
+        repeat_window (float): storage of input argument repeat_window
+        channels (list): reserved pygame Channels, None until the mixer is first used
+        started (list): time each channel's current sound was started
+        priorities (list): priority of each channel's current sound
+        last_played (dict): time each sound was last started, keyed by sound
+        played (int): number of sounds started
+        dropped (int): number of sounds not played, either repeats or with no voice to take
+        stolen (int): number of sounds cut off to make room for a new one
+    '''
+    def __init__(self, voices=4, repeat_window=0.05):
+        self.voices = voices
+        self.repeat_window = repeat_window
+        self.channels = None
+        self.started = [0.0] * voices
+        self.priorities = [0] * voices
+        self.last_played = {}
+        self.played = 0
+        self.dropped = 0
+        self.stolen = 0
+
+    def reserve(self):
+        '''Reserve the pool's channels so that sounds played any other way never use them'''
+        if pygame.mixer.get_num_channels() < self.voices:
+            pygame.mixer.set_num_channels(self.voices)
+        pygame.mixer.set_reserved(self.voices)              # reserved channels are the lowest numbered ones
+        self.channels = [pygame.mixer.Channel(i) for i in range(self.voices)]
+
+    def play(self, sound, priority=0, now=None):
+        '''Play a sound on a free voice, stealing or dropping as needed
+
+        Args
+            sound (pygame Sound): sound to play
+            priority (int): sounds only steal voices playing sounds of the same or lower priority
+            now (float): current time in seconds, perf_counter() if None
+
+        Returns
+            pygame Channel: channel playing the sound, None if it was dropped
+        '''
+        if not pygame.mixer.get_init():                     # no audio device
+            return None
+        now = time.perf_counter() if now is None else now
+        if now - self.last_played.get(sound, -self.repeat_window) < self.repeat_window:
+            self.dropped += 1                               # same sound only just started
+            return None
+        if self.channels is None:
+            self.reserve()
+
+        voice = None
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                voice = i
+                break
+        if voice is None:
+            candidates = [i for i in range(self.voices) if self.priorities[i] <= priority]
+            if not candidates:
+                self.dropped += 1                           # every voice is playing something more important
+                return None
+            voice = min(candidates, key=self.started.__getitem__)   # steal the oldest
+            self.stolen += 1
+
+        channel = self.channels[voice]
+        channel.play(sound)                                 # replaces whatever the channel was playing
+        self.started[voice] = now
+        self.priorities[voice] = priority
+        self.last_played[sound] = now
+        self.played += 1
+        return channel
+
+    def stats(self):
+        '''Voice statistics
+
+        Returns
+            dict: played, dropped and stolen counts and number of voices busy right now
+        '''
+        busy = sum(channel.get_busy() for channel in self.channels) if self.channels else 0
+        return {'played': self.played, 'dropped': self.dropped, 'stolen': self.stolen, 'busy': busy}
+
+voices = VoicePool()
+
+class Viewport:
+    '''Maps playfield coordinates, in which the game is simulated, to pixels of the surface it is drawn to.
+
+    The playfield is scaled to fit the window without changing its shape and centered in it. At a scale of 1
+    and no offset every method hands back its arguments unchanged, so the default 500x700 window is drawn
+    exactly as before. Sprites are scaled to match by assets.sprite() when they're loaded.
+
+    Attributes
+        width (int): width of playfield in number of pixels
+        height (int): height of playfield in number of pixels
+        scale (float): window pixels per playfield pixel
+        x (int): left edge of the playfield in the window
+        y (int): top edge of the playfield in the window
+    '''
+    def __init__(self):
+        self.width = 500
+        self.height = 700
+        self.scale = 1
+        self.x = 0
+        self.y = 0
+
+    def fit(self, width, height, size=None):
+        '''Show a playfield of the given size in a window of the given size
+
+        Args
+            width (int): width of playfield
+            height (int): height of playfield
+            size (tuple): width and height of the surface drawn to, the playfield size if None
+        '''
+        self.width = width
+        self.height = height
+        if size is None or tuple(size) == (width, height):
+            self.scale, self.x, self.y = 1, 0, 0
+            return
+        self.scale = min(size[0] / width, size[1] / height)
+        self.x = (size[0] - round(width * self.scale)) // 2        # letterboxed, the spare space is split evenly
+        self.y = (size[1] - round(height * self.scale)) // 2
+
+    def point(self, x, y):
+        '''Window position of a playfield position
+
+        Returns
+            tuple: (x, y) in window pixels
+        '''
+        if self.scale == 1:
+            return (self.x + x, self.y + y)
+        return (self.x + round(x * self.scale), self.y + round(y * self.scale))
+
+    def rect(self, x, y, width, height):
+        '''Window area of a playfield rectangle. Edges are rounded rather than the size, so neighbouring
+        rectangles still meet
+
+        Returns
+            tuple: (x, y, width, height) in window pixels
+        '''
+        if self.scale == 1:
+            return (self.x + x, self.y + y, width, height)
+        left, top = round(x * self.scale), round(y * self.scale)
+        return (self.x + left, self.y + top, round((x + width) * self.scale) - left, round((y + height) * self.scale) - top)
+
+    def length(self, amount):
+        '''Window pixels spanned by a playfield length, at least one so thin lines don't vanish
+
+        Returns
+            int: length in window pixels
+        '''
+        if self.scale == 1:
+            return amount
+        return max(1, round(amount * self.scale))
+
+    def area(self):
+        '''Window area covered by the playfield
+
+        Returns
+            pygame Rect: playfield area
+        '''
+        return pygame.Rect(self.rect(0, 0, self.width, self.height))
+
+view = Viewport()
+
 
 class Boundary:
     '''Generate pygame display window.
+
+    The window may be larger or smaller than the playfield, which is then shown as large as fits with black
+    bars around it. With 'prescaled' scaling every sprite and font is scaled to the window resolution when it
+    is loaded and drawn straight to the display. With 'offscreen' scaling the game is drawn at playfield size
+    to an offscreen surface, which is smoothscaled onto the display in a single blit every frame.
     
     Args:
-        width (int): width of display in number of pixels
-        height(int): height of display in number of pixels
+        width (int): width of playfield in number of pixels
+        height(int): height of playfield in number of pixels
+        resolution (tuple): width and height of the window, the playfield size if None. (0, 0) with
+            fullscreen uses the desktop resolution
+        scaling (str): 'prescaled' or 'offscreen'
+        fullscreen (bool): open a fullscreen window
+
+    Attributes:
+        width (int): storage of input argument width
+        height (int): storage of input argument height
+        screen (pygame Surface): display surface
+        window (pygame Surface): surface the game is drawn to. The display surface, or an offscreen surface
+            at playfield size with 'offscreen' scaling
+        scaled (pygame Surface): area of the display the offscreen surface is scaled into, None if drawn directly
     '''
-    back_ground = pygame.image.load('Background_images/p.png')
+    back_ground = None                  # loaded by assets.load_sprites() once the display exists
+    scaling_options = ['prescaled', 'offscreen']
 
-    def __init__(self, width, height):
+    def __init__(self, width, height, resolution=None, scaling='prescaled', fullscreen=False):
+        if scaling not in Boundary.scaling_options:
+            raise ValueError(f'scaling must be one of {Boundary.scaling_options}, not {scaling!r}')
         self.width = width
         self.height = height
-        self.window = pygame.display.set_mode((self.width, self.height))
+        self.screen = pygame.display.set_mode(resolution or (width, height), pygame.FULLSCREEN if fullscreen else 0)
         pygame.display.set_caption('Interstellar Escort')
+        view.fit(width, height, self.screen.get_size())
+        self.screen.set_clip(view.area())                           # keep the letterbox bars black
+        self.window = self.screen
+        self.scaled = None
+        if scaling == 'offscreen' and view.scale != 1:
+            self.scaled = self.screen.subsurface(view.area())       # the offscreen surface is scaled into this area
+            view.fit(width, height)                                 # and drawn to at playfield size
+            self.window = pygame.Surface((width, height)).convert()
 
+    def update(self, rects=None):
+        '''Show what has been drawn since the last update
 
-class Mothership:
-    '''Mothership object is displayed at the bottom of screen and the objective is to protect it.
+        Args
+            rects (list): areas of the window that changed, everything if None. Offscreen drawing always
+                updates the whole playfield
+        '''
+        if self.scaled is not None:
+            pygame.transform.smoothscale(self.window, self.scaled.get_size(), self.scaled)
+            pygame.display.update(self.scaled.get_abs_offset() + self.scaled.get_size())
+        elif rects is None:
+            pygame.display.update()
+        else:
+            pygame.display.update(rects)
 
-    Class Attributes:
-        image (pygame image): 50x500 image displayed onscreen
 
-    Attributes:
-        x (int): x coordinate image location
-        y (int): y coordinate image location
-        health_amt (int): initial health amount
-        damage_taken (int): initial damage amount
-        total (int): combination of health and damage amounts
-        hbar_x (int): x coordinate of health bar
-        hbar_y (int): y coordinate of health bar
-        hbar_length (int): length of health bar (constant for calcuation purposes)
-        health_width int(int): ratio of remaining health over total, multiplied by health bar length
+class ObjectPool:
+    '''Preallocated storage for frequently created game objects.
+
+    Objects are handed out by acquire() and returned by release() rather than being constructed and left to
+    the garbage collector. Live objects are kept in a list with each object's index stored on it, so release()
+    swaps the last live object into the freed slot and runs in constant time. Pooled classes set up their
+    attributes in a reset() method, which is called every time an object is acquired.
+
+    If the pool has an EntityStore, every live object owns the store row matching its index in live, and rows
+    are added and removed along with the objects.
+
+    Args
+        cls (class): class of pooled objects, must define reset()
+        live (list): list in which live objects are kept (e.g. Asteroid.asteroid_lst)
+        size (int): number of objects to preallocate
+        store (EntityStore obj): columns holding the numeric attributes of the pooled objects
+
+    Attributes
+        cls (class): storage of input argument cls
+        live (list): storage of input argument live
+        store (EntityStore obj): storage of input argument store
+        free (list): released objects waiting to be reused
+        created (int): number of objects that have been allocated
+        reused (int): number of acquires served by a previously released object
+        high_water (int): largest number of objects that have been live at once
     '''
-    image = pygame.image.load('Mothership/mothership_3_2.png')
+    def __init__(self, cls, live, size=0, store=None):
+        self.cls = cls
+        self.live = live
+        self.store = store
+        self.free = []
+        self.created = 0
+        self.reused = 0
+        self.high_water = 0
+        for _ in range(size):
+            obj = cls.__new__(cls)                  # bare object, attributes are filled in by reset() when acquired
+            obj.pool_index = None
+            self.free.append(obj)
+            self.created += 1
 
-    def __init__(self):
-        self.x = 0
-        self.y = 650
-        self.health_amt = 1000
-        self.damage_taken = 0
-        self.total = self.health_amt + self.damage_taken
-        self.hbar_x = 50
-        self.hbar_y = 690
-        self.hbar_length = 450 - self.hbar_x
-        self.health_width = round(self.hbar_length*(self.health_amt/self.total))
-        #self.damage_width = round(self.hbar_length*(self.damage_taken/self.total))
-        
-    def update_damage(self):
-        '''Update instance's health amount and width of health bars'''
-        if self.health_amt > 1000: # if health is above initial amt of 1000 due to powerup reduce in size to original
-            self.health_amt = 1000    
-        self.health_width = round(self.hbar_length*(self.health_amt/self.total))
+    def acquire(self, *args):
+        '''Take an object from the pool and reset it with the given arguments
 
-    def draw(self, window): 
-        '''Draw sprite and health bars to screen
-        
-        Args:
-            window (Boundary obj): window attribute of Boundary object
+        Args
+            *args: arguments passed to the pooled class's reset()
+
+        Returns
+            object: live object
         '''
-        window.blit(Mothership.image, (int(self.x), int(self.y)))
-        
-        # Damage bar is constant length. Covered over by health bar.
-        pygame.draw.rect(window, (255,0,0), (self.hbar_x, self.hbar_y, self.hbar_length, 7)) 
-        
-        # Draw over damage bar. Damage bar is revealed as health is depleted.
-        if self.health_amt > 0: 
-            pygame.draw.rect(window, (0,255,0),(self.hbar_x, self.hbar_y, self.health_width, 7)) 
+        if self.free:
+            obj = self.free.pop()
+            if obj.pool_index is not None:          # preallocated objects haven't been used before
+                self.reused += 1
+        else:
+            obj = self.cls.__new__(self.cls)
+            self.created += 1
+        obj.pool_index = len(self.live)             # set first so that reset() can write to the object's row
+        if self.store is not None:
+            self.store.add_row()
+        obj.reset(*args)
+        self.live.append(obj)
+        if len(self.live) > self.high_water:
+            self.high_water = len(self.live)
+        return obj
 
+    def release(self, obj):
+        '''Return a live object to the pool
 
-class Character:
-    '''Character class is main sprite (spaceship) for this game.
+        Args
+            obj (object): object previously returned by acquire()
+        '''
+        index = obj.pool_index
+        last = self.live.pop()
+        if last is not obj:                         # move last live object into the freed slot
+            self.live[index] = last
+            last.pool_index = index
+        if self.store is not None:
+            self.store.remove_row(index)            # moves the last row the same way
+        obj.pool_index = -1
+        self.free.append(obj)
+
+    def release_all(self):
+        '''Return every live object to the pool'''
+        for obj in self.live:
+            obj.pool_index = -1
+        self.free.extend(self.live)
+        self.live[:] = []
+        if self.store is not None:
+            self.store.clear()
+
+    def restore(self, count):
+        '''Make exactly count objects live without resetting them, for state that is about to be overwritten
+        (see Checkpoint.restore()). Attributes outside the store are left for the caller to set
+
+        Args
+            count (int): number of live objects
+
+        Returns
+            list: live objects
+        '''
+        self.release_all()
+        for _ in range(count):
+            if self.free:
+                obj = self.free.pop()
+            else:
+                obj = self.cls.__new__(self.cls)
+                self.created += 1
+            obj.pool_index = len(self.live)
+            if self.store is not None:
+                self.store.add_row()
+            self.live.append(obj)
+        if count > self.high_water:
+            self.high_water = count
+        return self.live
+
+    def stats(self):
+        '''Pool statistics
+
+        Returns
+            dict: live count, free count, created, reused and high water mark
+        '''
+        return {'live': len(self.live), 'free': len(self.free), 'created': self.created,
+                'reused': self.reused, 'high_water': self.high_water}
+
+
+class EntityStore:
+    '''Numeric state of pooled entities kept in typed arrays, one array per attribute.
+
+    Row i of every column belongs to the i-th live object of the ObjectPool the store is attached to, so the
+    columns line up with lists like Asteroid.asteroid_lst and only the first count rows are live. Objects
+    become small __slots__ views whose column attributes are properties created by field(), and passes that
+    touch every entity (movement, health bars) run over whole columns with shift() and copy() instead of
+    calling a method on each object. Columns support the buffer protocol, so numpy can use them without
+    copying (see view()), and whole column passes use numpy once there are enough rows to pay for its
+    per-call overhead.
 
     Class Attributes
-        center_images (pygame image): images displaying ship in upright postion
-        strafing_right_images (pygame image): intermediate images for right turns
-        strage_right_on (pygame image): final images for right turns
-        strafing_left_images (pygame image): intermediate images for left turns
-        strafe_left_on (pygame image): final images for left turns
+        numpy_rows (int): number of live rows from which column passes are done with numpy, if it's installed
+
+    Args
+        columns (list): (name, array typecode) of each column
+        capacity (int): number of rows to allocate up front
+
+    Attributes
+        columns (dict): arrays keyed by column name. Arrays are grown in place and never replaced
+        capacity (int): number of allocated rows
+        count (int): number of live rows
+    '''
+    numpy_rows = 64
+
+    def __init__(self, columns, capacity=16):
+        self.columns = {name: array.array(typecode, [0]) * capacity for name, typecode in columns}
+        self.capacity = capacity
+        self.count = 0
+
+    def add_row(self):
+        '''Add a row at the end of the live rows, growing the columns if they're full
+
+        Returns
+            int: index of the new row
+        '''
+        if self.count == self.capacity:
+            for column in self.columns.values():
+                column.extend(array.array(column.typecode, [0]) * self.capacity)    # double in place
+            self.capacity *= 2
+        self.count += 1
+        return self.count - 1
+
+    def remove_row(self, index):
+        '''Remove a live row by moving the last live row into its place, as ObjectPool.release() does
+
+        Args
+            index (int): row to remove
+        '''
+        last = self.count - 1
+        if index != last:
+            for column in self.columns.values():
+                column[index] = column[last]
+        self.count = last
+
+    def clear(self):
+        '''Remove every row'''
+        self.count = 0
+
+    def field(self, name, doc=None):
+        '''Property that reads and writes an object's row in a column
+
+        Args
+            name (str): column name
+            doc (str): docstring of the property
+
+        Returns
+            property: to be set as a class attribute of the view class
+        '''
+        column = self.columns[name]
+
+        def get_value(obj):
+            return column[obj.pool_index]
+
+        def set_value(obj, value):
+            column[obj.pool_index] = value
+
+        return property(get_value, set_value, None, doc)
+
+    def shift(self, target, amount, sign=1):
+        '''Add a column to another over every live row, e.g. move every entity by its velocity
+
+        Args
+            target (str): name of column that is changed
+            amount (str): name of column that is added
+            sign (int): 1 to add, -1 to subtract
+        '''
+        if np is not None and self.count >= self.numpy_rows:        # in place on the column's own memory
+            view = self.view(target)
+            if sign > 0:
+                view += self.view(amount)
+            else:
+                view -= self.view(amount)
+            return
+        n = self.count
+        column = self.columns[target]
+        step = operator.add if sign > 0 else operator.sub
+        column[:n] = array.array(column.typecode, map(step, column[:n], self.columns[amount][:n]))
+
+    def copy(self, target, source):
+        '''Copy one column into another over every live row
+
+        Args
+            target (str): name of column that is overwritten
+            source (str): name of column that is copied
+        '''
+        if np is not None and self.count >= self.numpy_rows:
+            self.view(target)[:] = self.view(source)
+            return
+        n = self.count
+        self.columns[target][:n] = self.columns[source][:n]
+
+    def view(self, name):
+        '''numpy array sharing memory with the live rows of a column. Only valid until a row is added
+
+        Args
+            name (str): column name
+
+        Returns
+            numpy array: live rows of column
+        '''
+        column = self.columns[name]
+        return np.frombuffer(column, dtype=column.typecode)[:self.count]
+
+    def nbytes(self):
+        '''Memory used by the columns
+
+        Returns
+            int: bytes allocated for all rows of all columns
+        '''
+        return sum(column.itemsize * len(column) for column in self.columns.values())
+
+
+class Mothership:
+    '''Mothership object is displayed at the bottom of screen and the objective is to protect it.
+
+    Class Attributes:
+        image (pygame image): image 50 pixels high stretched across the playfield
+
+    Args:
+        field_width (int): width of playfield
+        field_height (int): height of playfield
+
+    Attributes:
+        x (int): x coordinate image location
+        y (int): y coordinate image location. Asteroids reaching it damage the mothership
+        health_amt (int): initial health amount
+        damage_taken (int): initial damage amount
+        total (int): combination of health and damage amounts
+        hbar_x (int): x coordinate of health bar
+        hbar_y (int): y coordinate of health bar
+        hbar_length (int): length of health bar (constant for calcuation purposes)
+        health_width int(int): ratio of remaining health over total, multiplied by health bar length
+    '''
+    image = None                        # loaded by assets.load_sprites()
+
+    def __init__(self, field_width=500, field_height=700):
+        self.x = 0
+        self.y = field_height - 50
+        self.health_amt = 1000
+        self.damage_taken = 0
+        self.total = self.health_amt + self.damage_taken
+        self.hbar_x = 50
+        self.hbar_y = field_height - 10
+        self.hbar_length = field_width - 50 - self.hbar_x
+        self.health_width = round(self.hbar_length*(self.health_amt/self.total))
+        #self.damage_width = round(self.hbar_length*(self.damage_taken/self.total))
+        
+    def update_damage(self):
+        '''Update instance's health amount and width of health bars'''
+        if self.health_amt > 1000: # if health is above initial amt of 1000 due to powerup reduce in size to original
+            self.health_amt = 1000    
+        self.health_width = round(self.hbar_length*(self.health_amt/self.total))
+
+    def draw(self, window): 
+        '''Draw sprite and health bars to screen
+        
+        Args:
+            window (Boundary obj): window attribute of Boundary object
+
+        Returns
+            pygame Rect: area of the screen drawn to
+        '''
+        rect = window.blit(Mothership.image, view.point(int(self.x), int(self.y)))
+        return rect.union(self.draw_health_bar(window))
+
+    def draw_health_bar(self, window):
+        '''Draw health bars to screen
+
+        Args:
+            window (Boundary obj): window attribute of Boundary object
+
+        Returns
+            pygame Rect: area of the screen drawn to
+        '''
+        # Damage bar is constant length. Covered over by health bar.
+        rect = pygame.draw.rect(window, (255,0,0), view.rect(self.hbar_x, self.hbar_y, self.hbar_length, 7)) 
+        
+        # Draw over damage bar. Damage bar is revealed as health is depleted.
+        if self.health_amt > 0: 
+            pygame.draw.rect(window, (0,255,0), view.rect(self.hbar_x, self.hbar_y, self.health_width, 7)) 
+        return rect
+
+
+class Character:
+    '''Character class is main sprite (spaceship) for this game.
+
+    Class Attributes
+        center_images (pygame image): images displaying ship in upright postion
+        strafing_right_images (pygame image): intermediate images for right turns
+        strage_right_on (pygame image): final images for right turns
+        strafing_left_images (pygame image): intermediate images for left turns
+        strafe_left_on (pygame image): final images for left turns
+
+    Args
+        field_width (int): width of playfield, the character starts in the middle of it
+        field_height (int): height of playfield, the character flies just above the mothership
+
+    Attributes
+        width (int): width of character image in pixels
+        height (int): height of character image in pixels
+        x (int): initial x coordinate position of character
+        y (int): initial y coordinate position of character
+        prev_x (int): x coordinate before the most recent simulation tick, used to interpolate drawing
+        velocity (int): rate at which character moves from left to right
+        left (bool): indicate initial movement setting (for image displaying purposes)
+        right (bool): indicate initial movement setting
+        center (bool): indicate initial movement setting
+    '''
+    # all images are loaded by assets.load_sprites() once the display exists
+    # images used when no keys are pressed
+    center_images = []
+    # images used inbetween full strafe right
+    strafing_right_images = []
+    # images used at full right strafe
+    strafe_right_on = []
+    # images used inbetween full strafe left
+    strafing_left_images = []
+    # images used at full left strafe
+    strafe_left_on = []
+
+    def __init__(self, field_width=500, field_height=700):
+        self.width = 96
+        self.height = 96
+        self.x = field_width//2 - 50
+        self.y = field_height - 160
+        self.prev_x = self.x
+        self.velocity = 5
+        self.left = False                                           # Initial movement position states of sprite
+        self.right = False                                          
+        self.center = True
+    
+    def draw(self, left_right_frame, center_frame, most_recent_key, window, alpha=1):
+        '''Draw the mainsprite to the screen
+
+        Args
+            left_right_frame (int): incrementing number that controls which frame is selected for displaying when moving right/left
+            center_frame (int): incrementing number that controls which frame is selected when not turning
+            most_recent_key (str): most recently pressed movement key. 
+            window (Boundary obj): screen on which image is displayed
+            alpha (float): fraction of the way from the previous tick's position to the current one
+
+        Returns
+            pygame Rect: area of the screen drawn to, None if nothing was drawn
+        '''
+        position = view.point(round(self.prev_x + (self.x - self.prev_x)*alpha), self.y)    # interpolated between ticks
+        if self.center == True:
+            if left_right_frame < 4:
+                if most_recent_key == 'r':
+                    return window.blit(self.strafing_right_images[left_right_frame], 
+                               position)        # level out spaceship upon returning to center
+                elif most_recent_key == 'l':
+                    return window.blit(self.strafing_left_images[left_right_frame], 
+                               position)        # level out spacehip upon returning to center
+            else:    
+                return window.blit(self.center_images[center_frame], 
+                           position)            # iterate through displaying center images
+
+        elif self.right == True:
+            if left_right_frame < 4:                    # first 4 frames are transition state
+                return window.blit(self.strafing_right_images[left_right_frame], 
+                           position)            # draw strafe right transition
+            else:
+                return window.blit(self.strafe_right_on[left_right_frame % 4], 
+                           position)            # draw final strafe right
+            
+        elif self.left == True:
+            if left_right_frame < 4:                    # first 4 frames are transition state
+                return window.blit(self.strafing_left_images[left_right_frame], 
+                           position)            # draw strafe left transition
+            else:
+                return window.blit(self.strafe_left_on[left_right_frame % 4], 
+                           position)            # draw final strafe left
+        
+    def move_left(self, boundary):
+        '''Move character in the left direction by velocity amount
+        Args
+            boundary (Boundary obj): Boundary width is used to know movement limit
+        '''
+        if self.x > 0:                                  # keeping x coordinate within the bounds of the screen
+            self.x = self.x - self.velocity             # move by velocity amt
+
+    def move_right(self, boundary):
+        '''Move character in the right direction by velocity amount
+        
+        Args
+            boundary (Boundary obj): Boundary width is used to know movement limit 
+        '''
+        if self.x < boundary.width - self.width:
+            self.x = self.x + self.velocity
+
+    def shoot(self, shot_type):
+        '''Generate ShooterObject object at the center position of the main sprite
+
+        Args
+            shot_type (str): specifies the type of shot generated. Could be used to change shot types in future use.
+        '''
+        # generate shot object at current sprite location, in the middle of the sprite
+        ShooterObject.pool.acquire(shot_type, (self.x + (self.width/2)), self.y)
+
+
+class Asteroid:
+    '''Asteroid class generates asteroids images above the display height and progresses them downward
+
+    Class Attributes
+        astoird_images (dict): dictionary of asteroid pygame images with keys specifying the size of the asteroid
+        width_options (list): list containing the various width options
+        ast_diff_setting (dict): dictionary for difficulty setting.
+            Keys are levels of difficult and values are average number of game loops per asteroid generation 
+        current_setting (int): current difficulty setting. Simulation.difficulty_changed() must be called after
+            changing it or ast_diff_setting during a game
+        maximum_asteroid_amount (int): limit on the current number of existing asteroid
+        pool (ObjectPool obj): pool from which asteroids are acquired. Live asteroids are in asteroid_lst
+        store (EntityStore obj): columns holding the numeric attributes of live asteroids
+        draw_health_bars (bool): draw the health bar on every asteroid. Turned off by the QualityGovernor
+
+    Args
+        rng (Random obj): random number generator used to choose size, color, position and speed
+        field_width (int): width of playfield, asteroids spawn anywhere across it
+
+    Attributes
+        width (int): width of asteroid choosen
+        color_option (int): color of asteroid choosen
+        y (int): y coordinate of asteroid spawn
+        x (int): x coordinate of asteroid spawn
+        prev_y (int): y coordinate before the most recent simulation tick, used to interpolate drawing
+        velocity (int): speed at which asteroid progresses down screen
+        damage_taken (int): amount of damage sustained
+        health_amt (int): amount of health
+        damage (int): amount of damage dealt 
+        hbar_length (int): length of health bar
+        hbar (int): length of the green part of the health bar
+        initial_health_width (int): length of health bar as a constant, same as hbar_length
+        destruction method (None): method by which the asteroid has been destroyed
+
+    Asteroids are acquired from Asteroid.pool. Every attribute except color_option and destruction_method
+    lives in a column of Asteroid.store, so an asteroid is only a view of its row.
+    '''
+    __slots__ = ('pool_index', 'color_option', 'destruction_method')
+    asteroid_images = {}                # lists of images keyed by width, loaded by assets.load_sprites()
+    
+    width_options = [x for x in range(50,110,10)]
+    asteroid_lst = []
+    ast_diff_setting = {1:1000, 2:800, 3: 600, 4: 400, 5:200, 6:100, 7:50}
+    current_setting = 6
+    maximum_asteroid_amount = 9
+    draw_health_bars = True
+
+    def reset(self, rng=random, field_width=500):
+        '''Set up a new asteroid. Called on construction and whenever the asteroid is acquired from the pool'''
+        self.width = rng.choice(Asteroid.width_options)     # randomly choosing width option from width_options
+        self.color_option = rng.randint(0,4)                # randomly choosing an index number to pick from various images
+        self.y = self.width*-1                              # spawns asteroids above game window
+        self.x = rng.randrange(50, field_width - self.width)    # asteroid spawn anywhere in x direction within game boundaries
+        self.prev_y = self.y
+        if self.width < 80:                                 # velocity is loosley tied to width
+            self.velocity = rng.randint(2,3)
+        else:
+            self.velocity = rng.randint(1,2)                       
+        self.damage_taken = 0                               # the total health remains unchanged and is used to generate health bar ratio
+        self.health_amt = self.width*2                      # health amount is directly related to the size of the asteroid
+        self.damage = self.width * 2                        # damage dealt by asteroid is tied to size 
+        self.hbar_length = round(self.width * 0.75)         # constant length (should add up from the summations of health and damage bar widths)
+        self.hbar = self.hbar_length                        # full health, initial_health_width is the same column
+        self.destruction_method = None                      # either destroyed by negative health or making contact with mothership
+
+    def draw_asteroid(self, surface, alpha=1):
+        '''Draw asteroid on screen
+        
+        Args
+            surface (boundary obj): surface upon which the asteroid is drawn
+            alpha (float): fraction of the way from the previous tick's position to the current one
+
+        Returns
+            pygame Rect: area of the screen drawn to
+        '''
+        y = round(self.prev_y + (self.y - self.prev_y)*alpha)        # interpolated between ticks
+        rect = surface.blit(Asteroid.asteroid_images[self.width][self.color_option], view.point(self.x, y))
+        if Asteroid.draw_health_bars == False:
+            return rect
+
+        # creating damage bar (red)
+        if self.damage_taken > 0:
+            pygame.draw.rect(surface, (255,0,0), view.rect(self.x + round(self.width*0.1), round(y + self.width/2), 
+                                                                self.initial_health_width, 7)) 
+        # avialable health (green) is dependent on the ratio of health remaining to damage taken
+        return rect.union(pygame.draw.rect(surface, (0,255,0), view.rect(self.x + round(self.width*0.1), round(y + self.width/2), self.hbar, 7)))
+        
+    def update_health_bars(self):
+        '''Update health bars'''
+        self.hbar = round(self.hbar_length * 
+                        (self.health_amt/(self.health_amt + self.damage_taken))) # length multiplied by fraction of health remaining
+
+    def progress_down(self):
+        '''Move asteroids down screen'''
+        self.y += self.velocity
+
+    def generate_explosion(self):
+        '''Generate Explosion object at last coordinates
+        
+        Returns
+            Explosion obj: the explosion that was generated
+        '''
+        return Explosion.pool.acquire(self.x, self.y, self.width, self.destruction_method) #explosion occurs at asteroids last location
+
+    def __del__(self):
+        '''Delete Asteroid object'''
+        pass
+
+Asteroid.store = EntityStore([('x', 'i'), ('y', 'i'), ('prev_y', 'i'), ('velocity', 'i'), ('width', 'i'),
+                               ('health_amt', 'i'), ('damage_taken', 'i'), ('damage', 'i'), ('hbar_length', 'i'),
+                               ('hbar', 'i')])
+for name in Asteroid.store.columns:
+    setattr(Asteroid, name, Asteroid.store.field(name))
+Asteroid.initial_health_width = Asteroid.hbar_length
+Asteroid.pool = ObjectPool(Asteroid, Asteroid.asteroid_lst, 16, Asteroid.store)
+
+
+class TimedPowerUp:
+    '''TimedPowerUp creates powerups, progresses them down screen, and grants main sprite effects that have a temporal component
+
+    Class Attributes
+        power_ups (dict): dictionary containing pygame images for the two different powerup images
+        power_up_optiosn (list): list contianing powerup options
+        current_powerups (list): list containing all TimedPowerUp objects that currently exist
+        activated (bool): determination if powerup has been activated
+        current_option (none): power up that was most recently generated
+
+    Args
+        p_type (str): the name of TimedPowerUp that is being generated
+        rng (Random obj): random number generator used to choose spawn location
+        field_width (int): width of playfield, the powerup spawns anywhere across it
+
+    Attributes
+        width (int): width of powerup 
+        height (int): height of powerup 
+        x (int): x coordinate spawn location
+        y (int): y coordinate spawn location
+        prev_y (int): y coordinate before the most recent simulation tick, used to interpolate drawing
+        velocity (int): movement speed
+        font_color (tuple): RGB value of font color
+        p_type (str): storage of input argument p_type
+        powerup_font (SysFont obj): pygame SysFont() contains font type, font size, and bold. Created on first draw
+        powerup_text (pygame text obj): text generated. Rendered on first draw
+        display_end (int): last tick the effect name is displayed on screen, -1 until activated
+        effect_timer (int): timer used to mark long long the effect has been active
+        powerup_duration (int): duration of power up effect
+        text_visible (bool): whether the effect name is shown on the current frame
+        bar_height (int): height of the remaining duration bar on the right of the screen
+    '''
+
+    power_ups = {}                      # loaded by assets.load_sprites()
+    power_up_options = ['Insta-Kill', 'Double XP']
+    current_powerups = []
+    activated = False
+    current_option = None
+
+    def __init__(self, p_type, rng=random, field_width=500):
+        self.width = 25
+        self.height = 20
+        self.x = rng.randint(25, field_width - (2*self.width))      # x coordinate choosen at random, spaced slightly from screen sides
+        self.y = -1 * self.height                                   # spawn right above upper boundry
+        self.prev_y = self.y
+        self.velocity = 3
+        self.font_color = (255,255,255)                             # color white
+        self.p_type = p_type
+        self.powerup_font = None                                    # font and text are created on first draw so the
+        self.powerup_text = None                                    # simulation never needs the font module
+        TimedPowerUp.current_option = p_type                        # setting class attribute to most current generated powerup
+        self.display_end = -1
+        self.effect_timer = 0
+        self.powerup_duration = 550                                 # duration is a set at 550 game loops
+        self.text_visible = False
+        self.bar_height = 0
+        TimedPowerUp.current_powerups.append(self)                  # appending instance to list of current TimedPowerUp objects
+
+    def draw(self, window, alpha=1):
+        '''Draw powerup image on screen
+
+        Args
+            window (Boundary obj): surface to which the image is drawn
+            alpha (float): fraction of the way from the previous tick's position to the current one
+
+        Returns
+            pygame Rect: area of the screen drawn to
+        '''
+        if TimedPowerUp.activated == False: # Only display the powerup image if it hasn't been activated yet
+            return window.blit(TimedPowerUp.power_ups[TimedPowerUp.current_option], view.point(self.x, round(self.prev_y + (self.y - self.prev_y)*alpha)))
+
+        elif TimedPowerUp.activated == True: # If activated, no longer display image. Display text instead
+            if self.powerup_text is None:
+                self.powerup_font = assets.font('comicsans', view.length(80), 1)     # Comicsans, 80 font height, and bold
+                self.powerup_text = text_cache.render(self.powerup_font, self.p_type, self.font_color)
+            x, y = view.point(view.width//2, view.height//2 - 100)                  # centered horizontally
+            return window.blit(self.powerup_text, (x - self.powerup_text.get_width()//2, y))
+
+    def progress(self):
+        '''Progress powerup down screen'''
+        self.y += self.velocity
+
+    def __del__(self):
+        '''Delete TimedPowerUp object'''
+        pass
+
+
+class Health_PowerUp:
+    '''Generates health powerups which have the one time effect of return some health to the Mothership
+
+    Class Attributes
+        health_image (pygame image): image for health powerup
+        current_powerups (list): list containing all currently existing instances of Health_PowerUp
+
+    Args
+        rng (Random obj): random number generator used to choose spawn location
+        field_width (int): width of playfield, the powerup spawns anywhere across it
+
+    Attributes
+        width (int): width of power up
+        height (int): height of power up
+        x (int): x coordinate of spawn location
+        y (int): y coordinate of spawn location
+        prev_y (int): y coordinate before the most recent simulation tick, used to interpolate drawing
+        health_add (int): amount of health granted upon activation
+        velocity (int): movement speed
+        activated (bool): whether or not the powerup has been activated
+        font_color (tuple): RGB value for font color
+        powerup_font (SysFont obj): font information; font type, size, bold. Created on first draw
+        powerup_text (pygame text): text to be displayed. Rendered on first draw
+        display_end (int): last tick the text is displayed on screen, -1 until activated
+        text_visible (bool): whether the health text is shown on the current frame
+    '''
+    health_image = None                 # loaded by assets.load_sprites()
+    current_powerups = []
+
+    def __init__(self, rng=random, field_width=500):
+        self.width = 25
+        self.height = 20
+        self.x = rng.randint(25, field_width - (2*self.width))  # x coordinate choosen at random with slight spacing from walls
+        self.y = -1 * self.height                           # spawn right above upper boundry
+        self.prev_y = self.y
+        self.health_add = 250                               # amount of health returned to mothership
+        self.velocity = 3
+        self.activated = False                              # whether or not the powerup has been captured by main sprite
+        self.font_color = (255,255,255)
+        self.powerup_font = None                            # font and text are created on first draw
+        self.powerup_text = None
+        self.display_end = -1
+        self.text_visible = False
+        Health_PowerUp.current_powerups.append(self)
+
+    def draw(self, window, alpha=1):
+        '''Display health powerup image and text on screen
+
+        Args
+            windwo (Boundary obj): surface to which the image is drawn
+            alpha (float): fraction of the way from the previous tick's position to the current one
+
+        Returns
+            pygame Rect: area of the screen drawn to
+        '''
+        if self.activated == False: # if not activated yet, only display image and not text
+            return window.blit(Health_PowerUp.health_image, view.point(self.x, round(self.prev_y + (self.y - self.prev_y)*alpha)))
+
+        if self.activated == True: # if activated, no longer display image and display text in the middle of the screen
+            if self.powerup_text is None:
+                self.powerup_font = assets.font('comicsans', view.length(80), 1)
+                self.powerup_text = text_cache.render(self.powerup_font, 'Health' + ' +' + str(self.health_add), self.font_color)
+            x, y = view.point(view.width//2, view.height//2 - 100)
+            return window.blit(self.powerup_text, (x - self.powerup_text.get_width()//2, y))
+
+    def progress(self):
+        '''Progress health powerup down screen'''
+        self.y += self.velocity
+
+    def __del__(self):
+        '''Delete Health_PowerUp object'''
+        pass
+
+
+class Explosion:
+    '''Generates explosion upon destruction of an asteroid
+
+    Class Attributes
+        explosion_lst (list): list containing all currently existing instances of the Explosion class
+        explostion_images (list): list containin pygame images of various explosion stages
+        pool (ObjectPool obj): pool from which explosions are acquired. Live explosions are in explosion_lst
+        frame_step (int): images advanced per animation frame. 2 shows every other image, so the animation ends
+            halfway through the explosion's life. Set by the QualityGovernor
+        show_popups (bool): draw the +N score popup of explosions. Turned off by the QualityGovernor
+
+    Args
+        x (int): x coordinate of where explosion should occur
+        y (int): y coordinate of where explosion should occure
+        score_incr (int): amount by which score should incrase upon user destruction
+        method (str): string detailing how the asteroid was destroyed
+
+    Attributes
+        x (int): storage of input x argument
+        y (int): storage of input y argument
+        current_frame (int): number detailing which image is to be displayed
+        font (pygame font): font information (font type, size, bold). Created on first draw
+        font_color (tuple): RGB color value for font
+        ast_width (int): width of asteroid that generated explosion
+        score_incrase (int): amount by which the user's score will increase
+        text (str): score increase text to be displayed to screen. Set on first draw
+        text_loc (tuple): location of text on screen (x, y)
+        method (str): storage of input argument method
+        count (int): timer used to control displaying of score increase text to screen
+        explosion_sound (pygame Sound): sound generated upon explosion. Loaded by play_sound()
+    '''
+
+    explosion_lst = []
+    explosion_images = []               # loaded by assets.load_sprites()
+    frame_step = 1
+    show_popups = True
+
+    def __init__(self, x, y, score_incr, method):
+        self.reset(x, y, score_incr, method)
+
+    def reset(self, x, y, score_incr, method):
+        '''Set up a new explosion. Called on construction and whenever the explosion is acquired from the pool'''
+        self.x = x
+        self.y = y
+        self.current_frame = 0
+        self.font = None                # font, text and sound are left to the renderer so that the
+        self.font_color = (255,255,255)
+        self.ast_width = score_incr
+        # if a TimedPowerup is active and it is 'Double XP' then the score_increase value is double
+        if (TimedPowerUp.activated == True) and (TimedPowerUp.current_option == 'Double XP'): 
+            self.score_increase = score_incr*2
+        else:
+            self.score_increase = score_incr
+        self.text = None                # simulation can create explosions without a display or mixer
+        self.text_loc = None
+        self.method = method
+        self.count = 1 # timer used to display score increase 
+        self.explosion_sound = None
+
+    def render_text(self):
+        '''Set score increase text and position it in the middle of the asteroid'''
+        self.font = assets.font('comicsans', view.length(30), True)
+        self.text = '+'+str(self.score_increase)
+        text_width, text_height = text_cache.number_size(self.font, self.text, self.font_color)
+        # text location is in middle of asteroid and adjusted for text height and width
+        center_x, center_y = view.point(self.x + (self.ast_width//2), self.y + (self.ast_width//2))
+        self.text_loc = (center_x - (text_width//2), center_y + (text_height//2))
+
+    def play_sound(self):
+        '''Play explosion sound through the voice pool, which may drop it if many explosions go off together'''
+        self.explosion_sound = assets.sound('audio/Explosion+1.wav')
+        voices.play(self.explosion_sound)
+
+    def draw(self,window):
+        '''Draw explosion image and text to screen
+        
+        Args
+            window (Boundary obj): surface to which image is displayed
+
+        Returns
+            pygame Rect: area of the screen drawn to, None if nothing was drawn
+        '''
+        self.count += 1 # increment count to know how many times draw() has been called
+        rect = None
+        image = self.current_frame * Explosion.frame_step
+        if image < len(Explosion.explosion_images):
+            rect = window.blit(Explosion.explosion_images[image], view.point(self.x, self.y))
+
+        if self.method == 'negative health' and Explosion.show_popups:    # indicates that asteroid was destroyed via user
+            if self.count % 3 == 0:             # only display text every three calls to draw(). Gives fading effect          
+                if self.text is None:
+                    self.render_text()
+                text_rect = text_cache.blit_number(window, self.font, self.text, self.font_color, self.text_loc)
+                rect = text_rect if rect is None else rect.union(text_rect)
+        return rect
+
+    def __del__(self):
+        '''Delete Explosion object'''
+        pass
+
+Explosion.pool = ObjectPool(Explosion, Explosion.explosion_lst, 16)
+    
+
+class ShooterObject:
+    '''Shots generated py main sprite, progress up screen, and destroy asteroid
+
+    Class Attributes
+        Shots_queue (list): list containing all currently existing instances of the ShooterObject class
+        shot_rate (int): rate in frames per shot
+        pool (ObjectPool obj): pool from which shots are acquired. Live shots are in shots_queue
+        store (EntityStore obj): columns holding the positions, speed and damage of live shots
+
+    Args
+        shot_type (str): designates the type of shot and subsequent attributes that go along with that shot type
+        ship_x_position (int): x coordinate of position of ship upon generation of shot
+        ship_y_position (int): y coordinate of position of ship upon generation og shot
+
+    Attributes
+        shot_type (str): storage of input arguement shot_type
+        width (int): width of shot in pixels
+        height (int): height of object in pixels
+        color (tuple): RGB value of shot color
+        velo (int): movement speed of shot
+        damage(int): damage amount delivered to asteroids
+        hit (bool): determine whether a shot has made contact with an asteroid
+        start_y (int): starting point of line that is a shot
+        prev_start_y (int): start_y before the most recent simulation tick, used to interpolate drawing
+        end_y (int): ending point of a line that is a shot
+        start_x (int): starting x coordinate of a shot
+
+    Shots are acquired from ShooterObject.pool. Positions, speed and damage live in columns of
+    ShooterObject.store, so a shot is only a view of its row.
+    '''
+    __slots__ = ('pool_index', 'shot_type', 'width', 'height', 'color', 'hit')
+    shots_queue = []            # shots generated stored here.
+    shot_rate = 15              # called with modulo operator in while loop to generate shots every so many loops. lower to increase                                              
+
+    def reset(self, shot_type, ship_x_position, ship_y_position):
+        '''Set up a new shot. Called on construction and whenever the shot is acquired from the pool'''
+        self.shot_type = shot_type
+        if self.shot_type == 'normal':
+            self.width = 3
+            self.height = 10
+            self.color = (255,255,255)
+            self.velo = 3
+            self.damage = 20
+        self.hit = False                                    # tells whether bullet has collided with an object
+        self.start_y = ship_y_position + 25                 # y position of ship + 25 to move closer to ship
+        self.end_y = self.start_y - self.height             # difference equal to shot height
+        self.start_x = ship_x_position                      # tying x coord position to that of the ship
+        self.prev_start_y = self.start_y
+       
+    def draw_line(self, surface, alpha=1):
+        '''Draw line on screen
+        
+        Args
+            surface (Boundary obj): surface to which the image is drawn
+            alpha (float): fraction of the way from the previous tick's position to the current one
+
+        Returns
+            pygame Rect: area of the screen drawn to
+        '''                   
+        start_y = int(self.prev_start_y + (self.start_y - self.prev_start_y)*alpha)   # interpolated between ticks
+        return pygame.draw.line(surface, self.color, view.point(int(self.start_x), start_y), 
+                        view.point(int(self.start_x), start_y - self.height), view.length(self.width))
+
+    def progress(self):
+        '''Progress shot up screen'''
+        # move both the start and end y position by the velocity amount
+        self.start_y -= self.velo
+        self.end_y -= self.velo
+
+    def __del__(self):
+        '''Delete ShooterObject instance'''
+        pass
+
+ShooterObject.store = EntityStore([('start_x', 'd'), ('start_y', 'i'), ('end_y', 'i'), ('prev_start_y', 'i'),
+                                   ('velo', 'i'), ('damage', 'i')], 32)
+for name in ShooterObject.store.columns:
+    setattr(ShooterObject, name, ShooterObject.store.field(name))
+ShooterObject.pool = ObjectPool(ShooterObject, ShooterObject.shots_queue, 32, ShooterObject.store)
+
+
+class Score:
+    '''Keep score and display score in upper right hand corner of screen
+
+    Args
+        field_width (int): width of playfield, the score is kept in its right hand corner
+
+    Attributes
+        score (int): initial score
+        x (int): x coordinate for displaying score text
+        y (int): y coordinate for displaying score text
+        score_lenth (int): current length of the score in terms of digits
+        color (tuple): RGB value of score text
+        font (pygame font): font information; font type, size, bold. Created on first draw
+    '''
+    def __init__(self, field_width=500):
+        self.score = 0
+        self.x = field_width - 30
+        self.y = 10
+        self.score_length = 1
+        self.color = (255,255,255)
+        self.font = None
+        
+    def shift_score(self):
+        '''Shift score over by 10'''
+        self.x -= 10
+    
+    def draw_score(self, window):
+        '''Draw score in upper right hand corner of screen
+
+        Args
+            window (Boundary obj): surface to which the score is displayed
+
+        Returns
+            pygame Rect: area of the screen drawn to
+        '''
+        # if the length of the current score isn't equal to the previously set score length, an addtional column has been added
+        if len(str(self.score)) != self.score_length: 
+            self.score_length = len(str(self.score))    # reseting score length to new length
+            self.shift_score()                          # shifting text over 
+
+        if self.font is None:
+            self.font = assets.font('comicsans', view.length(30), True)
+        # digits are drawn from cached glyphs rather than rendering the whole score every frame
+        return text_cache.blit_number(window, self.font, str(self.score), self.color, view.point(self.x, self.y))
+
+
+class HighScoreStore:
+    '''Keeps every score ever played in an append-only log, with the best scores held in memory.
+
+    New scores are added to the in memory top scores straight away and handed to a writer thread, which
+    appends them to the log and fsyncs it, so the game never waits on the disk. A crash can only ever lose the
+    line being written: a partly written line is skipped when the log is read. Every compact_every scores the
+    writer rewrites the log without any damaged lines into a temporary file and swaps it into place with
+    os.replace, so the log on disk is always either the old or the new version.
+
+    Scores from the highscores.txt file of older versions are copied into the log along with the first score
+    added, so opening a store never writes anything by itself.
+
+    Args
+        path (str): log file, one score per line
+        capacity (int): number of best scores kept in memory
+        compact_every (int): number of scores appended between compactions
+        legacy_path (str): high score file of older versions to import
+
+    Attributes
+        path (str): storage of input argument path
+        capacity (int): storage of input argument capacity
+        compact_every (int): storage of input argument compact_every
+        best (list): min-heap of the capacity best scores
+        count (int): number of scores in the store
+        damaged_lines (int): number of lines in the log that couldn't be read
+        appended (int): number of scores appended since the last compaction
+        unsaved (list): scores imported from the legacy file or whose append failed, written with the next score
+        queue (Queue obj): scores waiting to be written, None is the signal to stop
+        writer (Thread obj): thread writing the log
+    '''
+    def __init__(self, path='highscores.log', capacity=5, compact_every=100, legacy_path='highscores.txt'):
+        self.path = path
+        self.capacity = capacity
+        self.compact_every = compact_every
+        self.best = []
+        self.count = 0
+        self.damaged_lines = 0
+        self.appended = 0
+        self.unsaved = []
+        if not os.path.exists(path) and legacy_path is not None and os.path.exists(legacy_path):
+            with open(legacy_path, 'r') as infile:
+                self.unsaved = [int(line) for line in infile if line.strip().isdigit()]
+        for score in self.read_log() + self.unsaved:
+            self.push(score)
+        self.queue = queue.Queue()
+        self.writer = threading.Thread(target=self.write_loop, name='highscore writer', daemon=True)
+        self.writer.start()
+
+    def read_log(self):
+        '''Read every intact score from the log
+
+        Returns
+            list: scores in the order they were written
+        '''
+        scores = []
+        self.damaged_lines = 0
+        if os.path.exists(self.path):
+            with open(self.path, 'r') as infile:
+                for line in infile:
+                    if line.endswith('\n') and line[:-1].isdigit():
+                        scores.append(int(line))
+                    else:
+                        self.damaged_lines += 1                     # torn write from a crash or a corrupted line
+        return scores
+
+    def push(self, score):
+        '''Count a score and keep it if it's one of the best'''
+        self.count += 1
+        if len(self.best) < self.capacity:
+            heapq.heappush(self.best, score)
+        elif score > self.best[0]:
+            heapq.heapreplace(self.best, score)                     # drop the lowest of the best
+
+    def add(self, score):
+        '''Record a score without waiting for it to be written to disk
+
+        Args
+            score (int): final score of a game
+        '''
+        self.push(score)
+        self.queue.put(score)
+
+    def top(self, amount=None):
+        '''Best scores, highest first
+
+        Args
+            amount (int): number of scores, at most capacity. All kept scores if None
+
+        Returns
+            list: scores
+        '''
+        return sorted(self.best, reverse=True)[:amount]
+
+    def write_loop(self):
+        '''Append queued scores to the log until None is queued. Runs on the writer thread'''
+        while True:
+            score = self.queue.get()
+            if score is not None:
+                self.append([score])
+                if self.appended >= self.compact_every:
+                    self.compact()
+            self.queue.task_done()
+            if score is None:
+                break
+
+    def append(self, scores):
+        '''Append scores, along with any that previously failed, to the log and flush them to disk
+
+        Args
+            scores (list): scores to write
+        '''
+        pending = self.unsaved + scores
+        if self.damaged_lines:
+            self.compact()                                          # a torn last line would run into the next score
+        try:
+            with open(self.path, 'a') as outfile:
+                outfile.write(''.join(f'{score}\n' for score in pending))
+                outfile.flush()
+                os.fsync(outfile.fileno())
+            self.unsaved = []
+            self.appended += len(pending)
+        except OSError:
+            self.unsaved = pending                                  # keep them for the next attempt
+            self.damaged_lines += 1                                 # part of a line may have been written
+
+    def compact(self):
+        '''Rewrite the log without damaged lines and atomically replace the old one'''
+        scores = self.read_log()
+        temp_path = self.path + '.tmp'
+        try:
+            with open(temp_path, 'w') as outfile:
+                outfile.write(''.join(f'{score}\n' for score in scores))
+                outfile.flush()
+                os.fsync(outfile.fileno())
+            os.replace(temp_path, self.path)                        # atomic, readers see the old or the new log
+            self.appended = 0
+            self.damaged_lines = 0
+        except OSError:
+            pass                                                    # the old log is still intact, try again later
+
+    def flush(self):
+        '''Wait until every score added so far has been written'''
+        self.queue.join()
+
+    def close(self):
+        '''Write any queued scores and stop the writer thread'''
+        if self.writer.is_alive():
+            self.queue.put(None)
+            self.writer.join()
+
+
+class Credits:
+    '''Credits are composed of end game messages and high scores, displayed at the end of the game
+
+    Args
+        score (int): Accumulated score from the game just played
+        highscores (HighScoreStore obj): store the score is recorded in
+
+    Attributes
+        score (int): storage for input arguemnt score
+        highscores (HighScoreStore obj): storage for input argument highscores
+        color (tuple): RGB color value for displayed text
+        messages (list): list of various end game messages to be displayed
+        fonts (list): list of pygame fonts of various sizes
+        texts (list): list of rendered texts, generated from fonts and messages
+        text_widths (list): list of widths of text
+        text_heights (list): list of heights of text
+        x (int): x coordinate for text
+        y (int): y coordinate for text
+        file_contents (list): best scores to display, highest first
+    '''
+    def __init__(self, score, highscores):
+        self.score = score
+        self.highscores = highscores
+        self.color = (255,255,255)
+        self.messages = ['GAME OVER', f'Your Score: {self.score}', 'Press any key to play again', 'High Scores:']
+        self.fonts = [assets.font('comicsans', view.length(100), True), assets.font('comicsans', view.length(50), True),
+                    assets.font('comicsans', view.length(30), True)]
+        self.texts = [text_cache.render(self.fonts[0], self.messages[0], self.color), text_cache.render(self.fonts[1], self.messages[1], self.color),
+                    text_cache.render(self.fonts[2], self.messages[2], self.color), text_cache.render(self.fonts[1], self.messages[3], self.color)]
+        self.text_widths = [self.texts[0].get_width(), self.texts[1].get_width(), self.texts[2].get_width(), self.texts[3].get_width()]
+        self.text_heights = [self.texts[0].get_height(), self.texts[1].get_height(), self.texts[2].get_height(), self.texts[3].get_height()]
+        self.x = view.width//2                                          # text is centered on the playfield
+        self.y = 200
+        self.file_contents = self.highscores.top(5)
+
+    def write_highscores(self):
+        '''Record current score in the high score store. The store writes it to disk in the background
+        '''
+        self.highscores.add(self.score)
+        self.file_contents = self.highscores.top(5)                     # current score shows up if it made the top 5
+        
+    def display_credits(self, window):
+        '''Display all end game text and contents of highscores file
+
+        Args
+            window (Boundary obj): surface to which all text is displayed
+        '''
+        x, y = view.point(self.x, self.y - 50)                  # texts are sized in window pixels, positions are on the playfield
+        window.blit(self.texts[0], (x - self.text_widths[0]//2, y - self.text_heights[0]//2))
+        x, y = view.point(self.x, self.y - 30)
+        window.blit(self.texts[1], (x - self.text_widths[1]//2, y - self.text_heights[1]//2 + self.text_heights[0]))
+        x, y = view.point(self.x, view.height - 50)
+        window.blit(self.texts[2], (x - self.text_widths[2]//2, y))
+        x, y = view.point(self.x, 300)
+        window.blit(self.texts[3], (x - self.text_widths[3]//2, y))
+
+        self.init_score_pos = 350
+        for score in self.file_contents:
+            self.f = assets.font('comicsans', view.length(30), True)
+            self.t = text_cache.render(self.f, str(score), self.color)
+
+            x, y = view.point(self.x, self.init_score_pos)
+            window.blit(self.t, (x - self.t.get_width()//2, y))
+            self.init_score_pos += 40                           # iteratively move score position down screen
+
+
+class SpatialGrid:
+    '''Uniform grid over the playfield used as a broadphase for collision and proximity queries.
+
+    Objects are registered with their bounding boxes and stored in every cell the box overlaps. Queries only
+    look at the cells around the area of interest, so the cost of a query grows with the number of nearby
+    objects rather than with the number of objects on screen. Cells are kept in a dictionary, which allows
+    objects above the playfield (asteroids spawn at negative y) to be registered as well.
+
+    Args
+        cell_size (int): width and height of a grid cell in pixels
+
+    Attributes
+        cell_size (int): storage of input argument cell_size
+        cells (dict): lists of objects keyed by (column, row) of grid cell
+        bounds (dict): bounding box (x, y, width, height) of every registered object
+    '''
+    def __init__(self, cell_size=100):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.bounds = {}
+
+    def clear(self):
+        '''Remove all registered objects'''
+        self.cells.clear()
+        self.bounds.clear()
+
+    def cell_range(self, x, y, width, height):
+        '''Columns and rows of the cells overlapped by a box
+
+        Returns
+            tuple: (first column, last column, first row, last row)
+        '''
+        size = self.cell_size
+        return int(x // size), int((x + width) // size), int(y // size), int((y + height) // size)
+
+    def insert(self, obj, x, y, width, height):
+        '''Register an object with its bounding box
+
+        Args
+            obj (object): object to register
+            x (int): x coordinate of bounding box
+            y (int): y coordinate of bounding box
+            width (int): width of bounding box
+            height (int): height of bounding box
+        '''
+        self.bounds[obj] = (x, y, width, height)
+        col_0, col_1, row_0, row_1 = self.cell_range(x, y, width, height)
+        for col in range(col_0, col_1 + 1):
+            for row in range(row_0, row_1 + 1):
+                self.cells.setdefault((col, row), []).append(obj)
+
+    def remove(self, obj):
+        '''Unregister an object
+
+        Args
+            obj (object): previously registered object
+        '''
+        col_0, col_1, row_0, row_1 = self.cell_range(*self.bounds.pop(obj))
+        for col in range(col_0, col_1 + 1):
+            for row in range(row_0, row_1 + 1):
+                self.cells[(col, row)].remove(obj)
+
+    def move(self, obj, x, y, width, height):
+        '''Update the bounding box of a registered object, only touching cells if it has changed cells
+
+        Args
+            obj (object): previously registered object
+            x (int): new x coordinate of bounding box
+            y (int): new y coordinate of bounding box
+            width (int): new width of bounding box
+            height (int): new height of bounding box
+        '''
+        if self.cell_range(*self.bounds[obj]) == self.cell_range(x, y, width, height):
+            self.bounds[obj] = (x, y, width, height)
+        else:
+            self.remove(obj)
+            self.insert(obj, x, y, width, height)
+
+    def query(self, x, y, width, height, kind=None):
+        '''Find candidate objects whose cells overlap a box
+
+        Candidates share a cell with the box but are not guaranteed to overlap it, an exact test is still needed.
+
+        Args
+            x (int): x coordinate of box
+            y (int): y coordinate of box
+            width (int): width of box
+            height (int): height of box
+            kind (class): only return objects of this class
+
+        Returns
+            list: candidate objects in registration order, without duplicates
+        '''
+        col_0, col_1, row_0, row_1 = self.cell_range(x, y, width, height)
+        cells = self.cells
+        if col_0 == col_1 and row_0 == row_1:                   # box inside one cell, nothing to merge
+            objs = cells.get((col_0, row_0), ())
+            return list(objs) if kind is None else [obj for obj in objs if isinstance(obj, kind)]
+        found = {}
+        for col in range(col_0, col_1 + 1):
+            for row in range(row_0, row_1 + 1):
+                for obj in cells.get((col, row), ()):
+                    if kind is None or isinstance(obj, kind):
+                        found[obj] = None
+        return list(found)
+
+    def query_point(self, x, y, kind=None):
+        '''Find candidate objects in the cell containing a point
+
+        Args
+            x (int): x coordinate of point
+            y (int): y coordinate of point
+            kind (class): only return objects of this class
+
+        Returns
+            list: candidate objects
+        '''
+        objs = self.cells.get((int(x // self.cell_size), int(y // self.cell_size)), ())
+        if kind is None:
+            return list(objs)
+        return [obj for obj in objs if isinstance(obj, kind)]
+
+    def nearest(self, x, y, kind=None, max_distance=None):
+        '''Find the registered object whose bounding box center is closest to a point
+
+        Cells are searched in rings of increasing size around the point, stopping once no unsearched cell
+        can hold anything closer than the best object found.
+
+        Args
+            x (int): x coordinate of point
+            y (int): y coordinate of point
+            kind (class): only consider objects of this class
+            max_distance (int): ignore objects further away than this. Searches the whole grid if None
+
+        Returns
+            object: closest object, None if nothing was found
+        '''
+        if not self.bounds:
+            return None
+        size = self.cell_size
+        col, row = int(x // size), int(y // size)
+        if max_distance is None:
+            max_ring = max(max(abs(c - col), abs(r - row)) for c, r in self.cells) + 1 if self.cells else 0
+        else:
+            max_ring = int(max_distance // size) + 1
+        best, best_dist_sq = None, None
+        for ring in range(max_ring + 1):
+            if best is not None and best_dist_sq <= ((ring - 1) * size)**2:
+                break                                           # every cell in this ring is further than best
+            for c in range(col - ring, col + ring + 1):
+                for r in range(row - ring, row + ring + 1):
+                    if max(abs(c - col), abs(r - row)) != ring:
+                        continue                                # only the outer edge of the ring is new
+                    for obj in self.cells.get((c, r), ()):
+                        if kind is not None and not isinstance(obj, kind):
+                            continue
+                        ox, oy, ow, oh = self.bounds[obj]
+                        dist_sq = (ox + ow/2 - x)**2 + (oy + oh/2 - y)**2
+                        if max_distance is not None and dist_sq > max_distance**2:
+                            continue
+                        if best_dist_sq is None or dist_sq < best_dist_sq:
+                            best, best_dist_sq = obj, dist_sq
+        return best
+
+
+class VectorCollisions:
+    '''Optional collision backend that resolves every shot against every asteroid with a few numpy array operations.
+
+    Shot and asteroid positions are read straight from their EntityStore columns and the swept tests of
+    Simulation.shot_hits() are done for every shot/asteroid pair at once, so no Python loop runs over the pairs. The
+    rules are the same as Simulation.handle_collisions(); a shot hits the first asteroid along its path, Insta-Kill
+    drops a hit asteroid's health to zero, Double XP is applied when asteroids are destroyed and asteroids that
+    reach the mothership damage it.
+
+    Attributes
+        pairs_tested (int): number of shot/asteroid pairs tested during the most recent tick
+        hits (int): number of shot/asteroid hits during the most recent tick
+    '''
+    def __init__(self):
+        if np is None:
+            raise ImportError('numpy is required for vectorized collisions')
+        self.pairs_tested = 0
+        self.hits = 0
+
+    def resolve(self, sim):
+        '''Resolve shot and mothership collisions for one tick
+
+        Args
+            sim (Simulation obj): simulation whose shots and asteroids are tested
+        '''
+        shots = ShooterObject.shots_queue
+        asteroids = Asteroid.asteroid_lst
+        self.pairs_tested = len(shots) * len(asteroids)
+        self.hits = 0
+
+        if shots and asteroids:
+            # columns line up with the live lists, so they're read without building arrays object by object
+            shot_x = ShooterObject.store.view('start_x').astype(np.float64)
+            shot_y = ShooterObject.store.view('end_y').astype(np.float64)
+            shot_back = (ShooterObject.store.view('prev_start_y') - ShooterObject.store.view('start_y')).astype(np.float64)
+            shot_damage = ShooterObject.store.view('damage').astype(np.int64)
+            radius = Asteroid.store.view('width') / 2
+            center_x = Asteroid.store.view('x') + radius
+            center_y = Asteroid.store.view('y') + radius
+            ast_drop = Asteroid.store.view('y') - Asteroid.store.view('prev_y')
+
+            # swept tests with one row per shot and one column per asteroid, same arithmetic as Simulation.shot_hits()
+            dx = shot_x[:, None] - center_x[None, :]
+            chord_sq = (radius*radius)[None, :] - dx*dx
+            y_1 = shot_y[:, None] - center_y[None, :]
+            y_0 = y_1 + shot_back[:, None] + ast_drop[None, :]
+            inside = y_0*y_0 < chord_sq
+            enters = ~inside & (chord_sq > 0) & (y_0 > 0) & ((y_1 <= 0) | (y_1*y_1 < chord_sq))
+            t = np.full(dx.shape, np.inf)
+            t[inside] = 0.0
+            t[enters] = (y_0[enters] - np.sqrt(chord_sq[enters])) / (y_0[enters] - y_1[enters])
+
+            # only the earliest hit along each shot's path counts, argmin picks the first asteroid on ties
+            first = np.argmin(t, axis=1)
+            shot_rows = np.flatnonzero(np.isfinite(t[np.arange(len(shots)), first]))
+            hit = np.zeros(dx.shape, dtype=bool)
+            hit[shot_rows, first[shot_rows]] = True
+
+            self.hits = int(np.count_nonzero(hit))
+            if self.hits:
+                damage = shot_damage @ hit                              # total damage dealt to each asteroid
+                insta_kill = (TimedPowerUp.activated == True) and (TimedPowerUp.current_option == 'Insta-Kill')
+                for i in np.flatnonzero(damage):
+                    asteroid = asteroids[i]
+                    asteroid.damage_taken += int(damage[i])
+                    if insta_kill:
+                        asteroid.health_amt = 0                         # instantly reduce asteroid health to zero.
+                    else:
+                        asteroid.health_amt -= int(damage[i])
+                sim.update_health_bars()
+                for i in np.flatnonzero(hit.any(axis=1)):
+                    shots[i].hit = True
+
+        sim.remove_finished()
+
+
+class Scheduler:
+    '''Priority queue of callbacks to run on given simulation ticks.
+
+    Events are kept in a heap ordered by tick, so only events that are due are ever looked at and the cost of
+    a tick doesn't depend on how many events are waiting. Events due on the same tick run in the order they
+    were scheduled. Cancelled events are left in the heap and skipped when they come up.
+
+    Attributes
+        heap (list): [tick, order, callback, args] entries, callback is None once cancelled
+        order (int): number of events scheduled, used to break ties between events on the same tick
+        fired (int): number of events run
+        cancelled (int): number of events cancelled
+    '''
+    def __init__(self):
+        self.heap = []
+        self.order = 0
+        self.fired = 0
+        self.cancelled = 0
+
+    def schedule(self, tick, callback, *args):
+        '''Run a callback on a tick
+
+        Args
+            tick (int): tick the callback is due on
+            callback (callable): function to call
+            args: arguments the callback is called with
+
+        Returns
+            list: event, which can be passed to cancel()
+        '''
+        event = [tick, self.order, callback, args]
+        self.order += 1
+        heapq.heappush(self.heap, event)
+        return event
+
+    def cancel(self, event):
+        '''Stop an event from running. Does nothing if it has already run or been cancelled
+
+        Args
+            event (list): event returned by schedule()
+        '''
+        if event is not None and event[2] is not None:
+            event[2] = None
+            self.cancelled += 1
+
+    def run_due(self, tick):
+        '''Run every event due on or before a tick, including events scheduled by the callbacks themselves
+
+        Args
+            tick (int): current tick
+        '''
+        heap = self.heap
+        while heap and heap[0][0] <= tick:
+            _, _, callback, args = heapq.heappop(heap)
+            if callback is not None:
+                self.fired += 1
+                callback(*args)
+
+    def pending(self):
+        '''Events waiting to run, soonest first
+
+        Returns
+            list: (tick, callback name, args) of every event that hasn't run or been cancelled
+        '''
+        return [(tick, callback.__name__, args) for tick, _, callback, args in sorted(self.heap) if callback is not None]
+
+
+class Simulation:
+    '''Game state and rules, advanced one tick at a time without a display, mixer, or clock.
+
+    A Simulation can be stepped as fast as the CPU allows, which makes it usable for unattended games
+    (set SDL_VIDEODRIVER to 'dummy' on machines without a screen). Every rate and duration in the game is
+    counted in ticks, and GameStart steps the simulation tick_rate times per second of real time no matter
+    how fast frames are drawn.
+
+    Spawns, cooldowns and timed effects are events in a Scheduler rather than rolls and timers checked every
+    tick. Spawn times are drawn ahead with the same chance per tick as rolling every tick would have, and are
+    redrawn whenever something they depend on (mothership health, an active powerup) changes. Difficulty
+    settings are class attributes the simulation can't watch, so code that changes them during a game calls
+    difficulty_changed() afterwards.
+
+    Only one Simulation can be in use at a time. Asteroids, shots, explosions and powerups live in class level
+    lists and pools shared with the drawing code, and creating a Simulation empties them, so the newest
+    Simulation takes over the playfield. Stepping, capturing or restoring an older one raises RuntimeError
+    instead of silently corrupting the newer game. Games that have to run side by side run in separate
+    processes, as batch.py does.
+
+    Class Attributes
+        tick_rate (int): number of ticks per second of game time
+        health_powerup_cooldown (int): ticks after a health powerup before another can be generated
+        powerup_cooldown (int): ticks after a Double XP or Insta-Kill powerup before another can be generated
+        instances (int): number of simulations created, the newest one owns the class level entity lists
+
+    Args
+        width (int): width of playfield in number of pixels
+        height (int): height of playfield in number of pixels
+        vectorized_collisions (bool): resolve shot collisions with the numpy VectorCollisions backend
+        seed (int): seed for this game's random number generator. A random seed is chosen if None
+
+    Attributes
+        width (int): storage of input argument width. Used as the movement limit of main sprite
+        height (int): storage of input argument height
+        seed (int): seed of this game's random number generator
+        powerup_bar (tuple): x, y, width and height of the frame of the powerup duration bar
+        rng (Random obj): random number generator used for every random choice made during this game
+        collision_engine (VectorCollisions obj): vectorized collision backend, None to use the Python loops
+        grid (SpatialGrid obj): broadphase grid holding asteroids and powerups, rebuilt every tick
+        main_sprite (Character obj): main character 
+        mothership (Mothership obj): mothership character
+        score (Score obj): score object
+        count (int): number of ticks that have been simulated
+        center_frame (int): counter telling which center image to be displayed 
+        left_right_frame (int): counter telling which left/right image to be displayed
+        most_recent_key (none): contains most recently pressed key; 'l' or 'r'
+        powerup_health_timer (int): tick the health powerup cooldown ends on
+        powerup_timer (int): tick the cooldown of the remaining powerups ends on
+        events (Scheduler obj): upcoming spawns and effect endings
+        asteroid_event (list): scheduled asteroid spawn
+        health_powerup_event (list): scheduled health powerup spawn, None if there isn't one
+        timed_powerup_events (dict): scheduled timed powerup spawns keyed by powerup type
+        new_explosions (list): explosions generated during the most recent tick
+        asteroids_destroyed (int): number of asteroids shot down
+        game_over (bool): True once the mothership has run out of health
+        profiler (FrameProfiler obj): if set, each phase of a tick is timed with it
+        instance (int): number of this simulation, it owns the entity lists while it equals instances
+    '''
+    tick_rate = 60
+    health_powerup_cooldown = 500                                   # ~8 seconds
+    powerup_cooldown = 500
+    instances = 0
+
+    def __init__(self, width=500, height=700, vectorized_collisions=False, seed=None):
+        self.width = width
+        self.height = height
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.powerup_bar = (width - 25, 75, 15, height - 150)       # on the right of the screen
+        self.rng = random.Random(self.seed)                         # one stream per game so that games can be replayed
+        self.collision_engine = VectorCollisions() if vectorized_collisions else None
+        self.grid = SpatialGrid()
+        Simulation.instances += 1
+        self.instance = Simulation.instances
+
+        # Reset all object class attribute lists so that a new simulation starts from an empty playfield
+        Asteroid.pool.release_all()
+        ShooterObject.pool.release_all()
+        Explosion.pool.release_all()
+        Health_PowerUp.current_powerups[:] = []
+        TimedPowerUp.current_powerups[:] = []
+        TimedPowerUp.activated = False
+        TimedPowerUp.current_option = None
+
+        self.main_sprite = Character(width, height)                 # initialize main sprite
+        self.mothership = Mothership(width, height)                 # initialize mothership
+        self.score = Score(width)
+        self.count = 0                                              # count running so that every X amount of loops, do Y
+        self.center_frame = 0
+        self.left_right_frame = 0
+        self.most_recent_key = None                                 # input 'l' or 'r' depending on which directional was last used.
+        self.powerup_health_timer = 0                               # two seperate timers for health powerups vs. other powerups
+        self.powerup_timer = 0
+        self.new_explosions = []
+        self.asteroids_destroyed = 0
+        self.game_over = False
+        self.profiler = None
+        self.events = Scheduler()
+        self.asteroid_event = None
+        self.health_powerup_event = None
+        self.timed_powerup_events = {}
+        self.schedule_asteroid(0)
+        self.health_changed()
+
+    def check_live(self):
+        '''Raise RuntimeError if a newer Simulation has taken over the class level entity lists'''
+        if self.instance != Simulation.instances:
+            raise RuntimeError('a newer Simulation has taken over the shared entity lists, only the most recently '
+                               'created Simulation can be used')
+
+    def step(self, inputs=0):
+        '''Advance the game by one tick
+
+        Args
+            inputs (int): bitmask of INPUT_LEFT and INPUT_RIGHT for the keys held during this tick
+
+        Returns
+            bool: True if the mothership has been destroyed
+        '''
+        if self.instance != Simulation.instances:
+            self.check_live()
+        if self.game_over:
+            return True
+        self.new_explosions = []
+
+        if self.count % 2 == 0:                                     # main sprite animation runs at 30 frames per second
+            self.center_frame = (self.center_frame + 1)%4           # rotate through four static images
+            self.left_right_frame += 1
+
+        profiler = self.profiler
+
+        self.handle_inputs(inputs)
+        if profiler is not None:
+            profiler.lap('input')
+
+        self.generate_shots()                                       # generate ShooterObjects 
+        if profiler is not None:
+            profiler.lap('shots')
+
+        self.run_events()                                           # spawns and timed effects that are due
+        if profiler is not None:
+            profiler.lap('spawns')
+
+        self.build_grid()
+        self.handle_powerups()
+        if profiler is not None:
+            profiler.lap('powerups')
+
+        self.handle_collisions()
+        if profiler is not None:
+            profiler.lap('collisions')
+
+        if self.count % 5 == 0:
+            self.score.score += 1                                   # score increase every 5 loops. 
+
+        self.advance_objects()
+        self.count += 1                                             # increment loop count
+        if profiler is not None:
+            profiler.lap('advance')
+
+        if self.mothership.health_amt <= 0:                         # game is over once mothership has 0 or negative health
+            self.game_over = True
+        return self.game_over
+
+    def run(self, policy=None, max_ticks=None):
+        '''Step the simulation until the game is over
+
+        Args
+            policy (callable): called with the simulation before every tick, returns the inputs for that tick.
+                If None the main sprite never moves
+            max_ticks (int): optional limit on the number of ticks to simulate
+
+        Returns
+            int: final score
+        '''
+        while not self.game_over:
+            if max_ticks is not None and self.count >= max_ticks:
+                break
+            self.step(policy(self) if policy is not None else 0)
+        return self.score.score
+
+    def handle_inputs(self, inputs):
+        '''Move character right and left, setting character movement states and correct frames to be displayed
+
+        Args
+            inputs (int): bitmask of INPUT_LEFT and INPUT_RIGHT
+        '''
+        self.main_sprite.prev_x = self.main_sprite.x
+        if inputs & INPUT_LEFT:                                 # left arrow key to move left
+            self.main_sprite.move_left(self)                    # using playfield as input to set boundaries for movement.
+            if self.main_sprite.left == False:                  # only allowing access to branch if False so it won't run while holding down key
+                self.main_sprite.left = True                    # sprite is now moving left
+                self.main_sprite.right = False                  # right and center are now both False
+                self.main_sprite.center = False                      
+                self.left_right_frame = 0                       # resetting left&right frame count. Will help display intermediate strafe states
+                self.most_recent_key = 'l'                      # setting left so intermediate strafe images used to level out spaceship
+
+        elif inputs & INPUT_RIGHT:                              # right arrow key to move right
+            self.main_sprite.move_right(self)                   # using playfield as input to set boundaries for movement.
+            if self.main_sprite.right == False:                 # only allowing access to branch if False so it won't run while holding down key
+                self.main_sprite.right = True
+                self.main_sprite.left = False
+                self.main_sprite.center = False
+                self.left_right_frame = 0
+                self.most_recent_key = 'r'                      # setting right so intermediate strafe images used to level out spaceship
+
+        else:
+            if self.main_sprite.center == False:                # once right or left keys are let go, if statement will run
+                self.main_sprite.center = True
+                self.main_sprite.right = False
+                self.main_sprite.left = False
+                self.left_right_frame = 0                       # resetting upon return to center will allow us to access intermediate strafe states
+
+    def generate_shots(self):
+        '''Generate shots fired from spaceship at a constant rate'''
+        if (self.count % ShooterObject.shot_rate == 0):         # every 50 loops the spaceship will generate a ShooterObject(bullet)
+            self.main_sprite.shoot('normal')                    # normal indicates the bullet type and specifies its properties upon creation.
+
+    def arrival(self, chance):
+        '''Draw how many ticks it takes until the first success of a chance that is tried once per tick.
+        Equivalent to rolling every tick, but takes one random number instead of one per tick
+
+        Args
+            chance (float): probability of success on each tick
+
+        Returns
+            int: ticks until the first success, 1 if it happens on the first tick
+        '''
+        if chance >= 1:
+            return 1
+        return int(math.log(1.0 - self.rng.random()) / math.log(1.0 - chance)) + 1
+
+    def run_events(self):
+        '''Spawn asteroids and powerups and end timed effects that are due this tick'''
+        self.events.run_due(self.count)
+
+    def schedule_asteroid(self, first_tick):
+        '''Schedule the next asteroid spawn
+
+        Args
+            first_tick (int): earliest tick the asteroid can spawn on
+        '''
+        chance = 1 / (Asteroid.ast_diff_setting[Asteroid.current_setting] + 1)  # one in ast_diff_setting+1 every tick
+        self.asteroid_event = self.events.schedule(first_tick + self.arrival(chance) - 1, self.spawn_asteroid)
+
+    def spawn_asteroid(self):
+        '''Generate an asteroid, unless there are already the maximum amount, and schedule the next one'''
+        # a spawn that comes up while the screen is full is skipped, the same as not rolling while it's full
+        if len(Asteroid.asteroid_lst) < Asteroid.maximum_asteroid_amount:
+            self.a = Asteroid.pool.acquire(self.rng, self.width)
+        self.schedule_asteroid(self.count + 1)
+
+    def schedule_health_powerup(self):
+        '''Reschedule the next health powerup for the mothership's current health. Called whenever it changes'''
+        self.events.cancel(self.health_powerup_event)
+        self.health_powerup_event = None
+        if self.mothership.health_amt != 1000:              # only if the mothership has taken on some damage should powerups begin to generate
+            # powerup generation is a function of game health with a max generation rate of 300
+            chance = 1 / (self.mothership.health_amt*2 + 301)
+            first_tick = max(self.count + 1, self.powerup_health_timer + 1)
+            self.health_powerup_event = self.events.schedule(first_tick + self.arrival(chance) - 1, self.spawn_health_powerup)
+
+    def spawn_health_powerup(self):
+        '''Generate a health powerup and start its cooldown'''
+        self.health_powerup_event = None
+        self.p = Health_PowerUp(self.rng, self.width)
+        self.powerup_health_timer = self.count + Simulation.health_powerup_cooldown
+        self.schedule_health_powerup()
+
+    def schedule_timed_powerups(self):
+        '''Schedule Double XP while the mothership has at least half its health and Insta-Kill while it has at
+        most half, as long as neither is active. Called whenever the health, cooldown or activation changes'''
+        eligible = []
+        if TimedPowerUp.activated == False:                 # only allow power up generation if a powerup isn't in current use.
+            if self.mothership.health_amt >= 500:           # havin' a good time then you should get a double XP
+                eligible.append('Double XP')
+            if self.mothership.health_amt <= 500:           # about t' die might need Insta-Kill
+                eligible.append('Insta-Kill')
+        for p_type in list(self.timed_powerup_events):
+            if p_type not in eligible:
+                self.events.cancel(self.timed_powerup_events.pop(p_type))
+        first_tick = max(self.count + 1, self.powerup_timer + 1)
+        for p_type in eligible:
+            if p_type not in self.timed_powerup_events:     # a chance that stays the same doesn't need to be redrawn
+                self.timed_powerup_events[p_type] = self.events.schedule(first_tick + self.arrival(1/1001) - 1,
+                                                                         self.spawn_timed_powerup, p_type)
+
+    def spawn_timed_powerup(self, p_type):
+        '''Generate a timed powerup and start the cooldown for all of them
+
+        Args
+            p_type (str): 'Double XP' or 'Insta-Kill'
+        '''
+        del self.timed_powerup_events[p_type]
+        if TimedPowerUp.activated == True:                  # activated from outside the simulation, e.g. by a benchmark
+            return
+        TimedPowerUp(p_type, self.rng, self.width)
+        self.powerup_timer = self.count + Simulation.powerup_cooldown # setting cooldown for powerups
+        for event in self.timed_powerup_events.values():
+            self.events.cancel(event)
+        self.timed_powerup_events = {}
+        self.schedule_timed_powerups()
+
+    def end_timed_powerup(self, t_powerup):
+        '''Undo the effect of a timed powerup once its duration is up
+
+        Args
+            t_powerup (TimedPowerUp obj): active powerup
+        '''
+        TimedPowerUp.activated = False                      # undos all effects from activation
+        TimedPowerUp.current_powerups.remove(t_powerup)
+        self.schedule_timed_powerups()
+
+    def end_health_powerup(self, powerup):
+        '''Remove a health powerup once its text has been shown
+
+        Args
+            powerup (Health_PowerUp obj): activated powerup
+        '''
+        powerup.activated = False
+        Health_PowerUp.current_powerups.remove(powerup)
+
+    def health_changed(self):
+        '''Redraw powerup spawns that depend on the mothership's health'''
+        self.schedule_health_powerup()
+        self.schedule_timed_powerups()
+
+    def difficulty_changed(self):
+        '''Redraw the next asteroid spawn for the current Asteroid.ast_diff_setting and Asteroid.current_setting.
+        Called between ticks by code that changes them during a game'''
+        self.events.cancel(self.asteroid_event)
+        self.schedule_asteroid(self.count)
+
+    def reseed(self, seed):
+        '''Continue the game with a new seed, redrawing every pending spawn from it, so that games forked from the
+        same checkpoint don't share the spawns that had already been drawn. Called between ticks
+
+        Args
+            seed (int): seed for the random number generator from now on
+        '''
+        self.seed = seed
+        self.rng.seed(seed)
+        for event in self.timed_powerup_events.values():
+            self.events.cancel(event)
+        self.timed_powerup_events = {}
+        self.difficulty_changed()
+        self.health_changed()
+
+    def display_end(self):
+        '''Last tick of powerup text shown from this tick on. Text blinks off every fifth tick and is shown 25 times
+
+        Returns
+            int: tick number
+        '''
+        tick = self.count
+        shown = 1 if tick % 5 else 0
+        while shown < 25:
+            tick += 1
+            if tick % 5:
+                shown += 1
+        return tick
+
+    def build_grid(self):
+        '''Register asteroids and powerups in the broadphase grid at their current positions'''
+        self.grid.clear()
+        columns = Asteroid.store.columns
+        for asteroid, x, y, width in zip(Asteroid.asteroid_lst, columns['x'], columns['y'], columns['width']):
+            self.grid.insert(asteroid, x, y, width, width)
+        for powerup in Health_PowerUp.current_powerups:
+            self.grid.insert(powerup, powerup.x, powerup.y, powerup.width, powerup.height)
+        for powerup in TimedPowerUp.current_powerups:
+            self.grid.insert(powerup, powerup.x, powerup.y, powerup.width, powerup.height)
+
+    def handle_powerups(self):
+        '''Activate powerups the main sprite is touching, only testing powerups that share a grid cell with it'''
+        # powerups in the cells around the main sprite are the only ones that can be touching it
+        touching = set(self.grid.query(self.main_sprite.x, self.main_sprite.y, self.main_sprite.width, self.main_sprite.height))
+
+        for powerup in Health_PowerUp.current_powerups:
+            if (powerup in touching) and (powerup.x > self.main_sprite.x) and (powerup.x < self.main_sprite.x + self.main_sprite.width)\
+                 and (powerup.y + powerup.height > self.main_sprite.y)\
+                      and (powerup.y + powerup.height < self.main_sprite.y + self.main_sprite.height): # within boundaries of main sprite
+                if powerup.activated == False:                          # set so power up can only give mothership health once.
+                    self.mothership.health_amt += powerup.health_add    # increment mothership's health
+                    self.mothership.update_damage()                     # update motherships damage
+                    powerup.activated = True                            # activate powerup
+                    powerup.display_end = self.display_end()
+                    self.events.schedule(powerup.display_end + 1, self.end_health_powerup, powerup) # remove once text is done
+                    self.health_changed()
+
+        for t_powerup in TimedPowerUp.current_powerups:
+            if (t_powerup in touching) and (t_powerup.x > self.main_sprite.x) and (t_powerup.x < self.main_sprite.x + self.main_sprite.width)\
+                    and (t_powerup.y + t_powerup.height > self.main_sprite.y)\
+                         and (t_powerup.y + t_powerup.height < self.main_sprite.y + self.main_sprite.height): #within boundaries
+                if TimedPowerUp.activated == False:                     # only turn switch if False, this keeps actions from repeating
+                    TimedPowerUp.activated = True
+                    t_powerup.effect_timer = self.count                 # setting powerup timer to current game loop number
+                    t_powerup.display_end = self.display_end()
+                    # ~10 seconds worth of powerup
+                    self.events.schedule(self.count + t_powerup.powerup_duration + 1, self.end_timed_powerup, t_powerup)
+                    self.schedule_timed_powerups()                      # no new timed powerups while one is active
+
+    def handle_collisions(self):
+        '''Damage every asteroid hit by a shot this tick, each shot hitting the first asteroid along its path'''
+        if self.collision_engine is not None:
+            self.collision_engine.resolve(self)
+            return
+
+        hits = self.shot_hits()
+        insta_kill = (TimedPowerUp.activated == True) and (TimedPowerUp.current_option == 'Insta-Kill')
+        for bullet, asteroid in hits:
+            bullet.hit = True                                               # register hit and reduce asteroid health
+            if insta_kill:                                                  # powerup effect
+                asteroid.health_amt = 0                                     # instantly reduct asteroid health to zero.
+            else:
+                asteroid.health_amt -= bullet.damage                        # if no powerup then just reduce ast health by bullet damage
+            asteroid.damage_taken += bullet.damage
+        if hits:
+            self.update_health_bars()
+        self.remove_finished()
+
+    def shot_hits(self):
+        '''Find the first asteroid each shot hits on its way from where it was last tick to where it is now.
+
+        The tip of a shot sweeps a vertical segment every tick, which is tested against the asteroid circles
+        relative to their own movement this tick, so a shot moving faster than an asteroid is wide can't pass
+        through it between ticks. Only asteroids sharing a grid cell with the swept segment are tested. A shot
+        that starts the segment inside an asteroid (new shots and asteroids haven't moved yet) hits it at the
+        start, and ties go to the asteroid that comes first in Asteroid.asteroid_lst.
+
+        Returns
+            list: (shot, asteroid) pairs in shot order, at most one per shot
+        '''
+        shot_columns = ShooterObject.store.columns
+        ast_columns = Asteroid.store.columns
+        n = Asteroid.store.count
+        if not n:
+            return []
+        prev_y = ast_columns['prev_y']
+        drop = max(map(operator.sub, ast_columns['y'][:n], prev_y[:n]))   # furthest any asteroid moved this tick
+        bounds = self.grid.bounds
+        query = self.grid.query
+        hits = []
+        for bullet, start_x, start_y, end_y, prev_start_y in zip(ShooterObject.shots_queue, shot_columns['start_x'],
+                                                                  shot_columns['start_y'], shot_columns['end_y'],
+                                                                  shot_columns['prev_start_y']):
+            back = prev_start_y - start_y                                   # distance travelled by the shot this tick
+            first, first_t = None, None
+            for asteroid in query(start_x, end_y, 0, back + drop, Asteroid):
+                ast_x, ast_y, width, _ = bounds[asteroid]                   # position registered by build_grid this tick
+                radius = width/2
+                dx = start_x - (ast_x + radius)
+                chord_sq = radius*radius - dx*dx                            # squared half chord of the circle along the path
+                if chord_sq <= 0:
+                    continue
+                y_1 = end_y - (ast_y + radius)                              # tip relative to the asteroid center now
+                y_0 = y_1 + back + (ast_y - prev_y[asteroid.pool_index])    # and where it was relative to it last tick
+                if y_0 * y_0 < chord_sq:
+                    t = 0.0                                                 # segment starts inside the asteroid
+                elif y_0 > 0 and (y_1 <= 0 or y_1 * y_1 < chord_sq):            # enters through the bottom of the circle
+                    t = (y_0 - math.sqrt(chord_sq)) / (y_0 - y_1)           # fraction of the way along at which it enters
+                else:
+                    continue
+                if first is None or t < first_t or (t == first_t and asteroid.pool_index < first.pool_index):
+                    first, first_t = asteroid, t
+            if first is not None:
+                hits.append((bullet, first))
+        return hits
+
+    def remove_finished(self):
+        '''Destroy asteroids with no health left or that have reached the mothership and release used up shots.
+        Conditions are checked on the columns, zip() stops at the end of the live rows'''
+        columns = Asteroid.store.columns
+        contact_y = self.mothership.y
+        for asteroid in [ast for ast, health, y, width in zip(Asteroid.asteroid_lst, columns['health_amt'], columns['y'], columns['width'])
+                         if (health <= 0) or (y + width > contact_y)]:  # check deletion conditions
+            self.destroy_asteroid(asteroid)
+
+        for shot in [shot for shot, start_y in zip(ShooterObject.shots_queue, ShooterObject.store.columns['start_y'])
+                     if (shot.hit == True) or (start_y < 0)]:       # check delete conditions
+            ShooterObject.pool.release(shot)
+
+    def update_health_bars(self):
+        '''Recompute the health bar of every asteroid in one pass over the asteroid columns'''
+        store = Asteroid.store
+        n = store.count
+        if np is not None and n >= store.numpy_rows:
+            health = store.view('health_amt')
+            total = health + store.view('damage_taken')
+            fraction = np.divide(health, total, out=np.zeros(n), where=total != 0)
+            store.view('hbar')[:] = np.round(store.view('hbar_length') * fraction)  # rounds halves to even like round()
+            return
+        hbar_length, health, damage = store.columns['hbar_length'], store.columns['health_amt'], store.columns['damage_taken']
+        # length multiplied by fraction of health remaining
+        store.columns['hbar'][:n] = array.array('i', [round(length * (h/(h + d))) if h + d else 0 for length, h, d
+                                                      in zip(hbar_length[:n], health[:n], damage[:n])])
+
+    def destroy_asteroid(self, asteroid):
+        '''Apply score or mothership damage for a finished asteroid and replace it with an explosion
+
+        Args
+            asteroid (Asteroid obj): asteroid with no health left or that has reached the mothership
+        '''
+        if asteroid.health_amt <= 0:                        
+            if (TimedPowerUp.activated == True) and (TimedPowerUp.current_option == 'Double XP'): # powerup effect
+                self.score.score += (asteroid.width * 2)                    # double the amount of XP you receive
+            else:
+                self.score.score += asteroid.width                          # increment score asteroid width amt
+            asteroid.destruction_method = 'negative health'                 # method informs that xp gain should be shown on screen
+            self.asteroids_destroyed += 1
+        elif (asteroid.y + asteroid.width > self.mothership.y):             # has made contact with mothership
+            asteroid.destruction_method = 'off screen'
+            self.mothership.health_amt -= asteroid.damage                   # update mothership health and damage
+            self.mothership.damage_taken += asteroid.damage
+            self.mothership.update_damage() 
+            self.health_changed()
+            
+        exp = asteroid.generate_explosion()                                 # generate explosion before returning asteroid to pool
+        self.new_explosions.append(exp)
+        self.schedule_explosion_end(exp)
+        self.grid.remove(asteroid)                                          # released asteroids no longer have a row to read
+        Asteroid.pool.release(asteroid)
+
+    def schedule_explosion_end(self, exp):
+        '''Return an explosion to its pool once its last frame has been shown. Frames advance every fourth tick
+        and an explosion has 11 of them
+
+        Args
+            exp (Explosion obj): explosion created this tick
+        '''
+        self.events.schedule(self.count + (-self.count % 4) + 40, Explosion.pool.release, exp)
+
+    def advance_objects(self):
+        '''Progress shots, asteroids, powerups and explosions by one tick and remove powerups that were missed'''
+        shots = ShooterObject.store                     # every live shot is moved at once, column by column
+        shots.copy('prev_start_y', 'start_y')           # remember last position so drawing can interpolate
+        shots.shift('start_y', 'velo', -1)              # progressing each shot up the screen
+        shots.shift('end_y', 'velo', -1)
+
+        asteroids = Asteroid.store
+        asteroids.copy('prev_y', 'y')
+        if self.count % 2 == 0:                         # move asteroids every other frame. keeps them from being too fast
+            asteroids.shift('y', 'velocity')
+
+        for powerup in Health_PowerUp.current_powerups:
+            powerup.prev_y = powerup.y
+            if powerup.activated == True:
+                # only display every five game loop frames if its been activate
+                powerup.text_visible = bool(self.count % 5) and (self.count <= powerup.display_end)
+            else:    
+                powerup.progress()                                              # if in unactivated state then have it progress down the screen
+
+        for powerup in TimedPowerUp.current_powerups:
+            powerup.prev_y = powerup.y
+            if TimedPowerUp.activated == True:
+                powerup.text_visible = bool(self.count % 5) and (self.count <= powerup.display_end)
+                if self.count - powerup.effect_timer < powerup.powerup_duration:    # if still under duration limit
+                    powerup.bar_height = round(self.powerup_bar[3] * (1 - (self.count - powerup.effect_timer)/powerup.powerup_duration))
+                else:
+                    powerup.bar_height = 0
+            else:    
+                powerup.progress()                                                  # if not activated progress down screen
+
+        # missed powerups can't be caught once they've fallen off the bottom of the screen
+        Health_PowerUp.current_powerups[:] = [powerup for powerup in Health_PowerUp.current_powerups if powerup.y < self.height]
+        TimedPowerUp.current_powerups[:] = [powerup for powerup in TimedPowerUp.current_powerups if powerup.y < self.height]
+
+        if self.count % 4 == 0:                                                     # switch explosion frame every four loops
+            for exp in Explosion.explosion_lst:                                     # finished explosions are released by
+                exp.current_frame += 1                                              # their scheduled event
+
+
+class DirtyRectRenderer:
+    '''Only redraws and updates the parts of the screen that change between frames.
+
+    Everything that never moves (background, powerup frame and mothership image) is drawn once onto a static
+    layer. Each frame the areas drawn to on the previous frame are restored from the static layer, the moving
+    objects are drawn on top, and only the restored and newly drawn areas are pushed to the display.
+
+    Args
+        display (Boundary obj): game window
+
+    Attributes
+        display (Boundary obj): storage of input argument display
+        window (pygame Surface): surface the game is drawn to
+        static (pygame Surface): background, powerup frame and mothership image. Drawn by reset()
+        previous_rects (list): areas drawn to on the previous frame
+        full_redraw (bool): restore and update the whole screen on the next frame
+        updated_area (float): fraction of the screen updated on the most recent frame
+    '''
+    def __init__(self, display):
+        self.display = display
+        self.window = display.window
+        self.static = pygame.Surface(self.window.get_size()).convert()
+        self.previous_rects = []
+        self.full_redraw = True
+        self.updated_area = 1
+
+    def reset(self, sim):
+        '''Draw the static layer for a new game and redraw the whole screen on the next frame, e.g. after another
+        scene has drawn over it
+
+        Args
+            sim (Simulation obj): game whose mothership and powerup frame are drawn
+        '''
+        self.static.fill((0,0,0))
+        self.static.blit(Boundary.back_ground, view.point(0, 0), view.area().move(-view.x, -view.y))
+        pygame.draw.rect(self.static, (255,255,255), view.rect(*sim.powerup_bar), view.length(2))  # empty rect for powerup display
+        self.static.blit(Mothership.image, view.point(sim.mothership.x, sim.mothership.y))
+        self.full_redraw = True
+
+    def restore(self):
+        '''Erase everything drawn on the previous frame by copying back the static layer'''
+        if self.full_redraw:
+            self.window.blit(self.static, (0,0))
+        else:
+            for rect in self.previous_rects:
+                self.window.blit(self.static, rect, rect)
+
+    def update(self, rects):
+        '''Push the restored and newly drawn areas to the display
+
+        Args
+            rects (list): areas drawn to this frame, None entries are ignored
+        '''
+        rects = [rect for rect in rects if rect]
+        if self.full_redraw:
+            self.display.update()
+            self.full_redraw = False
+            self.updated_area = 1
+        else:
+            dirty = self.previous_rects + rects
+            self.display.update(dirty)
+            width, height = self.window.get_size()
+            self.updated_area = sum(rect.width * rect.height for rect in dirty) / (width * height)
+        self.previous_rects = rects
+
+
+class FrameProfiler:
+    '''Records how long each phase of the game loop takes, frame by frame, in fixed size ring buffers.
+
+    Timing is done with laps: lap() closes the phase that began at the previous lap (or at begin_frame), so
+    every moment of a frame is attributed to exactly one phase. A phase may run several times in one frame,
+    e.g. once per simulation tick, each run is kept as its own span for the trace and summed for the frame.
+
+    Class Attributes
+        phases (list): names of phases in game loop order
+        graph_size (tuple): width and height in pixels of the overlay
+
+    Args
+        frames (int): number of most recent frames kept
+        spans (int): number of most recent phase spans kept for trace export
+
+    Attributes
+        phase_index (dict): position of each phase name in phases
+        origin (float): perf_counter time that trace timestamps are relative to
+        mark (float): time at which the current phase began
+        frame_count (int): number of frames completed
+        frame_starts (list): ring buffer of frame start times
+        frame_times (list): ring buffer of frame durations in seconds
+        phase_times (list): ring buffer of per phase totals in seconds, one list per frame
+        entity_counts (list): ring buffer of (asteroids, shots, explosions) counts at the end of each frame
+        span_count (int): number of spans recorded
+        span_phases (list): ring buffer of the phase index of each span
+        span_starts (list): ring buffer of span start times
+        span_times (list): ring buffer of span durations in seconds
+        show_overlay (bool): draw the frame time graph and entity counts on screen
+        panel (pygame Surface): translucent surface the overlay is drawn onto, created on first draw
+    '''
+    phases = ['clock.tick', 'input', 'shots', 'spawns', 'powerups', 'collisions', 'advance', 'sound', 'checkpoint',
+              'stream', 'redraw', 'display.update', 'capture', 'event pump']
+    graph_size = (240, 110)
+
+    def __init__(self, frames=600, spans=16384):
+        self.phase_index = {phase: i for i, phase in enumerate(self.phases)}
+        self.origin = time.perf_counter()
+        self.mark = self.origin
+        self.frame_count = 0
+        self.frame_starts = [0.0] * frames                         # everything is allocated up front so recording
+        self.frame_times = [0.0] * frames                          # a frame never allocates
+        self.phase_times = [[0.0] * len(self.phases) for _ in range(frames)]
+        self.entity_counts = [[0, 0, 0] for _ in range(frames)]
+        self.span_count = 0
+        self.span_phases = [0] * spans
+        self.span_starts = [0.0] * spans
+        self.span_times = [0.0] * spans
+        self.show_overlay = False
+        self.panel = None
+
+    def begin_frame(self):
+        '''Start timing a new frame'''
+        slot = self.frame_count % len(self.frame_times)
+        self.mark = self.frame_starts[slot] = time.perf_counter()
+        totals = self.phase_times[slot]
+        for i in range(len(totals)):
+            totals[i] = 0.0
+
+    def lap(self, phase):
+        '''End the current phase, attributing the time since the previous lap to it
+
+        Args
+            phase (str): name of phase that just finished, one of phases
+        '''
+        now = time.perf_counter()
+        index = self.phase_index[phase]
+        span = self.span_count % len(self.span_times)
+        self.span_phases[span] = index
+        self.span_starts[span] = self.mark
+        self.span_times[span] = now - self.mark
+        self.span_count += 1
+        self.phase_times[self.frame_count % len(self.frame_times)][index] += now - self.mark
+        self.mark = now
+
+    def end_frame(self):
+        '''Finish the current frame and record the number of live entities'''
+        slot = self.frame_count % len(self.frame_times)
+        self.frame_times[slot] = time.perf_counter() - self.frame_starts[slot]
+        counts = self.entity_counts[slot]
+        counts[0] = len(Asteroid.asteroid_lst)
+        counts[1] = len(ShooterObject.shots_queue)
+        counts[2] = len(Explosion.explosion_lst)
+        self.frame_count += 1
+
+    def recent_frames(self, amount=None):
+        '''Ring buffer slots of the most recent completed frames
+
+        Args
+            amount (int): maximum number of frames, all kept frames if None
+
+        Returns
+            list: slots from oldest to newest
+        '''
+        kept = min(self.frame_count, len(self.frame_times))
+        if amount is not None:
+            kept = min(kept, amount)
+        return [(self.frame_count - kept + i) % len(self.frame_times) for i in range(kept)]
+
+    def slowest_phase(self, slot):
+        '''Phase that took the most time in a frame, leaving out time spent waiting in clock.tick
+
+        Args
+            slot (int): ring buffer slot of frame
+
+        Returns
+            tuple: name of phase and its time in seconds
+        '''
+        totals = self.phase_times[slot]
+        index = max(range(1, len(totals)), key=totals.__getitem__)
+        return self.phases[index], totals[index]
+
+    def draw_overlay(self, window):
+        '''Draw a graph of recent frame times along with entity counts in the top left corner of the screen.
+        Frames are drawn green if they're within the 60 FPS budget (the white line), red otherwise.
+
+        Args
+            window (pygame Surface): surface to draw onto
+
+        Returns
+            pygame Rect: area drawn to
+        '''
+        if self.panel is None:
+            self.panel = pygame.Surface(self.graph_size).convert()
+            self.panel.set_alpha(200)                              # translucent so the game can still be seen
+        width, height = self.graph_size
+        graph_height = 60
+        ms_per_pixel = 33.3 / graph_height                         # graph tops out at two frame budgets
+        self.panel.fill((0,0,0))
+        for i, slot in enumerate(self.recent_frames(width // 2)):
+            frame_ms = (self.frame_times[slot] - self.phase_times[slot][0]) * 1000      # work done, not sleeping
+            bar = min(graph_height, round(frame_ms / ms_per_pixel))
+            color = (60, 220, 60) if frame_ms <= 1000 / 60 else (230, 50, 50)
+            pygame.draw.rect(self.panel, color, (i*2, height - bar, 2, bar))
+        budget_y = height - round((1000 / 60) / ms_per_pixel)
+        pygame.draw.line(self.panel, (255,255,255), (0, budget_y), (width, budget_y))
+
+        font = assets.font('comicsans', 20)
+        latest = self.recent_frames(1)
+        if latest:
+            slot = latest[0]
+            phase, phase_time = self.slowest_phase(slot)
+            asteroids, shots, explosions = self.entity_counts[slot]
+            lines = [f'frame {(self.frame_times[slot] - self.phase_times[slot][0]) * 1000:.1f} ms  '
+                     f'{phase} {phase_time * 1000:.1f} ms',
+                     f'asteroids {asteroids}  shots {shots}  explosions {explosions}']
+            for i, line in enumerate(lines):
+                self.panel.blit(font.render(line, 1, (255,255,255)), (4, 2 + i*18))
+        return window.blit(self.panel, view.point(5, 5))
+
+    def export_trace(self, path):
+        '''Write the kept frames and spans to a Chrome trace event file, which can be opened in
+        chrome://tracing or https://ui.perfetto.dev
+
+        Args
+            path (str): file to write to
+        '''
+        events = [{'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': 1, 'args': {'name': 'game loop'}}]
+        first_frame = None
+        for slot in self.recent_frames():
+            start = self.frame_starts[slot]
+            first_frame = start if first_frame is None else first_frame
+            asteroids, shots, explosions = self.entity_counts[slot]
+            events.append({'name': 'frame', 'ph': 'X', 'pid': 1, 'tid': 1, 'ts': (start - self.origin) * 1e6,
+                           'dur': self.frame_times[slot] * 1e6})
+            events.append({'name': 'entities', 'ph': 'C', 'pid': 1, 'ts': (start - self.origin) * 1e6,
+                           'args': {'asteroids': asteroids, 'shots': shots, 'explosions': explosions}})
+        kept = min(self.span_count, len(self.span_times))
+        for i in range(kept):
+            span = (self.span_count - kept + i) % len(self.span_times)
+            if first_frame is None or self.span_starts[span] < first_frame:
+                continue                                            # frame it belonged to has been overwritten
+            events.append({'name': self.phases[self.span_phases[span]], 'ph': 'X', 'pid': 1, 'tid': 1,
+                           'ts': (self.span_starts[span] - self.origin) * 1e6, 'dur': self.span_times[span] * 1e6})
+        with open(path, 'w') as outfile:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, outfile)
+
+
+class QualityGovernor:
+    '''Lowers the drawing quality while frames take longer to draw than the frame budget, and raises it again once
+    there is headroom.
+
+    The simulation always runs at Simulation.tick_rate, so slow frames don't slow the game down, they make it
+    stutter as every frame catches up several ticks at once, until max_ticks_per_frame is reached and the game does
+    slow down. The governor measures how long every frame was busy, the frame time less the time clock.tick() slept,
+    and at the end of every window of frames compares the 90th percentile with the budget. Each level sheds drawing
+    work on top of the levels above it; what is drawn changes, the game never does.
+
+    Class Attributes
+        levels (list): name of each quality level, full quality first
+        step_down (float): fraction of the budget the 90th percentile busy time may reach before quality is lowered
+        step_up (float): fraction of the budget the 90th percentile busy time has to stay under to raise quality
+        background_interval (int): frames between full background redraws at the lowest level
+
+    Args
+        budget (float): seconds a frame may take, e.g. 1/fps
+        window (int): number of frames per decision
+        up_windows (int): windows in a row with headroom before quality is raised again
+        history_size (int): number of level changes kept
+
+    Attributes
+        budget (float): storage of input argument budget
+        window (int): storage of input argument window
+        up_windows (int): storage of input argument up_windows
+        level (int): current quality level, an index into levels
+        redraw_interval (int): frames between full background redraws at the current level
+        busy (list): busy seconds of every frame of the current window
+        headroom (int): windows in a row that had headroom
+        history (deque): level changes as (seconds since the governor was created, new level, 90th percentile
+            busy time in ms of the window that caused it)
+        origin (float): perf_counter time the governor was created
+        frames (int): number of frames measured
+    '''
+    levels = ['full', 'no asteroid health bars', 'half explosion frames', 'no score popups', 'slow background']
+    step_down = 0.9
+    step_up = 0.5
+    background_interval = 4
+
+    def __init__(self, budget, window=30, up_windows=4, history_size=100):
+        self.budget = budget
+        self.window = window
+        self.up_windows = up_windows
+        self.level = 0
+        self.redraw_interval = 1
+        self.busy = []
+        self.headroom = 0
+        self.history = collections.deque(maxlen=history_size)
+        self.origin = time.perf_counter()
+        self.frames = 0
+        self.apply()
+
+    def update(self, profiler):
+        '''Measure the frame the profiler just finished and change the level at the end of a window
+
+        Args
+            profiler (FrameProfiler obj): profiler of the game loop, end_frame() must have been called
+        '''
+        slot = (profiler.frame_count - 1) % len(profiler.frame_times)
+        slept = profiler.phase_times[slot][profiler.phase_index['clock.tick']]
+        self.busy.append(profiler.frame_times[slot] - slept)
+        self.frames += 1
+        if len(self.busy) < self.window:
+            return
+        busy = sorted(self.busy)[int(len(self.busy) * 0.9)]            # 90th percentile
+        self.busy.clear()
+        if busy > self.budget * QualityGovernor.step_down:
+            self.headroom = 0
+            if self.level < len(QualityGovernor.levels) - 1:
+                self.set_level(self.level + 1, busy)
+        elif busy < self.budget * QualityGovernor.step_up:
+            self.headroom += 1
+            # raising quality costs time again, so only after a while with plenty to spare
+            if self.headroom >= self.up_windows and self.level > 0:
+                self.headroom = 0
+                self.set_level(self.level - 1, busy)
+        else:
+            self.headroom = 0
+
+    def set_level(self, level, busy=0):
+        '''Change the quality level and record the change
+
+        Args
+            level (int): new level, an index into levels
+            busy (float): 90th percentile busy seconds that caused the change
+        '''
+        self.level = level
+        self.history.append((time.perf_counter() - self.origin, level, busy * 1000))
+        self.apply()
+
+    def reset(self):
+        '''Go back to full quality and drop the frames measured so far, for a new game'''
+        self.busy.clear()
+        self.headroom = 0
+        if self.level > 0:
+            self.set_level(0)
+
+    def apply(self):
+        '''Set what is drawn for the current level'''
+        Asteroid.draw_health_bars = self.level < 1
+        Explosion.frame_step = 2 if self.level >= 2 else 1
+        Explosion.show_popups = self.level < 3
+        self.redraw_interval = QualityGovernor.background_interval if self.level >= 4 else 1
+
+    def stats(self):
+        '''Governor statistics
+
+        Returns
+            dict: current level and its name, frames measured and number of level changes kept in history
+        '''
+        return {'level': self.level, 'name': QualityGovernor.levels[self.level], 'frames': self.frames,
+                'changes': len(self.history)}
+
+
+class Autopilot:
+    '''Scripted player input that steers the main sprite underneath the nearest asteroid.
+
+    Can be passed as the policy of Simulation.run() for unattended games. The nearest asteroid is found with the
+    simulation's broadphase grid as it was built on the previous tick.
+
+    Args
+        dead_zone (int): distance in pixels from the target within which the sprite stops moving
+
+    Attributes
+        dead_zone (int): storage of input argument dead_zone
+    '''
+    def __init__(self, dead_zone=5):
+        self.dead_zone = dead_zone
+
+    def __call__(self, sim):
+        '''Choose inputs for the next tick
+
+        Args
+            sim (Simulation obj): simulation about to be stepped
+
+        Returns
+            int: bitmask of INPUT_LEFT and INPUT_RIGHT
+        '''
+        ship_center = sim.main_sprite.x + sim.main_sprite.width/2
+        target = sim.grid.nearest(ship_center, sim.main_sprite.y, Asteroid)
+        if target is None:
+            return 0
+        target_center = target.x + target.width/2
+        if target_center < ship_center - self.dead_zone:
+            return INPUT_LEFT
+        if target_center > ship_center + self.dead_zone:
+            return INPUT_RIGHT
+        return 0
+
+
+class Replay:
+    '''Seed, difficulty settings and per-tick inputs of one game, stored in a compact binary file.
+
+    The simulation is deterministic for a given seed, settings and input sequence, so a replay can re-run a
+    recorded game headless as fast as the CPU allows and check that it ends with the same score and mothership
+    health. Inputs take two bits per tick, four ticks to a byte.
+
+    Class Attributes
+        magic (bytes): identifies replay files
+        header (Struct): magic, seed, playfield width and height, number of ticks, difficulty setting,
+            maximum asteroid amount, shot rate, final score and final mothership health
+
+    Args
+        seed (int): seed of the recorded game's random number generator
+        width (int): width of the recorded game's playfield
+        height (int): height of the recorded game's playfield
+
+    Attributes
+        seed (int): storage of input argument seed
+        width (int): storage of input argument width
+        height (int): storage of input argument height
+        current_setting (int): Asteroid.current_setting of the recorded game
+        maximum_asteroid_amount (int): Asteroid.maximum_asteroid_amount of the recorded game
+        shot_rate (int): ShooterObject.shot_rate of the recorded game
+        inputs (bytearray): inputs of every tick, one byte each
+        final_score (int): score at the end of the recorded game
+        final_health (int): mothership health at the end of the recorded game
+    '''
+    magic = b'IER4'
+    header = struct.Struct('<4sQHHIBHHii')
+
+    def __init__(self, seed=0, width=500, height=700):
+        self.seed = seed
+        self.width = width
+        self.height = height
+        self.current_setting = Asteroid.current_setting
+        self.maximum_asteroid_amount = Asteroid.maximum_asteroid_amount
+        self.shot_rate = ShooterObject.shot_rate
+        self.inputs = bytearray()
+        self.final_score = 0
+        self.final_health = 0
+
+    def record(self, inputs):
+        '''Add the inputs of one tick
+
+        Args
+            inputs (int): bitmask of INPUT_LEFT and INPUT_RIGHT
+        '''
+        self.inputs.append(inputs & 3)
+
+    def finish(self, sim):
+        '''Store the final score and mothership health of the recorded game
+
+        Args
+            sim (Simulation obj): simulation that was recorded
+        '''
+        self.final_score = sim.score.score
+        self.final_health = sim.mothership.health_amt
+
+    def save(self, path):
+        '''Write replay to a binary file
+
+        Args
+            path (str): path of replay file
+        '''
+        packed = bytearray((len(self.inputs) + 3) // 4)
+        for tick, inputs in enumerate(self.inputs):
+            packed[tick // 4] |= inputs << (2 * (tick % 4))
+        with open(path, 'wb') as outfile:
+            outfile.write(self.header.pack(self.magic, self.seed, self.width, self.height, len(self.inputs),
+                                           self.current_setting, self.maximum_asteroid_amount, self.shot_rate,
+                                           self.final_score, self.final_health))
+            outfile.write(packed)
+
+    def load(self, path):
+        '''Read replay from a binary file written by save()
+
+        Args
+            path (str): path of replay file
+        '''
+        with open(path, 'rb') as infile:
+            data = infile.read()
+        if data[:4] != self.magic:                                  # older replays can't be unpacked with this header
+            raise ValueError(f'{path} is not a replay file')
+        (magic, self.seed, self.width, self.height, ticks, self.current_setting, self.maximum_asteroid_amount,
+         self.shot_rate, self.final_score, self.final_health) = self.header.unpack_from(data)
+        packed = data[self.header.size:]
+        self.inputs = bytearray((packed[tick // 4] >> (2 * (tick % 4))) & 3 for tick in range(ticks))
+
+    def play(self, vectorized_collisions=False):
+        '''Re-run the recorded game headless as fast as possible
+
+        Difficulty settings are set to the recorded ones, which changes the class attributes they live in.
+
+        Args
+            vectorized_collisions (bool): resolve shot collisions with the numpy VectorCollisions backend
+
+        Returns
+            Simulation obj: simulation after the last recorded tick
+        '''
+        Asteroid.current_setting = self.current_setting
+        Asteroid.maximum_asteroid_amount = self.maximum_asteroid_amount
+        ShooterObject.shot_rate = self.shot_rate
+        sim = Simulation(self.width, self.height, vectorized_collisions, self.seed)
+        for inputs in self.inputs:
+            sim.step(inputs)
+        return sim
+
+    def verify(self, vectorized_collisions=False):
+        '''Re-run the recorded game and check that it ends the same way
+
+        Args
+            vectorized_collisions (bool): resolve shot collisions with the numpy VectorCollisions backend
+
+        Returns
+            bool: True if the final score and mothership health match the recording
+        '''
+        sim = self.play(vectorized_collisions)
+        return (sim.score.score == self.final_score) and (sim.mothership.health_amt == self.final_health)
+
+
+class Checkpoint:
+    '''Complete state of a game at the end of a tick, packed into one compact binary string.
+
+    Unlike a Replay, a checkpoint doesn't need the game to be re-run from its start: restoring it puts a
+    simulation back exactly where it was, including its random number generator and every scheduled event, so
+    the game continues as if it had never been left. Asteroid and shot columns are copied as raw bytes and
+    everything else is a handful of small integer arrays, so capturing or restoring a checkpoint takes tens of
+    microseconds. Difficulty settings are class attributes and aren't part of a checkpoint; call
+    Simulation.difficulty_changed() after restoring one under different settings.
+
+    Class Attributes
+        magic (bytes): identifies checkpoints and checkpoint files
+        header (Struct): magic, seed, playfield size, tick, score and its position, mothership health and damage,
+            main sprite position, movement state and animation frames, powerup cooldowns, asteroids destroyed,
+            game over, timed powerup state, scheduler counters, random number generator version and gauss value,
+            then the number of asteroids, shots, explosions, health powerups, timed powerups and events
+        rng_words (int): length of the Mersenne Twister state
+        sprite_states (list): (left, right, center) combinations of the main sprite
+        keys (list): most recent key values in the order they are encoded
+        methods (list): explosion destruction methods in the order they are encoded
+        explosion_fields (list): integer attributes of explosions
+        health_fields (list): integer attributes of health powerups
+        timed_fields (list): integer attributes of timed powerups
+        callbacks (list): names of the callbacks events may have, in the order they are encoded
+
+    Attributes
+        data (bytes): packed state, None until captured or loaded
+        tick (int): tick the state was captured at
+    '''
+    magic = b'IEC1'
+    header = struct.Struct('<4sQHHIiiBiiiiBBIBiiIBBBIIIBBd6H')
+    rng_words = 625
+    sprite_states = [(False, False, True), (False, True, False), (True, False, False)]
+    keys = [None, 'l', 'r']
+    methods = [None, 'negative health', 'off screen']
+    explosion_fields = ['x', 'y', 'current_frame', 'ast_width', 'score_increase', 'count']
+    health_fields = ['x', 'y', 'prev_y', 'health_add', 'velocity', 'display_end', 'activated', 'text_visible']
+    timed_fields = ['x', 'y', 'prev_y', 'velocity', 'display_end', 'effect_timer', 'powerup_duration', 'text_visible',
+                    'bar_height']
+    callbacks = ['spawn_asteroid', 'spawn_health_powerup', 'spawn_timed_powerup', 'end_timed_powerup',
+                 'end_health_powerup', 'release']
+
+    def __init__(self):
+        self.data = None
+        self.tick = -1
+
+    def capture(self, sim):
+        '''Pack the current state of a simulation, replacing anything captured before
+
+        Args
+            sim (Simulation obj): simulation to capture, between ticks
+        '''
+        sim.check_live()
+        version, internal, gauss = sim.rng.getstate()
+        sprite = sim.main_sprite
+        option = TimedPowerUp.current_option
+        events = sorted(event for event in sim.events.heap if event[2] is not None)   # cancelled events never run
+        explosions = Explosion.explosion_lst
+        health_powerups = Health_PowerUp.current_powerups
+        timed_powerups = TimedPowerUp.current_powerups
+        parts = [self.header.pack(
+            self.magic, sim.seed, sim.width, sim.height, sim.count, sim.score.score, sim.score.x, sim.score.score_length,
+            sim.mothership.health_amt, sim.mothership.damage_taken, sprite.x, sprite.prev_x,
+            self.sprite_states.index((sprite.left, sprite.right, sprite.center)), sim.center_frame,
+            sim.left_right_frame, self.keys.index(sim.most_recent_key), sim.powerup_health_timer, sim.powerup_timer,
+            sim.asteroids_destroyed, sim.game_over, TimedPowerUp.activated,
+            TimedPowerUp.power_up_options.index(option) if option in TimedPowerUp.power_up_options else 255,
+            sim.events.order, sim.events.fired, sim.events.cancelled, version, gauss is not None, gauss or 0.0,
+            len(Asteroid.asteroid_lst), len(ShooterObject.shots_queue), len(explosions), len(health_powerups),
+            len(timed_powerups), len(events))]
+        parts.append(array.array('I', internal).tobytes())
+
+        n = Asteroid.store.count
+        for column in Asteroid.store.columns.values():
+            parts.append(column[:n].tobytes())
+        parts.append(bytes([ast.color_option for ast in Asteroid.asteroid_lst]))
+        n = ShooterObject.store.count
+        for column in ShooterObject.store.columns.values():
+            parts.append(column[:n].tobytes())
+
+        parts.append(array.array('i', [getattr(exp, name) for name in self.explosion_fields for exp in explosions]).tobytes())
+        parts.append(bytes([self.methods.index(exp.method) for exp in explosions]))
+        parts.append(array.array('i', [getattr(powerup, name) for name in self.health_fields
+                                       for powerup in health_powerups]).tobytes())
+        parts.append(array.array('i', [getattr(powerup, name) for name in self.timed_fields
+                                       for powerup in timed_powerups]).tobytes())
+        parts.append(bytes([TimedPowerUp.power_up_options.index(powerup.p_type) for powerup in timed_powerups]))
+
+        packed = array.array('i')
+        for tick, order, callback, args in events:
+            name = callback.__name__
+            if name == 'spawn_timed_powerup':
+                arg = TimedPowerUp.power_up_options.index(args[0])
+            elif name == 'end_timed_powerup':
+                arg = timed_powerups.index(args[0])
+            elif name == 'end_health_powerup':
+                arg = health_powerups.index(args[0])
+            elif name == 'release':
+                arg = args[0].pool_index                                    # Explosion.pool.release
+            else:
+                arg = -1
+            packed.extend((tick, order, self.callbacks.index(name), arg))
+        parts.append(packed.tobytes())
+        self.data = b''.join(parts)
+        self.tick = sim.count
+
+    def restore(self, sim):
+        '''Put a simulation back into the captured state. The entity lists are shared by every simulation, so
+        only the most recently created one can be restored into
+
+        Args
+            sim (Simulation obj): simulation with the same playfield size as the captured one
+        '''
+        sim.check_live()
+        data = self.data
+        (_, seed, width, height, sim.count, sim.score.score, sim.score.x, sim.score.score_length,
+         sim.mothership.health_amt, sim.mothership.damage_taken, x, prev_x, sprite_state, sim.center_frame,
+         sim.left_right_frame, key, sim.powerup_health_timer, sim.powerup_timer, sim.asteroids_destroyed, game_over,
+         activated, option, order, fired, cancelled, version, has_gauss, gauss, asteroid_count, shot_count,
+         explosion_count, health_count, timed_count, event_count) = self.header.unpack_from(data)
+        if (width, height) != (sim.width, sim.height):
+            raise ValueError(f'checkpoint of a {width}x{height} playfield, simulation is {sim.width}x{sim.height}')
+        offset = self.header.size
+        internal = array.array('I', data[offset:offset + 4*self.rng_words])
+        offset += 4*self.rng_words
+
+        asteroids = Asteroid.pool.restore(asteroid_count)
+        for column in Asteroid.store.columns.values():
+            size = column.itemsize * asteroid_count
+            column[:asteroid_count] = array.array(column.typecode, data[offset:offset + size])
+            offset += size
+        for ast, color_option in zip(asteroids, data[offset:offset + asteroid_count]):
+            ast.color_option = color_option
+            ast.destruction_method = None
+        offset += asteroid_count
+        shots = ShooterObject.pool.restore(shot_count)
+        for shot in shots:
+            shot.reset('normal', 0, 0)                                      # columns are overwritten next
+        for column in ShooterObject.store.columns.values():
+            size = column.itemsize * shot_count
+            column[:shot_count] = array.array(column.typecode, data[offset:offset + size])
+            offset += size
+
+        size = 4 * explosion_count * len(self.explosion_fields)
+        values = array.array('i', data[offset:offset + size])
+        offset += size
+        explosions = Explosion.pool.restore(explosion_count)
+        for i, exp in enumerate(explosions):
+            exp.reset(0, 0, 0, self.methods[data[offset + i]])
+            for field, name in enumerate(self.explosion_fields):
+                setattr(exp, name, values[field*explosion_count + i])
+        offset += explosion_count
+
+        size = 4 * health_count * len(self.health_fields)
+        values = array.array('i', data[offset:offset + size])
+        offset += size
+        Health_PowerUp.current_powerups[:] = []
+        for i in range(health_count):
+            powerup = Health_PowerUp(sim.rng, sim.width)                    # random choices are undone with the rng
+            for field, name in enumerate(self.health_fields):
+                setattr(powerup, name, values[field*health_count + i])
+            powerup.activated = bool(powerup.activated)
+            powerup.text_visible = bool(powerup.text_visible)
+
+        size = 4 * timed_count * len(self.timed_fields)
+        values = array.array('i', data[offset:offset + size])
+        offset += size
+        TimedPowerUp.current_powerups[:] = []
+        for i in range(timed_count):
+            powerup = TimedPowerUp(TimedPowerUp.power_up_options[data[offset + i]], sim.rng, sim.width)
+            for field, name in enumerate(self.timed_fields):
+                setattr(powerup, name, values[field*timed_count + i])
+            powerup.text_visible = bool(powerup.text_visible)
+        offset += timed_count
+        TimedPowerUp.activated = bool(activated)
+        TimedPowerUp.current_option = TimedPowerUp.power_up_options[option] if option != 255 else None
+
+        values = array.array('i', data[offset:offset + 16*event_count])
+        events = sim.events
+        events.heap = []
+        sim.asteroid_event = None
+        sim.health_powerup_event = None
+        sim.timed_powerup_events = {}
+        for i in range(0, 4*event_count, 4):
+            tick, event_order, code, arg = values[i:i + 4]
+            name = self.callbacks[code]
+            if name == 'spawn_timed_powerup':
+                args = (TimedPowerUp.power_up_options[arg],)
+            elif name == 'end_timed_powerup':
+                args = (TimedPowerUp.current_powerups[arg],)
+            elif name == 'end_health_powerup':
+                args = (Health_PowerUp.current_powerups[arg],)
+            elif name == 'release':
+                args = (explosions[arg],)
+            else:
+                args = ()
+            event = [tick, event_order, Explosion.pool.release if name == 'release' else getattr(sim, name), args]
+            events.heap.append(event)
+            if name == 'spawn_asteroid':
+                sim.asteroid_event = event                                  # so that it can still be cancelled
+            elif name == 'spawn_health_powerup':
+                sim.health_powerup_event = event
+            elif name == 'spawn_timed_powerup':
+                sim.timed_powerup_events[args[0]] = event
+        # sorted by tick and order, which is already a valid heap
+        events.order, events.fired, events.cancelled = order, fired, cancelled
+
+        sprite = sim.main_sprite
+        sprite.x, sprite.prev_x = x, prev_x
+        sprite.left, sprite.right, sprite.center = self.sprite_states[sprite_state]
+        sim.most_recent_key = self.keys[key]
+        sim.mothership.update_damage()
+        sim.seed = seed
+        sim.game_over = bool(game_over)
+        sim.new_explosions = []
+        sim.rng.setstate((version, tuple(internal), gauss if has_gauss else None))
+
+    def save(self, path):
+        '''Write checkpoint to a binary file
+
+        Args
+            path (str): path of checkpoint file
+        '''
+        with open(path, 'wb') as outfile:
+            outfile.write(self.data)
+
+    def load(self, path):
+        '''Read checkpoint from a binary file written by save()
+
+        Args
+            path (str): path of checkpoint file
+        '''
+        with open(path, 'rb') as infile:
+            data = infile.read()
+        if data[:4] != self.magic:
+            raise ValueError(f'{path} is not a checkpoint file')
+        self.data = data
+        self.tick = self.header.unpack_from(data)[4]
+
+
+class CheckpointRing:
+    '''Checkpoints of the most recent part of a game, taken at a fixed interval into a fixed number of slots.
+
+    The oldest checkpoint is overwritten once every slot is full, so memory use doesn't grow however long a game
+    runs. Rewinding restores the newest checkpoint that is at least the requested time back and forgets the
+    checkpoints after it, since the game takes a different course from there.
+
+    Args
+        slots (int): number of checkpoints kept
+        interval (int): ticks between checkpoints
 
     Attributes
-        width (int): width of character image in pixels
-        height (int): height of character image in pixels
-        x (int): initial x coordinate position of character
-        y (int): initial y coordinate position of character
-        velocity (int): rate at which character moves from left to right
-        left (bool): indicate initial movement setting (for image displaying purposes)
-        right (bool): indicate initial movement setting
-        center (bool): indicate initial movement setting
+        interval (int): storage of input argument interval
+        slots (list): Checkpoint objects, reused round robin
+        count (int): number of checkpoints taken that haven't been rewound past
+        oldest (int): number of the oldest checkpoint that hasn't been overwritten
+        capture_time (float): seconds spent capturing checkpoints
+        captures (int): number of checkpoints captured
+        restore_time (float): seconds spent restoring checkpoints
+        restores (int): number of checkpoints restored
     '''
-    # images used when no keys are pressed
-    center_images = [pygame.image.load('main_sprite/planes_02A-center1.png'), pygame.image.load('main_sprite/planes_02A-center2.png'), pygame.image.load('main_sprite/planes_02A-center3.png'), pygame.image.load('main_sprite/planes_02A-center4.png')]
-    # images used inbetween full strafe right
-    strafing_right_images = [pygame.image.load('main_sprite/planes_02A-strafe_right5.png'),pygame.image.load('main_sprite/planes_02A-strafe_right6.png'),pygame.image.load('main_sprite/planes_02A-strafe_right7.png'),pygame.image.load('main_sprite/planes_02A-strafe_right8.png')]
-    # images used at full right strafe
-    strafe_right_on = [pygame.image.load('main_sprite/planes_02A-R9.png'), pygame.image.load('main_sprite/planes_02A-R10.png'), pygame.image.load('main_sprite/planes_02A-R11.png'), pygame.image.load('main_sprite/planes_02A-R12.png')]
-    # images used inbetween full strafe left
-    strafing_left_images = [pygame.image.load('main_sprite/planes_02A-strafe_left5.png'), pygame.image.load('main_sprite/planes_02A-strafe_left6.png'), pygame.image.load('main_sprite/planes_02A-strafe_left7.png'), pygame.image.load('main_sprite/planes_02A-strafe_left8.png')]
-    # images used at full left strafe
-    strafe_left_on = [pygame.image.load('main_sprite/planes_02A-L9.png'), pygame.image.load('main_sprite/planes_02A-L10.png'), pygame.image.load('main_sprite/planes_02A-L11.png'), pygame.image.load('main_sprite/planes_02A-L12.png')]
+    def __init__(self, slots=30, interval=60):
+        self.interval = interval
+        self.slots = [Checkpoint() for _ in range(slots)]
+        self.count = 0
+        self.oldest = 0
+        self.capture_time = 0
+        self.captures = 0
+        self.restore_time = 0
+        self.restores = 0
 
-    def __init__(self):
-        self.width = 96
-        self.height = 96
-        self.x = 200
-        self.y = 540
-        self.velocity = 5
-        self.left = False                                           # Initial movement position states of sprite
-        self.right = False                                          
-        self.center = True
-    
-    def draw(self, left_right_frame, center_frame, most_recent_key, window):
-        '''Draw the mainsprite to the screen
+    def record(self, sim):
+        '''Capture a checkpoint if one is due. Called after every tick
 
         Args
-            left_right_frame (int): incrementing number that controls which frame is selected for displaying when moving right/left
-            center_frame (int): incrementing number that controls which frame is selected when not turning
-            most_recent_key (str): most recently pressed movement key. 
-            window (Boundary obj): screen on which image is displayed
+            sim (Simulation obj): simulation being played
+        '''
+        if sim.count % self.interval:
+            return
+        start = time.perf_counter()
+        self.slots[self.count % len(self.slots)].capture(sim)
+        self.count += 1
+        self.oldest = max(self.oldest, self.count - len(self.slots))
+        self.capture_time += time.perf_counter() - start
+        self.captures += 1
+
+    def kept(self):
+        '''Checkpoints that can be restored, oldest first
 
+        Returns
+            list: Checkpoint objects
         '''
-        if self.center == True:
-            if left_right_frame < 4:
-                if most_recent_key == 'r':
-                    window.blit(self.strafing_right_images[left_right_frame], 
-                               (self.x, self.y))        # level out spaceship upon returning to center
-                elif most_recent_key == 'l':
-                    window.blit(self.strafing_left_images[left_right_frame], 
-                               (self.x, self.y))        # level out spacehip upon returning to center
-            else:    
-                window.blit(self.center_images[center_frame], 
-                           (self.x, self.y))            # iterate through displaying center images
+        return [self.slots[i % len(self.slots)] for i in range(self.oldest, self.count)]
 
-        elif self.right == True:
-            if left_right_frame < 4:                    # first 4 frames are transition state
-                window.blit(self.strafing_right_images[left_right_frame], 
-                           (self.x, self.y))            # draw strafe right transition
-            else:
-                window.blit(self.strafe_right_on[left_right_frame % 4], 
-                           (self.x, self.y))            # draw final strafe right
-            
-        elif self.left == True:
-            if left_right_frame < 4:                    # first 4 frames are transition state
-                window.blit(self.strafing_left_images[left_right_frame], 
-                           (self.x, self.y))            # draw strafe left transition
-            else:
-                window.blit(self.strafe_left_on[left_right_frame % 4], 
-                           (self.x, self.y))            # draw final strafe left
-        
-    def move_left(self, boundary):
-        '''Move character in the left direction by velocity amount
-        Args
-            boundary (Boundary obj): Boundary width is used to know movement limit
+    def latest(self):
+        '''Newest checkpoint
+
+        Returns
+            Checkpoint obj: newest checkpoint, None if there isn't one
         '''
-        if self.x > 0:                                  # keeping x coordinate within the bounds of the screen
-            self.x = self.x - self.velocity             # move by velocity amt
+        return self.slots[(self.count - 1) % len(self.slots)] if self.count else None
+
+    def rewind(self, sim, seconds):
+        '''Put a simulation back to the newest checkpoint at least some time before its current tick, or to the
+        oldest checkpoint kept if there isn't one that far back
 
-    def move_right(self, boundary):
-        '''Move character in the right direction by velocity amount
-        
         Args
-            boundary (Boundary obj): Boundary width is used to know movement limit 
+            sim (Simulation obj): simulation the checkpoints were taken from
+            seconds (float): game time to go back
+
+        Returns
+            int: tick rewound to, None if there are no checkpoints
         '''
-        if self.x < boundary.width - self.width:
-            self.x = self.x + self.velocity
+        kept = self.kept()
+        if not kept:
+            return None
+        target = sim.count - round(seconds * Simulation.tick_rate)
+        index = len(kept) - 1
+        while index > 0 and kept[index].tick > target:
+            index -= 1
+        start = time.perf_counter()
+        kept[index].restore(sim)
+        self.restore_time += time.perf_counter() - start
+        self.restores += 1
+        self.count -= len(kept) - 1 - index                     # later checkpoints belong to the abandoned course
+        return sim.count
 
-    def shoot(self, shot_type):
-        '''Generate ShooterObject object at the center position of the main sprite
+    def stats(self):
+        '''Checkpoint statistics
 
-        Args
-            shot_type (str): specifies the type of shot generated. Could be used to change shot types in future use.
+        Returns
+            dict: checkpoints kept, oldest and newest tick, bytes held and mean microseconds per capture and restore
         '''
-        # generate shot object at current sprite location, in the middle of the sprite
-        ShooterObject.shots_queue.append(ShooterObject(shot_type, (self.x + (self.width/2)), self.y)) 
+        kept = self.kept()
+        return {'kept': len(kept), 'oldest_tick': kept[0].tick if kept else None,
+                'newest_tick': kept[-1].tick if kept else None, 'bytes': sum(len(point.data) for point in kept),
+                'capture_us': self.capture_time / max(1, self.captures) * 1e6,
+                'restore_us': self.restore_time / max(1, self.restores) * 1e6}
 
 
-class Asteroid:
-    '''Asteroid class generates asteroids images above the display height and progresses them downward
+class Snapshot:
+    '''Everything needed to draw one tick of a game, held as blocks of small integers.
+
+    Snapshots are streamed to spectators, so they only carry what is drawn: positions, sizes, health bars,
+    animation frames, the score and the mothership's health. Every kind of entity is one block of int16 values,
+    its columns one after another. A block is delta encoded against the same block of the previous tick's
+    snapshot (row i minus row i of the previous tick, rows past the end of the previous block are sent as they
+    are) and the whole snapshot is deflate compressed. Most objects move by the same few pixels every tick, so
+    deltas are mostly repeats that compress to a few bytes. Snapshots are a few hundred bytes, so a 512 byte
+    window is used; setting up zlib's default window costs ~60 microseconds, more than encoding the snapshot.
 
     Class Attributes
-        astoird_images (dict): dictionary of asteroid pygame images with keys specifying the size of the asteroid
-        width_options (list): list containing the various width options
-        ast_diff_setting (dict): dictionary for difficulty setting.
-            Keys are levels of difficult and values are average number of game loops per asteroid generation 
-        current_setting (int): current difficulty setting
-        maximum_asteroid_amount (int): limit on the current number of existing asteroid
+        header (Struct): tick, score, mothership health and damage taken, main sprite x, sprite state
+            (0 center, 1 right, 2 left), left/right frame, center frame, most recent key (0 none, 1 left,
+            2 right), whether a timed powerup is active and the index of the current timed powerup option
+        kinds (list): (name, column names) of every kind of entity, in the order they are encoded
+        count (Struct): number of rows of one kind
+        keys (list): most recent key values in the order they are encoded
+        window_bits (int): zlib wbits of the raw deflate stream
 
     Attributes
-        width (int): width of asteroid choosen
-        color_option (int): color of asteroid choosen
-        y (int): y coordinate of asteroid spawn
-        x (int): x coordinate of asteroid spawn
-        velocity (int): speed at which asteroid progresses down screen
-        damage_taken (int): amount of damage sustained
-        health_amt (int): amount of health
-        damage (int): amount of damage dealt 
-        hbar_length (int): length of health bar
-        initial_health_width (int): length of health bar as a constant
-        destruction method (None): method by which the asteroid has been destroyed
-
+        scalars (tuple): values packed by header
+        blocks (dict): array of int16 values of every kind of entity, column after column
+        counts (dict): number of rows of every kind
     '''
-    asteroid_images = {50:[pygame.image.load('Asteroids/res50.png'),pygame.image.load('Asteroids/res50_1.png'),pygame.image.load('Asteroids/res50_2.png'),pygame.image.load('Asteroids/res50_3.png'),pygame.image.load('Asteroids/res50_4.png')],\
-        60:[pygame.image.load('Asteroids/res60.png'),pygame.image.load('Asteroids/res60_1.png'),pygame.image.load('Asteroids/res60_2.png'),pygame.image.load('Asteroids/res60_3.png'),pygame.image.load('Asteroids/res60_4.png')],\
-            70:[pygame.image.load('Asteroids/res70.png'),pygame.image.load('Asteroids/res70_1.png'),pygame.image.load('Asteroids/res70_2.png'),pygame.image.load('Asteroids/res70_3.png'),pygame.image.load('Asteroids/res70_4.png')],\
-                80:[pygame.image.load('Asteroids/res80.png'),pygame.image.load('Asteroids/res80_1.png'),pygame.image.load('Asteroids/res80_2.png'),pygame.image.load('Asteroids/res80_3.png'),pygame.image.load('Asteroids/res80_4.png')],\
-                    90:[pygame.image.load('Asteroids/res90.png'),pygame.image.load('Asteroids/res90_1.png'),pygame.image.load('Asteroids/res90_2.png'),pygame.image.load('Asteroids/res90_3.png'),pygame.image.load('Asteroids/res90_4.png')],\
-                        100:[pygame.image.load('Asteroids/res100.png'),pygame.image.load('Asteroids/res100_1.png'),pygame.image.load('Asteroids/res100_2.png'),pygame.image.load('Asteroids/res100_3.png'),pygame.image.load('Asteroids/res100_4.png')]}
-    
-    width_options = [x for x in range(50,110,10)]
-    asteroid_lst = []
-    ast_diff_setting = {1:1000, 2:800, 3: 600, 4: 400, 5:200, 6:100, 7:50}
-    current_setting = 6
-    maximum_asteroid_amount = 9
+    header = struct.Struct('<IiiihBBBBBB')
+    kinds = [('asteroids', ['x', 'y', 'width', 'color_option', 'hbar', 'damaged']),
+             ('shots', ['x', 'start_y']),
+             ('health_powerups', ['x', 'y', 'activated', 'text_visible', 'health_add']),
+             ('timed_powerups', ['x', 'y', 'p_type', 'text_visible', 'bar_height']),
+             ('explosions', ['x', 'y', 'current_frame', 'ast_width', 'score_increase', 'text'])]
+    count = struct.Struct('<H')
+    keys = [None, 'l', 'r']
+    window_bits = -9
 
     def __init__(self):
-        self.width = random.choice(Asteroid.width_options)  # randomly choosing width option from width_options
-        self.color_option = random.randint(0,4)             # randomly choosing an index number to pick from various images
-        self.y = self.width*-1                              # spawns asteroids above game window
-        self.x = random.randrange(50, 500 - self.width)     # asteroid spawn anywhere in x direction within game boundaries
-        if self.width < 80:                                 # velocity is loosley tied to width
-            self.velocity = random.randint(2,3)
-        else:
-            self.velocity = random.randint(1,2)                       
-        self.damage_taken = 0                               # the total health remains unchanged and is used to generate health bar ratio
-        self.health_amt = self.width*2                      # health amount is directly related to the size of the asteroid
-        self.damage = self.width * 2                        # damage dealt by asteroid is tied to size 
-        self.hbar_length = round(self.width * 0.75)         # constant length (should add up from the summations of health and damage bar widths)
-        self.hbar = round(self.hbar_length * 
-                         (self.health_amt/(self.health_amt + self.damage_taken))) # hbar length multiplied by percentage remaining
-        self.initial_health_width = self.hbar               # new variable so that changing hbar will not affect the initial length of health bar
-        self.destruction_method = None                      # either destroyed by negative health or making contact with mothership
-        Asteroid.asteroid_lst.append(self)
+        self.scalars = None
+        self.blocks = {}
+        self.counts = {}
+
+    def column(self, kind, name):
+        '''One column of a block
 
-    def draw_asteroid(self, surface):
-        '''Draw asteroid on screen
-        
         Args
-            surface (boundary obj): surface upon which the asteroid is drawn
-        '''
-        surface.blit(Asteroid.asteroid_images[self.width][self.color_option], (self.x, self.y))
+            kind (str): kind of entity, e.g. 'asteroids'
+            name (str): column name listed for that kind in Snapshot.kinds
 
-        # creating damage bar (red)
-        if self.damage_taken > 0:
-            pygame.draw.rect(surface, (255,0,0), (self.x + round(self.width*0.1), round(self.y + self.width/2), 
-                                                                self.initial_health_width, 7)) 
-        # avialable health (green) is dependent on the ratio of health remaining to damage taken
-        pygame.draw.rect(surface, (0,255,0), (self.x + round(self.width*0.1), round(self.y + self.width/2), self.hbar, 7))
-        
-    def update_health_bars(self):
-        '''Update health bars'''
-        self.hbar = round(self.hbar_length * 
-                        (self.health_amt/(self.health_amt + self.damage_taken))) # length multiplied by fraction of health remaining
+        Returns
+            array: int16 values, one per row
+        '''
+        n = self.counts[kind]
+        start = dict(Snapshot.kinds)[kind].index(name) * n
+        return self.blocks[kind][start:start + n]
 
-    def progress_down(self):
-        '''Move asteroids down screen'''
-        self.y += self.velocity
+    def capture(self, sim):
+        '''Record the current state of a simulation
 
-    def generate_explosion(self):
-        '''Generate Explosion object at last coordinates'''
-        Explosion(self.x, self.y, self.width, self.destruction_method) #explosion occurs at asteroids last location
+        Args
+            sim (Simulation obj): simulation to record
+        '''
+        sim.check_live()
+        sprite = sim.main_sprite
+        option = TimedPowerUp.current_option
+        self.scalars = (sim.count, sim.score.score, sim.mothership.health_amt, sim.mothership.damage_taken,
+                        sprite.x, 1 if sprite.right else 2 if sprite.left else 0,
+                        sim.left_right_frame if sim.left_right_frame < 4 else 4 + sim.left_right_frame % 4,   # all draw() looks at
+                        sim.center_frame, Snapshot.keys.index(sim.most_recent_key), int(TimedPowerUp.activated),
+                        TimedPowerUp.power_up_options.index(option) if option in TimedPowerUp.power_up_options else 255)
 
-    def __del__(self):
-        '''Delete Asteroid object'''
-        pass
+        store = Asteroid.store
+        n = store.count
+        columns = store.columns
+        self.fill('asteroids', n, columns['x'][:n].tolist() + columns['y'][:n].tolist() + columns['width'][:n].tolist()
+                  + [ast.color_option for ast in Asteroid.asteroid_lst] + columns['hbar'][:n].tolist()
+                  + [int(damage > 0) for damage in columns['damage_taken'][:n]])
 
+        store = ShooterObject.store
+        n = store.count
+        self.fill('shots', n, list(map(int, store.columns['start_x'][:n])) + store.columns['start_y'][:n].tolist())
 
-class TimedPowerUp:
-    '''TimedPowerUp creates powerups, progresses them down screen, and grants main sprite effects that have a temporal component
+        powerups = Health_PowerUp.current_powerups
+        values = []
+        for name in ['x', 'y', 'activated', 'text_visible', 'health_add']:
+            values.extend([int(getattr(powerup, name)) for powerup in powerups])
+        self.fill('health_powerups', len(powerups), values)
 
-    Class Attributes
-        power_ups (dict): dictionary containing pygame images for the two different powerup images
-        power_up_optiosn (list): list contianing powerup options
-        current_powerups (list): list containing all TimedPowerUp objects that currently exist
-        activated (bool): determination if powerup has been activated
-        current_option (none): power up that was most recently generated
+        powerups = TimedPowerUp.current_powerups
+        values = [powerup.x for powerup in powerups] + [powerup.y for powerup in powerups]
+        values.extend([TimedPowerUp.power_up_options.index(powerup.p_type) for powerup in powerups])
+        values.extend([int(powerup.text_visible) for powerup in powerups])
+        values.extend([powerup.bar_height for powerup in powerups])
+        self.fill('timed_powerups', len(powerups), values)
 
-    Args
-        p_type (str): the name of TimedPowerUp that is being generated
+        explosions = Explosion.explosion_lst
+        values = []
+        for name in ['x', 'y', 'current_frame', 'ast_width', 'score_increase']:
+            values.extend([getattr(exp, name) for exp in explosions])
+        values.extend([int(exp.method == 'negative health') for exp in explosions])
+        self.fill('explosions', len(explosions), values)
 
-    Attributes
-        width (int): width of powerup 
-        height (int): height of powerup 
-        x (int): x coordinate spawn location
-        y (int): y coordinate spawn location
-        velocity (int): movement speed
-        font_color (tuple): RGB value of font color
-        powerup_font (SysFont obj): pygame SysFont() contains font type, font size, and bold
-        powerup_text (pygame text obj): text generated
-        powerup_display_timer (int): timer used to mark how long the effect name is displayed on screen
-        effect_timer (int): timer used to mark long long the effect has been active
-        powerup_duration (int): duration of power up effect
-    '''
+    def fill(self, kind, n, values):
+        '''Store the block of one kind of entity
 
-    power_ups = {'Insta-Kill':pygame.image.load('powerups/icon-powerup.png'), 'Double XP':pygame.image.load('powerups/icon-special.png')}
-    power_up_options = ['Insta-Kill', 'Double XP']
-    current_powerups = []
-    activated = False
-    current_option = None
+        Args
+            kind (str): kind of entity
+            n (int): number of rows
+            values (list): ints of every column, one column after another. Values that don't fit in 16 bits are
+                clamped, they only belong to objects far off screen
+        '''
+        self.counts[kind] = n
+        try:
+            self.blocks[kind] = array.array('h', values)
+        except OverflowError:
+            self.blocks[kind] = array.array('h', [min(max(value, -32768), 32767) for value in values])
 
-    def __init__(self, p_type):
-        self.width = 25
-        self.height = 20
-        self.x = random.randint(25, 500 - (2*self.width))           # x coordinate choosen at random, spaced slightly from screen sides
-        self.y = -1 * self.height                                   # spawn right above upper boundry
-        self.velocity = 3
-        self.font_color = (255,255,255)                             # color white
-        self.powerup_font = pygame.font.SysFont('comicsans', 80, 1) # Comicsans, 80 font height, and bold
-        TimedPowerUp.current_option = p_type                        # setting class attribute to most current generated powerup
-        self.powerup_text = self.powerup_font.render(p_type, 1, self.font_color)
-        self.powerup_display_timer = 0
-        self.effect_timer = 0
-        self.powerup_duration = 550                                 # duration is a set at 550 game loops
-        TimedPowerUp.current_powerups.append(self)                  # appending instance to list of current TimedPowerUp objects
+    def delta(self, kind, previous, operation):
+        '''Combine a block with the same block of the previous tick row by row
 
-    def draw(self, window):
-        '''Draw powerup image on screen
+        Differences that don't fit in 16 bits wrap around as in 16 bit arithmetic. Decoding wraps the same way,
+        so every value comes back exactly
 
         Args
-            window (Boundary obj): surface to which the image is drawn
+            kind (str): kind of entity
+            previous (Snapshot obj): snapshot of the previous tick
+            operation (function): operator.sub to encode, operator.add to decode
+
+        Returns
+            array: combined block
         '''
-        if TimedPowerUp.activated == False: # Only display the powerup image if it hasn't been activated yet
-            window.blit(TimedPowerUp.power_ups[TimedPowerUp.current_option], (self.x, self.y))
+        try:
+            return self.combine(kind, previous, operation)
+        except OverflowError:
+            return self.combine(kind, previous, lambda a, b: (operation(a, b) + 32768) % 65536 - 32768)
 
-        elif TimedPowerUp.activated == True: # If activated, no longer display image. Display text instead
-            window.blit(self.powerup_text, (500//2 - self.powerup_text.get_width()//2, 700//2 - 100))
+    def combine(self, kind, previous, operation):
+        '''Apply an operation to the rows a block shares with the previous tick's block, see delta()
 
-    def progress(self):
-        '''Progress powerup down screen'''
-        self.y += self.velocity
+        Args
+            kind (str): kind of entity
+            previous (Snapshot obj): snapshot of the previous tick
+            operation (function): applied to a value and the value in the same place of the previous block
 
-    def __del__(self):
-        '''Delete TimedPowerUp object'''
-        pass
+        Returns
+            array: combined block
+        '''
+        block = self.blocks[kind]
+        n = self.counts[kind]
+        before = previous.blocks[kind]
+        prev_n = previous.counts[kind]
+        if n == prev_n:                                             # usual case, whole block at once
+            return array.array('h', map(operation, block, before))
+        if not n or not prev_n:
+            return array.array('h', block)
+        shared = min(n, prev_n)
+        result = array.array('h')
+        for start, prev_start in zip(range(0, len(block), n), range(0, len(before), prev_n)):
+            result.extend(map(operation, block[start:start + shared], before[prev_start:prev_start + shared]))
+            result.extend(block[start + shared:start + n])
+        return result
 
+    def encode(self, previous=None):
+        '''Pack the snapshot into compressed bytes
 
-class Health_PowerUp:
-    '''Generates health powerups which have the one time effect of return some health to the Mothership
+        Args
+            previous (Snapshot obj): snapshot of the previous tick the receiver already has. Everything is sent
+                as is if None, which makes a keyframe
 
-    Class Attributes
-        health_image (pygame image): image for health powerup
-        current_powerups (list): list containing all currently existing instances of Health_PowerUp
+        Returns
+            bytes: encoded snapshot
+        '''
+        parts = [self.header.pack(*self.scalars)]
+        for kind, _ in Snapshot.kinds:
+            parts.append(self.count.pack(self.counts[kind]))
+            parts.append(self.blocks[kind] if previous is None else self.delta(kind, previous, operator.sub))
+        compressor = zlib.compressobj(1, zlib.DEFLATED, Snapshot.window_bits, 1)
+        return compressor.compress(b''.join(parts)) + compressor.flush()
 
-    Attributes
-        width (int): width of power up
-        height (int): height of power up
-        x (int): x coordinate of spawn location
-        y (int): y coordinate of spawn location
-        health_add (int): amount of health granted upon activation
-        velocity (int): movement speed
-        activated (bool): whether or not the powerup has been activated
-        font_color (tuple): RGB value for font color
-        powerup_font (SysFont obj): font information; font type, size, bold
-        powerup_text (pygame text): text to be displayed
-        powerup_display_timer (int): timer for how long the text has been displayed to screen
-    '''
-    health_image = pygame.image.load('powerups/icon-health.png')
-    current_powerups = []
+    def decode(self, data, previous=None):
+        '''Unpack bytes made by encode()
 
-    def __init__(self):
-        self.width = 25
-        self.height = 20
-        self.x = random.randint(25, 500 - (2*self.width))   # x coordinate choosen at random with slight spacing from walls
-        self.y = -1 * self.height                           # spawn right above upper boundry
-        self.health_add = 250                               # amount of health returned to mothership
-        self.velocity = 3
-        self.activated = False                              # whether or not the powerup has been captured by main sprite
-        self.font_color = (255,255,255)
-        self.powerup_font = pygame.font.SysFont('comicsans', 80, 1)
-        self.powerup_text = self.powerup_font.render('Health' + ' +' + str(self.health_add), 1, self.font_color)
-        self.powerup_display_timer = 0
-        Health_PowerUp.current_powerups.append(self)
+        Args
+            data (bytes): encoded snapshot
+            previous (Snapshot obj): snapshot it was encoded against, None for a keyframe
+        '''
+        data = zlib.decompress(data, Snapshot.window_bits)
+        self.scalars = self.header.unpack_from(data)
+        offset = self.header.size
+        for kind, names in Snapshot.kinds:
+            n, = self.count.unpack_from(data, offset)
+            offset += self.count.size
+            self.counts[kind] = n
+            size = 2 * n * len(names)
+            self.blocks[kind] = array.array('h', data[offset:offset + size])
+            offset += size
+            if previous is not None:
+                self.blocks[kind] = self.delta(kind, previous, operator.add)
 
-    def draw(self, window):
-        '''Display health powerup image and text on screen
+    def apply(self, sim):
+        '''Make a simulation look like the snapshot so that it can be drawn. Only used by spectators, the
+        simulation is never stepped
 
         Args
-            windwo (Boundary obj): surface to which the image is drawn
+            sim (Simulation obj): mirror simulation of a spectator
         '''
-        if self.activated == False: # if not activated yet, only display image and not text
-            window.blit(Health_PowerUp.health_image, (self.x, self.y))
+        (sim.count, sim.score.score, sim.mothership.health_amt, sim.mothership.damage_taken, x, state,
+         sim.left_right_frame, sim.center_frame, key, activated, option) = self.scalars
+        sim.mothership.update_damage()
+        sim.score.score_length = len(str(sim.score.score))
+        sim.score.x = sim.width - 30 - 10*(sim.score.score_length - 1)     # where shift_score() would have put it
+        sprite = sim.main_sprite
+        sprite.x = sprite.prev_x = x
+        sprite.center, sprite.right, sprite.left = state == 0, state == 1, state == 2
+        sim.most_recent_key = Snapshot.keys[key]
+        TimedPowerUp.activated = bool(activated)
 
-        if self.activated == True: # if activated, no longer display image and display text in the middle of the screen
-            window.blit(self.powerup_text, (500//2 - self.powerup_text.get_width()//2, 700//2 - 100))
+        n = self.counts['asteroids']
+        while len(Asteroid.asteroid_lst) < n:
+            Asteroid.pool.acquire(sim.rng, sim.width)
+        while len(Asteroid.asteroid_lst) > n:
+            Asteroid.pool.release(Asteroid.asteroid_lst[-1])
+        store = Asteroid.store.columns
+        for name in ['x', 'y', 'width', 'hbar']:
+            store[name][:n] = array.array('i', self.column('asteroids', name))
+        store['prev_y'][:n] = store['y'][:n]
+        store['damage_taken'][:n] = array.array('i', self.column('asteroids', 'damaged'))    # only tells draw() to show red
+        store['hbar_length'][:n] = array.array('i', [round(width * 0.75) for width in self.column('asteroids', 'width')])
+        for ast, color_option in zip(Asteroid.asteroid_lst, self.column('asteroids', 'color_option')):
+            ast.color_option = color_option
 
-    def progress(self):
-        '''Progress health powerup down screen'''
-        self.y += self.velocity
+        n = self.counts['shots']
+        while len(ShooterObject.shots_queue) < n:
+            ShooterObject.pool.acquire('normal', 0, 0)
+        while len(ShooterObject.shots_queue) > n:
+            ShooterObject.pool.release(ShooterObject.shots_queue[-1])
+        store = ShooterObject.store.columns
+        store['start_x'][:n] = array.array('d', self.column('shots', 'x'))
+        store['start_y'][:n] = array.array('i', self.column('shots', 'start_y'))
+        store['prev_start_y'][:n] = store['start_y'][:n]
 
-    def __del__(self):
-        '''Delete Health_PowerUp object'''
-        pass
+        powerups = Health_PowerUp.current_powerups
+        del powerups[self.counts['health_powerups']:]
+        while len(powerups) < self.counts['health_powerups']:
+            Health_PowerUp(sim.rng, sim.width)
+        for powerup, x, y, activated, text_visible, health_add in zip(powerups, *(self.column('health_powerups', name)
+                                                                    for name in ['x', 'y', 'activated', 'text_visible', 'health_add'])):
+            powerup.x, powerup.y, powerup.prev_y = x, y, y
+            powerup.activated, powerup.text_visible, powerup.health_add = bool(activated), bool(text_visible), health_add
 
+        powerups = TimedPowerUp.current_powerups
+        del powerups[self.counts['timed_powerups']:]
+        while len(powerups) < self.counts['timed_powerups']:
+            TimedPowerUp(TimedPowerUp.power_up_options[0], sim.rng, sim.width)
+        TimedPowerUp.current_option = TimedPowerUp.power_up_options[option] if option != 255 else None   # after any were created
+        for powerup, x, y, p_type, text_visible, bar_height in zip(powerups, *(self.column('timed_powerups', name)
+                                                                 for name in ['x', 'y', 'p_type', 'text_visible', 'bar_height'])):
+            if powerup.p_type != TimedPowerUp.power_up_options[p_type]:
+                powerup.p_type = TimedPowerUp.power_up_options[p_type]
+                powerup.powerup_text = None                                 # rendered again on next draw
+            powerup.x, powerup.y, powerup.prev_y = x, y, y
+            powerup.text_visible, powerup.bar_height = bool(text_visible), bar_height
 
-class Explosion:
-    '''Generates explosion upon destruction of an asteroid
+        n = self.counts['explosions']
+        while len(Explosion.explosion_lst) < n:
+            Explosion.pool.acquire(0, 0, 0, None)
+        while len(Explosion.explosion_lst) > n:
+            Explosion.pool.release(Explosion.explosion_lst[-1])
+        for exp, x, y, frame, ast_width, score_increase, text in zip(Explosion.explosion_lst, *(self.column('explosions', name)
+                                                                    for name in ['x', 'y', 'current_frame', 'ast_width', 'score_increase', 'text'])):
+            if (exp.x, exp.y, exp.score_increase) != (x, y, score_increase):
+                exp.text = None                                             # a different explosion, text is placed again
+            exp.x, exp.y, exp.current_frame, exp.ast_width, exp.score_increase = x, y, frame, ast_width, score_increase
+            exp.method = 'negative health' if text else 'off screen'
+
+
+class SpectatorServer:
+    '''Streams the state of every tick of a game to spectators connected over a local socket.
+
+    The game loop captures and delta encodes one Snapshot per tick and hands it to a sender thread, so the cost
+    on the game loop doesn't grow with the number of spectators. The sender accepts spectators, greets each
+    with the playfield size and a keyframe, and writes frames to every spectator with non-blocking sends. A
+    spectator that can't keep up has its queued frames dropped and is sent a keyframe to catch up instead of
+    holding anything back. Nothing is captured or encoded while no spectator is connected.
+
+    Every frame on the wire is a frame header followed by the encoded snapshot.
 
     Class Attributes
-        explosion_lst (list): list containing all currently existing instances of the Explosion class
-        explostion_images (list): list containin pygame images of various explosion stages
+        greeting (Struct): magic, playfield width and height, sent once to every spectator
+        frame_header (Struct): length of the encoded snapshot and whether it is a keyframe
+        magic (bytes): identifies the stream
 
     Args
-        x (int): x coordinate of where explosion should occur
-        y (int): y coordinate of where explosion should occure
-        score_incr (int): amount by which score should incrase upon user destruction
-        method (str): string detailing how the asteroid was destroyed
+        address (str): 'host:port' for a TCP socket, anything else is the path of a Unix socket
+        width (int): width of playfield
+        height (int): height of playfield
+        max_buffer (int): bytes queued for one spectator before it is skipped ahead to a keyframe
 
     Attributes
-        x (int): storage of input x argument
-        y (int): storage of input y argument
-        current_frame (int): number detailing which image is to be displayed
-        font (pygame font): font information (font type, size, bold)
-        font_color (tuple): RGB color value for font
-        ast_width (int): width of asteroid that generated explosion
-        score_incrase (int): amount by which the user's score will increase
-        text (pygame text): score increase text to be displayed to screen
-        text_loc (tuple): location of text on screen (x, y, width, height)
-        method (str): storage of input argument method
-        count (int): timer used to control displaying of score increase text to screen
-        explosion_sound (pygame Sound): sound generated upon explosion
+        address (str): storage of input argument address
+        width (int): storage of input argument width
+        height (int): storage of input argument height
+        max_buffer (int): storage of input argument max_buffer
+        listener (socket obj): listening socket
+        clients (list): connected spectators as [socket, queued frames, bytes of first frame sent, needs keyframe]
+        previous (Snapshot obj): snapshot of the previous tick
+        published (int): number of ticks captured for spectators
+        frames (int): number of delta frames encoded
+        keyframes (int): number of keyframes encoded
+        bytes_encoded (int): total size of delta frames encoded
+        bytes_sent (int): total bytes written to spectators
+        encode_time (float): seconds spent capturing and encoding snapshots on the game loop
+        skipped (int): number of frames dropped for spectators that fell behind
+        queue (Queue obj): (snapshot, frame) of every tick waiting for the sender, None is the signal to stop
+        sender (Thread obj): thread accepting spectators and writing frames
     '''
+    greeting = struct.Struct('<4sHH')
+    frame_header = struct.Struct('<IB')
+    magic = b'IES1'
 
-    explosion_lst = []
-    explosion_images = [pygame.image.load(f'explosions/explosion-{x}.png') for x in range(1,12)]
+    def __init__(self, address, width=500, height=700, max_buffer=1 << 20):
+        self.address = address
+        self.width = width
+        self.height = height
+        self.max_buffer = max_buffer
+        family, target = SpectatorServer.parse_address(address)
+        if family == socket.AF_UNIX and os.path.exists(target):
+            os.remove(target)                                               # left behind by an earlier game
+        self.listener = socket.socket(family, socket.SOCK_STREAM)
+        if family != socket.AF_UNIX:
+            self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind(target)
+        self.listener.listen()
+        self.listener.setblocking(False)
+        self.clients = []
+        self.previous = None
+        self.published = 0
+        self.frames = 0
+        self.keyframes = 0
+        self.bytes_encoded = 0
+        self.bytes_sent = 0
+        self.encode_time = 0
+        self.skipped = 0
+        self.queue = queue.Queue()
+        self.sender = threading.Thread(target=self.send_loop, name='spectator sender', daemon=True)
+        self.sender.start()
 
-    def __init__(self, x, y, score_incr, method):
-        self.x = x
-        self.y = y
-        self.current_frame = 0
-        self.font = pygame.font.SysFont('comicsans',30,True)
-        self.font_color = (255,255,255)
-        self.ast_width = score_incr
-        # if a TimedPowerup is active and it is 'Double XP' then the score_increase value is double
-        if (TimedPowerUp.activated == True) and (TimedPowerUp.current_option == 'Double XP'): 
-            self.score_increase = score_incr*2
-        else:
-            self.score_increase = score_incr
-        self.text = self.font.render(('+'+str(self.score_increase)), 1, self.font_color)
-        # text location is in middle of asteroid and adjusted for text height and width
-        self.text_loc = ((self.x + (self.ast_width//2) - (self.text.get_width()//2)), 
-                        (self.y + (self.ast_width//2) + (self.text.get_height()//2)))
-        self.method = method
-        self.count = 1 # timer used to display score increase 
-        self.explosion_sound = pygame.mixer.Sound('audio/Explosion+1.wav')
-        self.explosion_sound.play()
-        Explosion.explosion_lst.append(self)
+    @staticmethod
+    def parse_address(address):
+        '''Socket family and address for an address string
 
-    def draw(self,window):
-        '''Draw explosion image and text to screen
-        
         Args
-            window (Boundary obj): surface to which image is displayed
+            address (str): 'host:port' or path of a Unix socket
+
+        Returns
+            tuple: (socket family, address to bind or connect to)
+        '''
+        host, _, port = address.rpartition(':')
+        if host and port.isdigit():
+            return socket.AF_INET, (host, int(port))
+        return socket.AF_UNIX, address
+
+    def publish(self, sim):
+        '''Capture and encode the state of the tick just simulated. Called by the game loop after every tick
+
+        Args
+            sim (Simulation obj): simulation being played
+        '''
+        if not self.clients:
+            self.previous = None                                            # the next spectator starts with a keyframe
+            return
+        start = time.perf_counter()
+        snapshot = Snapshot()
+        snapshot.capture(sim)
+        frame = None
+        if self.previous is not None:
+            frame = snapshot.encode(self.previous)
+            self.frames += 1
+            self.bytes_encoded += len(frame)
+        self.previous = snapshot
+        self.published += 1
+        self.encode_time += time.perf_counter() - start
+        self.queue.put((snapshot, frame))
+
+    def send_loop(self):
+        '''Accept spectators and write queued frames to them until None is queued. Runs on the sender thread'''
+        while True:
+            try:
+                item = self.queue.get(timeout=0.1)
+            except queue.Empty:
+                item = ()                                                   # nothing to send, but keep accepting
+            if item is None:
+                break
+            self.accept()
+            if item:
+                snapshot, frame = item
+                keyframe = None
+                for client in self.clients:
+                    if frame is None or client[3]:
+                        if keyframe is None:                            # encoded once however many spectators need it
+                            body = snapshot.encode()
+                            keyframe = self.frame_header.pack(len(body), 1) + body
+                            self.keyframes += 1
+                        client[1].append(keyframe)
+                        client[3] = False
+                    else:
+                        client[1].append(self.frame_header.pack(len(frame), 0) + frame)
+            self.flush()
+        for client in self.clients:
+            client[0].close()
+        self.clients = []
+        self.listener.close()
+
+    def accept(self):
+        '''Greet every spectator waiting to connect'''
+        while True:
+            try:
+                connection, _ = self.listener.accept()
+            except (BlockingIOError, OSError):
+                return
+            connection.setblocking(False)
+            greeting = self.greeting.pack(self.magic, self.width, self.height)
+            self.clients.append([connection, collections.deque([greeting]), 0, True])   # keyframe follows the greeting
+
+    def flush(self):
+        '''Write as much of every spectator's queued frames as its socket takes without blocking'''
+        for client in list(self.clients):
+            connection, frames, sent, _ = client
+            try:
+                while frames:
+                    written = connection.send(frames[0][sent:] if sent else frames[0])
+                    self.bytes_sent += written
+                    sent += written
+                    if sent < len(frames[0]):
+                        break                                               # socket buffer is full
+                    frames.popleft()
+                    sent = 0
+            except BlockingIOError:
+                pass
+            except OSError:
+                connection.close()                                          # spectator went away
+                self.clients.remove(client)
+                continue
+            client[2] = sent
+            if sum(map(len, frames)) > self.max_buffer:
+                self.skipped += len(frames) - (1 if sent else 0)
+                while len(frames) > (1 if sent else 0):                     # a frame that's partly sent has to be finished
+                    frames.pop()
+                client[3] = True                                            # catch up with a keyframe next tick
+
+    def stats(self):
+        '''Stream statistics
+
+        Returns
+            dict: connected spectators, frames and keyframes encoded, mean encoded bytes and microseconds spent
+                on the game loop per tick, total bytes sent and frames skipped
         '''
-        self.count += 1 # increment count to know how many times draw() has been called
-        window.blit(Explosion.explosion_images[self.current_frame], (self.x, self.y))
+        return {'spectators': len(self.clients), 'frames': self.frames, 'keyframes': self.keyframes,
+                'bytes_per_frame': self.bytes_encoded / self.frames if self.frames else 0,
+                'encode_us': self.encode_time / max(1, self.published) * 1e6, 'bytes_sent': self.bytes_sent,
+                'skipped': self.skipped}
 
-        if self.method == 'negative health':    # indicates that asteroid was destroyed via user
-            if self.count % 3 == 0:             # only display text every three calls to draw(). Gives fading effect          
-                window.blit(self.text, self.text_loc)
+    def close(self):
+        '''Stop the sender thread and disconnect every spectator'''
+        if self.sender.is_alive():
+            self.queue.put(None)
+            self.sender.join()
 
-    def __del__(self):
-        '''Delete Explosion object'''
-        pass
-    
 
-class ShooterObject:
-    '''Shots generated py main sprite, progress up screen, and destroy asteroid
+class SpectatorClient:
+    '''Receives a game streamed by a SpectatorServer and keeps a mirror simulation looking like it.
 
-    Class Attributes
-        Shots_queue (list): list containing all currently existing instances of the ShooterObject class
-        shot_rate (int): rate in frames per shot
+    The mirror is a Simulation that is never stepped; every received snapshot is applied to it, so it can be
+    drawn with the same code as a game being played. Creating the client resets the entity lists, so it can't
+    share a process with a game being played.
 
     Args
-        shot_type (str): designates the type of shot and subsequent attributes that go along with that shot type
-        ship_x_position (int): x coordinate of position of ship upon generation of shot
-        ship_y_position (int): y coordinate of position of ship upon generation og shot
+        address (str): address the server is listening on, 'host:port' or path of a Unix socket
 
     Attributes
-        shot_type (str): storage of input arguement shot_type
-        width (int): width of shot in pixels
-        height (int): height of object in pixels
-        color (tuple): RGB value of shot color
-        velo (int): movement speed of shot
-        damage(int): damage amount delivered to asteroids
-        hit (bool): determine whether a shot has made contact with an asteroid
-        start_y (int): starting point of line that is a shot
-        end_y (int): ending point of a line that is a shot
-        start_x (int): starting x coordinate of a shot
-
+        connection (socket obj): socket connected to the server
+        buffer (bytearray): bytes received but not yet decoded
+        snapshot (Snapshot obj): most recently decoded snapshot, None until the first keyframe
+        sim (Simulation obj): mirror simulation the snapshots are applied to
+        frames (int): number of frames received
+        bytes_received (int): total bytes received
+        decode_time (float): seconds spent decoding and applying snapshots
+        connected (bool): False once the server has closed the stream
     '''
-    shots_queue = []            # shots generated stored here.
-    shot_rate = 15              # called with modulo operator in while loop to generate shots every so many loops. lower to increase                                              
+    def __init__(self, address):
+        family, target = SpectatorServer.parse_address(address)
+        self.connection = socket.socket(family, socket.SOCK_STREAM)
+        self.connection.connect(target)
+        self.buffer = bytearray()
+        self.bytes_received = 0
+        self.connected = True
+        while len(self.buffer) < SpectatorServer.greeting.size:
+            self.read(blocking=True)
+        magic, width, height = SpectatorServer.greeting.unpack_from(self.buffer)
+        if magic != SpectatorServer.magic:
+            raise ValueError(f'{address} is not streaming a game')
+        del self.buffer[:SpectatorServer.greeting.size]
+        self.connection.setblocking(False)
+        self.snapshot = None
+        self.sim = Simulation(width, height)
+        self.frames = 0
+        self.decode_time = 0
 
-    def __init__(self, shot_type, ship_x_position, ship_y_position):
-        self.shot_type = shot_type
-        if self.shot_type == 'normal':
-            self.width = 3
-            self.height = 10
-            self.color = (255,255,255)
-            self.velo = 3
-            self.damage = 20
-        self.hit = False                                    # tells whether bullet has collided with an object
-        self.start_y = ship_y_position + 25                 # y position of ship + 25 to move closer to ship
-        self.end_y = self.start_y - self.height             # difference equal to shot height
-        self.start_x = ship_x_position                      # tying x coord position to that of the ship
-       
-    def draw_line(self, surface):
-        '''Draw line on screen
-        
-        Args
-            surface (Boundary obj): surface to which the image is drawn
-        '''                   
-        pygame.draw.line(surface, self.color, (int(self.start_x), int(self.start_y)), 
-                        (int(self.start_x), int(self.start_y) - self.height), self.width)
+    def read(self, blocking=False):
+        '''Add whatever the server has sent to the buffer
 
-    def progress(self):
-        '''Progress shot up screen'''
-        # move both the start and end y position by the velocity amount
-        self.start_y -= self.velo
-        self.end_y -= self.velo
+        Args
+            blocking (bool): wait for at least some data
+        '''
+        try:
+            data = self.connection.recv(1 << 16)
+        except BlockingIOError:
+            return
+        if not data:
+            self.connected = False
+            if blocking:
+                raise ConnectionError('the server closed the stream')
+            return
+        self.buffer += data
+        self.bytes_received += len(data)
 
-    def __del__(self):
-        '''Delete ShooterObject instance'''
-        pass
+    def receive(self):
+        '''Decode every complete frame received so far and apply the latest to the mirror simulation
 
+        Returns
+            int: number of frames decoded
+        '''
+        self.read()
+        header = SpectatorServer.frame_header
+        decoded = 0
+        start = time.perf_counter()
+        while len(self.buffer) >= header.size:
+            length, keyframe = header.unpack_from(self.buffer)
+            if len(self.buffer) < header.size + length:
+                break
+            if keyframe or self.snapshot is not None:
+                snapshot = Snapshot()
+                snapshot.decode(bytes(self.buffer[header.size:header.size + length]), None if keyframe else self.snapshot)
+                self.snapshot = snapshot
+                decoded += 1
+            del self.buffer[:header.size + length]
+        if decoded:
+            self.snapshot.apply(self.sim)
+            self.frames += decoded
+            self.decode_time += time.perf_counter() - start
+        return decoded
 
-class Score:
-    '''Keep score and display score in upper right hand corner of screen
+    def close(self):
+        '''Disconnect from the server'''
+        self.connection.close()
 
-    Attributes
-        score (int): initial score
-        x (int): x coordinate for displaying score text
-        y (int): y coordinate for displaying score text
-        score_lenth (int): current length of the score in terms of digits
-        color (tuple): RGB value of score text
-        font (pygame font): font information; font type, size, bold
-    '''
-    def __init__(self):
-        self.score = 0
-        self.x = 470
-        self.y = 10
-        self.score_length = 1
-        self.color = (255,255,255)
-        self.font = pygame.font.SysFont('comicsans', 30, True)
-        
-    def shift_score(self):
-        '''Shift score over by 10'''
-        self.x -= 10
-    
-    def draw_score(self, window):
-        '''Draw score in upper right hand corner of screen
 
-        Args
-            window (Boundary obj): surface to which the score is displayed
-        '''
-        # if the length of the current score isn't equal to the previously set score length, an addtional column has been added
-        if len(str(self.score)) != self.score_length: 
-            self.score_length = len(str(self.score))    # reseting score length to new length
-            self.shift_score()                          # shifting text over 
+class FrameRecorder:
+    '''Records the frames shown on screen from a background thread, without ever holding up the game loop.
 
-        self.text = self.font.render(str(self.score), 1, self.color) # rendering text
-        window.blit(self.text, (self.x, self.y)) # displaying text
+    capture() copies the pixels of the surface the game is drawn to straight out of its buffer into one of a fixed
+    number of preallocated frame buffers, a single memcpy with no intermediate bytes objects, and hands the buffer
+    to a writer thread. When the writer falls behind and every buffer is waiting to be written the frame is dropped,
+    so the game never waits on the disk or the encoder. The writer can also shrink every frame to a small grayscale
+    image, e.g. as the observation of an agent, keeping those of the most recent frames (requires numpy).
 
+    A raw recording is a header of the magic bytes, width, height, pitch, bytes per pixel and the red, green and blue
+    masks, followed by every frame as its frame number, seconds since recording started and height*pitch bytes of
+    pixels. A PNG recording is a directory of frame_000000.png files. Frame numbers count dropped frames too, so
+    gaps show where frames were dropped.
 
-class Credits:
-    '''Credits are composed of end game messages and high scores, displayed at the end of the game
+    Class Attributes
+        formats (list): recording formats
+        magic (bytes): first bytes of a raw recording
+        header (Struct): layout of the raw recording header
+        frame_header (Struct): layout of the header of every raw frame
+        png_level (int): zlib compression level of PNG frames, low to keep up with the frame rate
 
     Args
-        score (int): Accumulated score from the game just played
+        path (str): raw recording file, or directory of the PNG sequence
+        surface (pygame Surface): surface captured, normally Boundary.window
+        format (str): 'raw' or 'png'
+        buffers (int): frames that may be waiting to be written before new ones are dropped
+        observation_size (tuple): width and height of grayscale observations, None to make none
+        observation_frames (int): number of most recent observations kept
+        observation_path (str): .npy file the kept observations are saved to on close, None to not save them
 
     Attributes
-        score (int): storage for input arguemnt score
-        color (tuple): RGB color value for displayed text
-        messages (list): list of various end game messages to be displayed
-        fonts (list): list of pygame fonts of various sizes
-        texts (list): list of rendered texts, generated from fonts and messages
-        text_widths (list): list of widths of text
-        text_heights (list): list of heights of text
-        x (int): x coordinate for text
-        y (int): y coordinate for text
-        file_contents (list): storage for highscores.txt
-        file (file obj): file object of highscores.txt in 'r' mode
-        outfile (file obj): creating new file object of highscores.txt in 'w' mode
+        path (str): storage of input argument path
+        surface (pygame Surface): storage of input argument surface
+        format (str): storage of input argument format
+        observation_size (tuple): storage of input argument observation_size
+        observation_path (str): storage of input argument observation_path
+        pitch (int): bytes in a row of pixels
+        buffers (list): preallocated frame buffers
+        free (Queue obj): indexes of buffers that can be captured into
+        pending (Queue obj): captured frames waiting for the writer, as (buffer index, frame number, seconds)
+        observations (deque): grayscale observations of the most recent frames written
+        origin (float): perf_counter time the recording started
+        frames (int): number of frames offered to capture()
+        dropped (int): number of frames dropped because every buffer was waiting to be written
+        written (int): number of frames written
+        capture_time (float): seconds the game loop spent capturing frames
+        write_time (float): seconds the writer spent writing frames and making observations
+        file (file obj): raw recording being written, None for a PNG sequence
+        image (pygame Surface): surface frames are copied into to be saved as PNG, None for raw recordings
+        samples (tuple): row and byte indexes of the red, green and blue of every observation pixel in a frame
+        writer (Thread obj): background thread writing the frames
     '''
-    def __init__(self, score):
-        self.score = score
-        self.color = (255,255,255)
-        self.messages = ['GAME OVER', f'Your Score: {self.score}', 'Press any key to play again', 'High Scores:']
-        self.fonts = [pygame.font.SysFont('comicsans', 100, True), pygame.font.SysFont('comicsans', 50, True),
-                    pygame.font.SysFont('comicsans', 30, True)]
-        self.texts = [self.fonts[0].render(self.messages[0], 1, self.color), self.fonts[1].render(self.messages[1], 1, self.color),
-                    self.fonts[2].render(self.messages[2], 1, self.color), self.fonts[1].render(self.messages[3], 1, self.color)]
-        self.text_widths = [self.texts[0].get_width(), self.texts[1].get_width(), self.texts[2].get_width(), self.texts[3].get_width()]
-        self.text_heights = [self.texts[0].get_height(), self.texts[1].get_height(), self.texts[2].get_height(), self.texts[3].get_height()]
-        self.x = 250
-        self.y = 200
-        self.file_contents = []                     # if highscores.txt does not exist then file_contents will remain empty
-        if os.path.exists('highscores.txt'):        # if highscores exist then read into file_contents
-            self.file = open('highscores.txt', 'r')
-            self.file_contents = self.file.readlines() 
-            self.file.close()
-        self.outfile = open('highscores.txt', 'w')  # open up file in 'w' under same name to overwrite scores in new order
+    formats = ['raw', 'png']
+    magic = b'IEF1'
+    header = struct.Struct('<4sHHIBIII')
+    frame_header = struct.Struct('<Id')
+    png_level = 1
 
-    def write_highscores(self):
-        '''Determine if current score is high score and write to outfile'';
-        '''
-        self.file_contents.append(str(self.score) + '\n')               # appending new score to file_contents
-        self.file_contents.sort(key=(lambda x: int(x)) ,reverse=True)   # mapping each entry to int() and then sorting
-        if len(self.file_contents) == 6:                                
-            self.file_contents = self.file_contents[:-1]                # deprecate score list if it has reached max length
-        for line in self.file_contents:
-            self.outfile.write(line)                                    # writing to outfile for permanent storage
-        self.outfile.close()
-        
-    def display_credits(self, window):
-        '''Display all end game text and contents of highscores file
+    def __init__(self, path, surface, format='raw', buffers=8, observation_size=None, observation_frames=600,
+                 observation_path=None):
+        if format not in FrameRecorder.formats:
+            raise ValueError(f'format must be one of {FrameRecorder.formats}, not {format!r}')
+        if observation_size is not None and np is None:
+            raise ImportError('numpy is required for observations')
+        self.path = path
+        self.surface = surface
+        self.format = format
+        self.observation_size = observation_size
+        self.observation_path = observation_path
+        self.pitch = surface.get_pitch()
+        self.buffers = [bytearray(self.pitch * surface.get_height()) for _ in range(buffers)]  # allocated once, capturing never allocates
+        self.free = queue.SimpleQueue()
+        for index in range(buffers):
+            self.free.put(index)
+        self.pending = queue.SimpleQueue()
+        self.observations = collections.deque(maxlen=observation_frames)
+        self.origin = time.perf_counter()
+        self.frames = 0
+        self.dropped = 0
+        self.written = 0
+        self.capture_time = 0
+        self.write_time = 0
+        self.file = None
+        self.image = None
+        self.samples = None
+        if observation_size is not None:
+            # the pixels sampled are worked out once, so the writer never needs the surface, which may be gone
+            width, height = observation_size
+            rows = np.arange(height) * surface.get_height() // height
+            columns = np.arange(width) * surface.get_width() // width * surface.get_bytesize()
+            channels = np.array([shift // 8 for shift in surface.get_shifts()[:3]])       # byte of red, green and blue
+            if sys.byteorder == 'big':
+                channels = surface.get_bytesize() - 1 - channels
+            self.samples = (rows[:, None], columns[None, :] + channels[:, None, None])
+        if format == 'raw':
+            self.file = open(path, 'wb')
+            self.file.write(FrameRecorder.header.pack(FrameRecorder.magic, surface.get_width(), surface.get_height(),
+                                                      surface.get_pitch(), surface.get_bytesize(), *surface.get_masks()[:3]))
+        else:
+            os.makedirs(path, exist_ok=True)
+            self.image = pygame.Surface(surface.get_size(), 0, surface)    # same pixel format, so frames copy straight in
+        self.writer = threading.Thread(target=self.write_loop, name='frame recorder', daemon=True)
+        self.writer.start()
+
+    def capture(self):
+        '''Copy the surface's current pixels for the writer. Called once per frame after the display is updated
+
+        Returns
+            bool: False if the frame was dropped because the writer is behind
+        '''
+        start = time.perf_counter()
+        frame = self.frames
+        self.frames += 1
+        try:
+            index = self.free.get_nowait()
+        except queue.Empty:
+            self.dropped += 1
+            return False
+        pixels = self.surface.get_buffer()                  # locks the surface until released
+        memoryview(self.buffers[index])[:] = pixels
+        del pixels
+        self.pending.put((index, frame, start - self.origin))
+        self.capture_time += time.perf_counter() - start
+        return True
+
+    def write_loop(self):
+        '''Write captured frames until close() is called. Runs on the writer thread'''
+        while True:
+            item = self.pending.get()
+            if item is None:
+                break
+            index, frame, seconds = item
+            start = time.perf_counter()
+            pixels = self.buffers[index]
+            if self.file is not None:
+                self.file.write(FrameRecorder.frame_header.pack(frame, seconds))
+                self.file.write(pixels)
+            else:
+                target = self.image.get_buffer()
+                memoryview(target)[:] = pixels
+                del target
+                self.save_png(os.path.join(self.path, f'frame_{frame:06d}.png'))
+            if self.observation_size is not None:
+                self.observations.append(self.observe(pixels))
+            self.free.put(index)                            # buffer can be captured into again
+            self.written += 1
+            self.write_time += time.perf_counter() - start
+
+    def save_png(self, path):
+        '''Save the frame in image as a PNG. pygame.image.save() holds the GIL for the whole encode, which would stall
+        the game loop for tens of milliseconds, while zlib lets go of it for the compression that takes nearly all
+        the time
 
         Args
-            window (Boundary obj): surface to which all text is displayed
+            path (str): file to write
         '''
-        window.blit(self.texts[0], (self.x - self.text_widths[0]//2, self.y - self.text_heights[0]//2 - 50))
-        window.blit(self.texts[1], (self.x - self.text_widths[1]//2, self.y - self.text_heights[1]//2 + self.text_heights[0] - 30))
-        window.blit(self.texts[2], (self.x - self.text_widths[2]//2, 650))
-        window.blit(self.texts[3], (self.x - self.text_widths[3]//2, 300))
+        width, height = self.image.get_size()
+        pixels = pygame.image.tostring(self.image, 'RGB')
+        stride = width * 3
+        rows = b''.join(b'\x00' + pixels[y*stride:(y + 1)*stride] for y in range(height))   # no filter on any row
+        with open(path, 'wb') as outfile:
+            outfile.write(b'\x89PNG\r\n\x1a\n')
+            for tag, data in [(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)),
+                              (b'IDAT', zlib.compress(rows, FrameRecorder.png_level)), (b'IEND', b'')]:
+                outfile.write(struct.pack('>I', len(data)) + tag)
+                outfile.write(data)
+                outfile.write(struct.pack('>I', zlib.crc32(data, zlib.crc32(tag))))
 
-        self.init_score_pos = 350
-        for score in self.file_contents:
-            self.f = pygame.font.SysFont('comicsans', 30, True)
-            self.t = self.f.render(score[:-1], 1, self.color)   # deprecate end of score so that \n characters aren't blitted to screen
+    def observe(self, pixels):
+        '''Shrink a captured frame to a grayscale image by sampling the nearest pixels
 
-            window.blit(self.t, (self.x - self.t.get_width()//2, self.init_score_pos))
-            self.init_score_pos += 40                           # iteratively move score position down screen
+        Args
+            pixels (bytearray): captured frame
+
+        Returns
+            ndarray: uint8 array of shape (height, width) of observation_size
+        '''
+        frame = np.frombuffer(pixels, np.uint8).reshape(-1, self.pitch)     # one row of pixels per row
+        sampled = frame[self.samples].astype(np.uint16)
+        return ((sampled[0]*77 + sampled[1]*150 + sampled[2]*29) >> 8).astype(np.uint8)     # ITU-R 601 luma
+
+    def stats(self):
+        '''Recording statistics
+
+        Returns
+            dict: frames offered, dropped and written, frames waiting to be written, and mean microseconds the game
+                loop spent capturing and milliseconds the writer spent per frame
+        '''
+        captured = self.frames - self.dropped
+        return {'frames': self.frames, 'dropped': self.dropped, 'written': self.written,
+                'waiting': captured - self.written,
+                'capture_us': self.capture_time / max(1, captured) * 1e6,
+                'write_ms': self.write_time / max(1, self.written) * 1e3}
+
+    def close(self):
+        '''Write every frame still waiting, stop the writer and save the observations'''
+        if self.writer.is_alive():
+            self.pending.put(None)
+            self.writer.join()
+        if self.file is not None:
+            self.file.close()
+        if self.observation_path is not None and self.observations:
+            np.save(self.observation_path, np.stack(self.observations))
+
+
+# assets the game needs, loaded in the background while the title screen is shown. Title screen assets come first
+ASSET_MANIFEST = {'sounds': ['audio/Explosion+1.wav'],
+                  'fonts': [('comicsans', 100, True), ('comicsans', 30, True), ('comicsans', 50, True), ('comicsans', 80, True)],
+                  'music': ['audio/Battle-Conflict.mp3', 'audio/Battle-SilverMoon.mp3'],
+                  'images': ['Background_images/p.png', 'Mothership/mothership_3_2.png']
+                            + [f'main_sprite/planes_02A-center{x}.png' for x in range(1,5)]
+                            + [f'main_sprite/planes_02A-strafe_right{x}.png' for x in range(5,9)]
+                            + [f'main_sprite/planes_02A-R{x}.png' for x in range(9,13)]
+                            + [f'main_sprite/planes_02A-strafe_left{x}.png' for x in range(5,9)]
+                            + [f'main_sprite/planes_02A-L{x}.png' for x in range(9,13)]
+                            + [f'Asteroids/res{width}{suffix}.png' for width in Asteroid.width_options
+                               for suffix in ['', '_1', '_2', '_3', '_4']]
+                            + ['powerups/icon-powerup.png', 'powerups/icon-special.png', 'powerups/icon-health.png']
+                            + [f'explosions/explosion-{x}.png' for x in range(1,12)]}
 
 
 class GameStart:
-    '''Controls game loop and all functions within game loop; collisions, drawing, generating objects, key presses.
+    '''Controls game loop and all functions within game loop; key presses, sounds, and drawing.
+    Game state and rules are kept in a Simulation object, which is stepped at a fixed rate while frames are
+    drawn at whatever rate the machine manages.
+
+    Class Attributes
+        max_ticks_per_frame (int): limit on ticks simulated per frame so a long stall can't snowball
+        rewind_seconds (int): game time F5 goes back
+
+    Args
+        dirty_rects (bool): only redraw and update the parts of the screen that change. Much cheaper on
+            machines that blit in software
+        fps (int): frames drawn per second. Game speed doesn't depend on it, 0 draws as fast as possible
+        replay_path (str): if given, every game is recorded and saved to this path when it ends
+        play (bool): start the opening scene and game loop. If False only the window is set up, for tools
+            that drive the simulation and drawing themselves
+        trace_path (str): file the frame profile is exported to when F4 is pressed
+        resolution (tuple): width and height of the window, the playfield size if None. The playfield is scaled
+            to fit, e.g. (1920, 1080) or (3840, 2160) for a kiosk display
+        scaling (str): 'prescaled' scales sprites and fonts once when they're loaded and draws them straight to
+            the window, 'offscreen' draws at playfield size and scales the whole frame in one blit
+        fullscreen (bool): open a fullscreen window, (0, 0) as resolution uses the desktop resolution
+        playfield (tuple): width and height of the playfield the game is simulated on
+        stream_address (str): if given, every tick is streamed to spectators connecting to this address,
+            'host:port' or the path of a Unix socket
+        spectate_address (str): if given, watch the game streamed from this address instead of playing. The
+            playfield size is taken from the stream
+        checkpoint_path (str): file a checkpoint of the game is saved to when F6 is pressed
+        resume_path (str): if given, the first game continues from the checkpoint saved in this file
+        capture_path (str): if given, every frame shown during play is recorded to this raw file or PNG directory
+        capture_format (str): 'raw' or 'png', format of the recording
+        adaptive_quality (bool): draw less detail while frames take longer than 1/fps, see QualityGovernor
 
     Attributes
         clock (pygmae Clock obj): pygame clock object for controlling game rate
@@ -644,371 +4462,530 @@ class GameStart:
         run (bool): control enter and exit of game loop
         display (Boundary obj): Creation of game window and dimension
         opening_scene(bool): control enter and exit of opening scene
-        music (pygame music): game play music
-        main_sprite (Character obj): main character 
-        mothership (Mothership obj): mothership character
-        score (Score obj): score object
-        count (int): count of current overall game loop
-        center_frame (int): counter telling which center image to be displayed 
-        left_right_frame (int): counter telling which left/right image to be displayed
-        powerup_health_timer (int): cooldown timer for health power ups
-        powerup_timer (int): cooldown timer for remaining powerups
-        next_frame (time obj): time object for moving between main character frames
-        most_recent_key (none): contains most recently pressed key; 'l' or 'r'
+        music (BytesIO obj): game play music, None if it couldn't be loaded
+        simulation (Simulation obj): game state, advanced Simulation.tick_rate times per second
+        renderer (DirtyRectRenderer obj): dirty rectangle renderer, None when the full screen is redrawn every frame
+        fps (int): storage of input argument fps
+        accumulator (float): real time in seconds that hasn't been simulated yet
+        last_time (float): time at which the accumulator was last updated
+        replay_path (str): storage of input argument replay_path
+        replay (Replay obj): recording of the current game, None if not recording
+        profiler (FrameProfiler obj): timings of the most recent frames. F3 toggles its overlay
+        highscores (HighScoreStore obj): scores of every game played, None until the game loop starts
+        trace_path (str): storage of input argument trace_path
+        stream (SpectatorServer obj): server streaming the game to spectators, None if not streaming
+        spectator (SpectatorClient obj): client receiving a streamed game, None if playing
+        checkpoints (CheckpointRing obj): checkpoints of the last half minute of the current game, F5 rewinds
+        checkpoint_path (str): storage of input argument checkpoint_path
+        resume (Checkpoint obj): checkpoint the next game starts from, None to start a new game
+        recorder (FrameRecorder obj): records the frames shown, None if not recording
+        governor (QualityGovernor obj): lowers drawing quality when frames run over budget, None if disabled
+        previous_rects (list): areas drawn to on the previous frame, None when the whole background has to be redrawn
     '''
-    def __init__(self):
+    max_ticks_per_frame = 8
+    rewind_seconds = 5
+
+    def __init__(self, dirty_rects=False, fps=60, replay_path=None, play=True, trace_path='frame_trace.json',
+                 resolution=None, scaling='prescaled', fullscreen=False, playfield=(500, 700), stream_address=None,
+                 spectate_address=None, checkpoint_path='checkpoint.iec', resume_path=None, capture_path=None,
+                 capture_format='raw', adaptive_quality=True):
         pygame.init()
+        if pygame.mixer.get_init():
+            voices.reserve()                                        # sound effect channels are kept away from anything else
         self.clock = pygame.time.Clock()
+        self.fps = fps
+        self.replay_path = replay_path
+        self.profiler = FrameProfiler()
+        self.governor = QualityGovernor(1 / (fps or Simulation.tick_rate)) if adaptive_quality else None
+        self.previous_rects = None
+        self.trace_path = trace_path
+        self.checkpoint_path = checkpoint_path
+        self.checkpoints = CheckpointRing()
+        self.resume = None
+        if resume_path is not None:
+            self.resume = Checkpoint()
+            self.resume.load(resume_path)
+        self.highscores = None                                      # opened once a game is played
         self.quit = False
         self.run = True
-        self.display = Boundary(500, 700)                           # Game Boundary and Window dimensions disgnation
+        self.spectator = SpectatorClient(spectate_address) if spectate_address is not None else None
+        if self.spectator is not None:
+            playfield = (self.spectator.sim.width, self.spectator.sim.height)
+        self.stream = SpectatorServer(stream_address, *playfield) if stream_address is not None else None
+        self.display = Boundary(*playfield, resolution, scaling, fullscreen)   # Game Boundary and Window dimensions disgnation
+        assets.load_async(ASSET_MANIFEST)                           # fonts are sized for the window, so it has to exist first
+        if not play or self.spectator is not None:                  # only the opening scene has something to show meanwhile
+            assets.wait()
+            assets.load_sprites()                                   # sprites are converted to the display format so need the window first
+        self.renderer = DirtyRectRenderer(self.display) if dirty_rects else None
+        self.recorder = FrameRecorder(capture_path, self.display.window, capture_format) if capture_path is not None else None
+        if play and self.spectator is not None:
+            self.spectate()
+        elif play:
+            self.play()
+
+    def play(self):
+        '''Show the opening scene and then run the game loop until the window is closed'''
         self.opening_scene = True
         self.open_scene()                                           # Call opening scene after creating game window and before characer objs are created
         if self.quit == False:                                      # Opening scene offers quit point. Need to check here
-            
-            self.music = pygame.mixer.music.load('audio/Battle-SilverMoon.mp3')
-            pygame.mixer.music.play(-1)                                 
-            self.main_sprite = Character()                              # initialize main sprite
-            self.mothership = Mothership()                              # initialize mothership
-            self.score = Score()
-            self.count = 0                                              # count running so that every X amount of loops, do Y
-            self.center_frame = 0
-            self.left_right_frame = 0
-            self.powerup_health_timer = 0                               # two seperate timers for health powerups vs. other powerups
-            self.powerup_timer = 0                                      # 
-            self.next_frame = time.time()
-            self.most_recent_key = None                                 # input 'l' or 'r' depending on which directional was last used.                                
+            self.highscores = HighScoreStore()                      # every score is kept, written by a background thread
+            self.new_game()
 
+            profiler = self.profiler
             while self.run:
-                self.clock.tick(60)                                     # controls FPS
+                profiler.begin_frame()
+                self.clock.tick(self.fps)                               # controls FPS
+                profiler.lap('clock.tick')
 
-                if time.time() > self.next_frame:
-                    self.center_frame  = (self.center_frame + 1)%4      # rotate through four static images
-                    self.next_frame += .03                              # bumps self-made frame clock by 30ms (will only display new every 30)
-                    self.left_right_frame += 1
+                inputs = self.handle_key_presses()
+                profiler.lap('input')
+                self.advance_simulation(inputs)
 
-                self.handle_key_presses()                               
+                # draw objects part of the way between the last two ticks according to the unsimulated time
+                rects = self.redraw_window(self.accumulator * Simulation.tick_rate)
+                if profiler.show_overlay:
+                    rects.append(profiler.draw_overlay(self.display.window))
+                profiler.lap('redraw')
                 
-                self.generate_shots()                                   # generate ShooterObjects 
-                
-                # only call if less than the max amount.
-                if len(Asteroid.asteroid_lst) < Asteroid.maximum_asteroid_amount: 
-                    self.generate_asteroids()
-                
-                self.generate_powerup()                                 
-                
-                self.handle_collisions()             
-                
-                if self.count % 5 == 0:
-                    self.score.score += 1                               # score increase every 5 loops. 
-
-                self.redraw_window()
-                self.count += 1                                         # increment loop count
-                
-                if self.mothership.health_amt <= 0:                      # end game if mothership has 0 or negative health
+                if self.simulation.game_over:                           # end game if mothership has 0 or negative health
+                    profiler.end_frame()                                # the credits screen isn't part of the frame
                     self.end_game()
-                    break
+                    continue
 
-                pygame.display.update()
+                if self.renderer is not None:
+                    self.renderer.update(rects)                         # only push the areas that changed
+                else:
+                    self.display.update()
+                self.previous_rects = rects
+                profiler.lap('display.update')
+
+                if self.recorder is not None:
+                    self.recorder.capture()                             # copied here, written by the recorder's own thread
+                    profiler.lap('capture')
 
                 for event in pygame.event.get():
                     if event.type == pygame.QUIT:
                         self.run = False
                         pygame.quit()
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                        profiler.show_overlay = not profiler.show_overlay
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                        profiler.export_trace(self.trace_path)
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F5:
+                        self.rewind()
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F6:
+                        checkpoint = Checkpoint()
+                        checkpoint.capture(self.simulation)
+                        checkpoint.save(self.checkpoint_path)
+                profiler.lap('event pump')
+                profiler.end_frame()
+                if self.governor is not None:
+                    self.governor.update(profiler)
+
+        if self.highscores is not None:
+            self.highscores.close()                                 # make sure the last score reaches the disk
+        if self.stream is not None:
+            self.stream.close()
+        if self.recorder is not None:
+            self.recorder.close()
+
+    def spectate(self):
+        '''Draw the game streamed to the spectator client until the stream ends or the window is closed'''
+        self.simulation = self.spectator.sim                        # mirror kept up to date by the client
+        self.previous_rects = None
+        if self.renderer is not None:
+            self.renderer.reset(self.simulation)
+        while self.run and self.spectator.connected:
+            self.clock.tick(self.fps)
+            self.spectator.receive()
+            rects = self.redraw_window()                            # snapshots have no previous tick to interpolate from
+            if self.renderer is not None:
+                self.renderer.update(rects)
+            else:
+                self.display.update()
+            self.previous_rects = rects
+            if self.recorder is not None:
+                self.recorder.capture()
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.run = False
+        self.spectator.close()
+        if self.recorder is not None:
+            self.recorder.close()
+        pygame.quit()
+
+    def play_music(self, path):
+        '''Loop a music track, playing without music if the track failed to load in the background
+
+        Args
+            path (str): path of music file
+
+        Returns
+            BytesIO obj: file the mixer streams the music from, None if there is no music
+        '''
+        pygame.mixer.music.stop()
+        if path in assets.failed:
+            return None
+        music = assets.music(path)
+        pygame.mixer.music.load(music)
+        pygame.mixer.music.play(-1)
+        return music
+
+    def new_game(self):
+        '''Start game play music and create a fresh Simulation'''
+        self.music = self.play_music('audio/Battle-SilverMoon.mp3')     # loaded during the opening scene
+        self.clock = pygame.time.Clock()
+        self.run = True
+        self.simulation = Simulation(self.display.width, self.display.height)
+        self.simulation.profiler = self.profiler
+        self.accumulator = 0
+        self.last_time = time.perf_counter()
+        self.replay = None
+        if self.replay_path is not None:
+            self.replay = Replay(self.simulation.seed, self.simulation.width, self.simulation.height)
+        self.checkpoints = CheckpointRing()
+        self.previous_rects = None                                  # credits were drawn over the whole screen
+        if self.governor is not None:
+            self.governor.reset()                                   # every game starts at full quality
+        if self.resume is not None:
+            self.resume.restore(self.simulation)
+            self.resume = None
+            self.replay = None                                      # a replay has to start from the seed
+        if self.renderer is not None:
+            self.renderer.reset(self.simulation)                    # credits were drawn over the whole screen
+
+    def rewind(self):
+        '''Put the game back rewind_seconds of game time, to the newest checkpoint that far back'''
+        if self.checkpoints.rewind(self.simulation, self.rewind_seconds) is None:
+            return
+        if self.replay is not None:
+            del self.replay.inputs[self.simulation.count:]         # the rewound ticks are played again
+        self.accumulator = 0
+        self.previous_rects = None
+        if self.renderer is not None:
+            self.renderer.reset(self.simulation)
             
+    def advance_simulation(self, inputs):
+        '''Step the simulation once for every full tick of real time that has passed since the last call
+
+        Args
+            inputs (int): bitmask of INPUT_LEFT and INPUT_RIGHT held during these ticks
+        '''
+        now = time.perf_counter()
+        tick_length = 1 / Simulation.tick_rate
+        # time beyond max_ticks_per_frame is dropped, slowing the game down rather than falling further behind
+        self.accumulator = min(self.accumulator + now - self.last_time, tick_length * self.max_ticks_per_frame)
+        self.last_time = now
+
+        while self.accumulator >= tick_length and not self.simulation.game_over:
+            self.simulation.step(inputs)
+            self.accumulator -= tick_length
+            if self.replay is not None:
+                self.replay.record(inputs)
+
+            for exp in self.simulation.new_explosions:
+                exp.play_sound()
+            self.profiler.lap('sound')
+
+            self.checkpoints.record(self.simulation)
+            self.profiler.lap('checkpoint')
+
+            if self.stream is not None:
+                self.stream.publish(self.simulation)                # encoded here, sent by the stream's own thread
+                self.profiler.lap('stream')
+
     def open_scene(self):
         '''Display opening scene prior to entering game loop
+
+        The title screen is shown while the assets load on worker threads. The background, title music and text
+        appear as they arrive, a bar shows how much has loaded, and a key press only starts the game once every
+        asset is loaded.
         
         Attributes
-            open_music (pygame music): pygame music played at opening scene
+            open_music (BytesIO obj): pygame music played at opening scene, None until it's loaded or if it couldn't be
             color (tuple): RGB color value of font
-            fonts (list): pygame fonts for various texts
+            fonts (list): pygame fonts for various texts, None until they're loaded
             titles (list): title for opening scene
             title_location (int): y coordinate for title
             body (list): list of messages for body text
             instructions (list): list of game instructions to be displayed
+            loading (bool): assets are still being loaded
+            start_requested (bool): a key has been pressed to start the game
+            first_frame_time (float): seconds from the start of the opening scene until its first frame was shown
         '''
-
-        self.open_music = pygame.mixer.music.load('audio/Battle-Conflict.mp3')
-        pygame.mixer.music.play(-1)
+        start = time.perf_counter()
+        self.open_music = None
+        music_started = False
         self.color = (255,255,255)
-        self.fonts = [pygame.font.SysFont('comicsans',100,1), pygame.font.SysFont('comicsans',30,1)]
+        self.fonts = None
         self.titles = ['Interstellar', 'Escort']
         self.title_location = self.display.height * (1//10)
         self.body = ["You are mankind's last hope!", 'Protect the Mothership at all costs', 'as it makes its way across the galaxy.',
                     'Beware of asteroid clusters!']
         self.instructions = ['Press any key to begin', 'Use right and left arrow keys to move.']
+        self.loading = True
+        self.start_requested = False
+        self.first_frame_time = None
 
         while self.opening_scene == True:                           # while opening scene is True display text and background
-            self.display.window.blit(Boundary.back_ground, (0,0))   # display background
-            self.title_text = self.fonts[0].render(self.titles[0], 1, self.color)
-            self.title_text2 = self.fonts[0].render(self.titles[1], 1, self.color)
-            
-            self.display.window.blit(self.title_text, ((self.display.width//2) - (self.title_text.get_width()//2), 70))
-            self.display.window.blit(self.title_text2, ((self.display.width//2) - (self.title_text2.get_width()//2), 130))
-            
-            self.body_location = 300                                # established in loop so it is reset each time
-            for body_text in self.body:
-                b_t = self.fonts[1].render(body_text, 1, self.color)
+            progress = assets.poll()                                # take in whatever the workers have loaded
+            # anything still missing once loading is over failed in the background and is loaded again, raising the
+            # error, except music which is left out
+            if not music_started and (assets.loaded('audio/Battle-Conflict.mp3') or progress == 1):
+                self.open_music = self.play_music('audio/Battle-Conflict.mp3')
+                music_started = True
+            if Boundary.back_ground is None and (assets.loaded('Background_images/p.png') or progress == 1):
+                assets.load_background()
+            if self.fonts is None and ((assets.font_loaded('comicsans',view.length(100),1) and
+                                        assets.font_loaded('comicsans',view.length(30),1)) or progress == 1):
+                self.fonts = [assets.font('comicsans',view.length(100),1), assets.font('comicsans',view.length(30),1)]
+            if self.loading and progress == 1:
+                assets.load_sprites()                               # readiness barrier, every sprite is in place before play
+                self.loading = False
+                for path in assets.failed:
+                    print(f'could not load {path}', file=sys.stderr)
 
-                self.display.window.blit(b_t, ((self.display.width//2) - (b_t.get_width()//2), self.body_location))
+            if Boundary.back_ground is not None:
+                self.display.window.blit(Boundary.back_ground, view.point(0, 0))   # display background
+            else:
+                self.display.window.fill((0, 0, 0))
 
-                self.body_location += 30                            # move body text down 30 at a time
-            
-            self.instructions_location = 600                        # established in loop so it is reset each time
-            for instruction in self.instructions:
-                instructions_text = self.fonts[1].render(instruction, 1, self.color)
-                self.display.window.blit(instructions_text, ((self.display.width//2) - (instructions_text.get_width()//2), 
-                                        self.instructions_location))
+            if self.fonts is not None:
+                self.title_text = text_cache.render(self.fonts[0], self.titles[0], self.color)
+                self.title_text2 = text_cache.render(self.fonts[0], self.titles[1], self.color)
+                
+                center_x, y = view.point(self.display.width//2, 70)     # texts are centered on the playfield
+                self.display.window.blit(self.title_text, (center_x - (self.title_text.get_width()//2), y))
+                center_x, y = view.point(self.display.width//2, 130)
+                self.display.window.blit(self.title_text2, (center_x - (self.title_text2.get_width()//2), y))
+                
+                self.body_location = 300                                # established in loop so it is reset each time
+                for body_text in self.body:
+                    b_t = text_cache.render(self.fonts[1], body_text, self.color)
 
-                self.instructions_location += 30
+                    center_x, y = view.point(self.display.width//2, self.body_location)
+                    self.display.window.blit(b_t, (center_x - (b_t.get_width()//2), y))
 
-            pygame.display.update()
+                    self.body_location += 30                            # move body text down 30 at a time
+                
+            self.instructions_location = self.display.height - 100  # established in loop so it is reset each time
+            if self.loading:                                        # progress bar in place of the instructions
+                x, y = view.point(self.display.width//2 - 100, self.instructions_location)
+                pygame.draw.rect(self.display.window, self.color, (x, y, view.length(200), view.length(16)), 1)
+                pygame.draw.rect(self.display.window, self.color, (x, y, round(view.length(200) * progress), view.length(16)))
+            elif self.fonts is not None:
+                for instruction in self.instructions:
+                    instructions_text = text_cache.render(self.fonts[1], instruction, self.color)
+                    center_x, y = view.point(self.display.width//2, self.instructions_location)
+                    self.display.window.blit(instructions_text, (center_x - (instructions_text.get_width()//2), y))
+
+                    self.instructions_location += 30
+
+            self.display.update()
+            if self.first_frame_time is None:
+                self.first_frame_time = time.perf_counter() - start
 
             for event in pygame.event.get():
                 if event.type == pygame.KEYUP:                      # game will start upon release of any key
-                    self.opening_scene = False                      # kick back out to main loop 
+                    self.start_requested = True                     # once everything has loaded
 
                 if event.type == pygame.QUIT:
                     self.opening_scene = False
                     self.quit = True
                     pygame.quit()
+            if self.start_requested and not self.loading:
+                self.opening_scene = False                          # kick back out to main loop 
+            elif self.opening_scene:
+                self.clock.tick(self.fps)                           # leave the worker threads the processor while waiting
 
     def end_game(self):
         '''Create Credits object and restart game upon user input
 
         Attributes
-            end_music (pygame music): music played at game over screen
+            end_music (BytesIO obj): music played at game over screen, None if it couldn't be loaded
             game_over (Credits obj): credits object with the current final score
             displaying_credits (bool): control for end game loop
         '''
-        pygame.mixer.music.stop()
-        self.end_music = pygame.mixer.music.load('audio/Battle-Conflict.mp3')
-        pygame.mixer.music.play(-1)
-        self.game_over = Credits(self.score.score)                  # create credits obj
+        self.end_music = self.play_music('audio/Battle-Conflict.mp3')
+        if self.replay is not None:
+            self.replay.finish(self.simulation)
+            self.replay.save(self.replay_path)
+        self.game_over = Credits(self.simulation.score.score, self.highscores) # create credits obj
         self.game_over.write_highscores()
         self.displaying_credits = True
         
         while self.displaying_credits:
             #if self.displaying_credits == False:
             #    break
-            self.display.window.blit(Boundary.back_ground, (0,0))   # display background to screen
+            self.display.window.blit(Boundary.back_ground, view.point(0, 0))   # display background to screen
             self.game_over.display_credits(self.display.window)     # print credits to screen
-            pygame.display.update()
+            self.display.update()
 
             pygame.time.delay(2000)                                 # delay pygame so key pressing at end of game doesn't auto restart
 
             for event in pygame.event.get():
                 if event.type == pygame.KEYUP:                      # reset game upon pressing and release of key
-                    # Reset all object class attribute list to empty for new game
-                    Asteroid.asteroid_lst[:] = []
-                    ShooterObject.shots_queue[:] = []
-                    Explosion.explosion_lst[:] = []
-                    Health_PowerUp.current_powerups[:] = []
-                    
-                    # using initial game setup commands to reset everything upon restart.
-                    self.music = pygame.mixer.music.load('audio/Battle-SilverMoon.mp3')
-                    pygame.mixer.music.play(-1)                                 
-                    self.clock = pygame.time.Clock()
-                    self.run = True
-                    self.display = Boundary(500, 700)                           
-                    self.main_sprite = Character()                         
-                    self.mothership = Mothership()
-                    self.score = Score()
-                    self.count = 0                                              
-                    self.center_frame = 0
-                    self.left_right_frame = 0
-                    self.next_frame = time.time()
-                    self.most_recent_key = None
-                    self.powerup_timer = 0                                                              
+                    self.new_game()
                     self.displaying_credits = False
 
                 if event.type == pygame.QUIT:
                     self.displaying_credits = False
+                    self.run = False
                     pygame.quit()
                     #break
 
     def handle_key_presses(self):
-        '''Move character right and left, setting character movement states and correct frames to be displayed'''
+        '''Read the arrow keys
+
+        Returns
+            int: bitmask of INPUT_LEFT and INPUT_RIGHT to be passed to Simulation.step()
+        '''
         keys = pygame.key.get_pressed()
-            
+        inputs = 0
         if keys[pygame.K_LEFT]:                                 # left arrow key to move left
-            self.main_sprite.move_left(self.display)            # using display as input to set boundaries for movement.
-            if self.main_sprite.left == False:                  # only allowing access to branch if False so it won't run while holding down key
-                self.main_sprite.left = True                    # sprite is now moving left
-                self.main_sprite.right = False                  # right and center are now both False
-                self.main_sprite.center = False                      
-                self.left_right_frame = 0                       # resetting left&right frame count. Will help display intermediate strafe states
-                self.most_recent_key = 'l'                      # setting left so intermediate strafe images used to level out spaceship
+            inputs |= INPUT_LEFT
+        if keys[pygame.K_RIGHT]:                                # right arrow key to move right
+            inputs |= INPUT_RIGHT
+        return inputs
 
-        elif keys[pygame.K_RIGHT]:                              # right arrow key to move right
-            self.main_sprite.move_right(self.display)           # using display as input to set boundaries for movement.
-            if self.main_sprite.right == False:                 # only allowing access to branch if False so it won't run while holding down key
-                self.main_sprite.right = True
-                self.main_sprite.left = False
-                self.main_sprite.center = False
-                self.left_right_frame = 0
-                self.most_recent_key = 'r'                      # setting right so intermediate strafe images used to level out spaceship
-
-        else:
-            if self.main_sprite.center == False:                # once right or left keys are let go, if statement will run
-                self.main_sprite.center = True
-                self.main_sprite.right = False
-                self.main_sprite.left = False
-                self.left_right_frame = 0                       # resetting upon return to center will allow us to access intermediate strafe states
+    def redraw_background(self):
+        '''Check if the whole background has to be drawn this frame rather than only erasing the last frame
 
-    def generate_shots(self):
-        '''Generate shots fired from spaceship at a constant rate'''
-        if (self.count % ShooterObject.shot_rate == 0):         # every 50 loops the spaceship will generate a ShooterObject(bullet)
-            self.main_sprite.shoot('normal')                    # normal indicates the bullet type and specifies its properties upon creation.
+        Returns
+            bool: True to redraw the whole background
+        '''
+        if self.previous_rects is None or self.governor is None:
+            return True
+        return self.profiler.frame_count % self.governor.redraw_interval == 0
 
-    def generate_asteroids(self):
-        '''Generate asteroids at a random rate'''
-        # calling asteroid random number generator if numbers are the same then asteroid is generated and placed on screen
-        if Asteroid.ast_diff_setting[Asteroid.current_setting] == random.randint(0,Asteroid.ast_diff_setting[Asteroid.current_setting]):
-            self.a = Asteroid()
-
-    def generate_powerup(self):
-        '''Generate health and timed power ups at discrete intervals and game conditions'''
-        if self.count > self.powerup_health_timer:          # health has its own timer and now is completely unlinked to other powerup generation
-            if self.mothership.health_amt != 1000:          # only if the mothership has taken on some damage should powerups begin to generate
-                # powerup generation is a function of game health with a max generation rate of 300
-                if self.mothership.health_amt*2 == random.randint(0,self.mothership.health_amt*2 + 300): 
-                    self.p = Health_PowerUp()
-                    self.powerup_health_timer = self.count + 500 # cooldown timer for power ups are set at ~8 seconds
-        
-        if self.count > self.powerup_timer:             # power up cooldown has expired 
-            if TimedPowerUp.activated == False:         # only allow power up generation if a powerup isn't in current use.
-                if self.mothership.health_amt >= 500:   # havin' a good time then you should get a double XP
-                    if 1000 == random.randint(0,1000):
-                        TimedPowerUp('Double XP')
-                        self.powerup_timer = self.count + 500 # setting cooldown for powerups ~8 seconds
-                
-                if self.mothership.health_amt <= 500:   # about t' die might need Insta-Kill
-                    if 1000 == random.randint(0,1000):
-                        TimedPowerUp('Insta-Kill')      
-                        self.powerup_timer = self.count + 500
+    def redraw_window(self, alpha=1):
+        '''Redraw all objects onto screen
 
-    def handle_collisions(self):
-        '''Loop through all object types on screen and determine if collisions have occurred'''
-        for powerup in Health_PowerUp.current_powerups:
-            if (powerup.x > self.main_sprite.x) and (powerup.x < self.main_sprite.x + self.main_sprite.width)\
-                 and (powerup.y + powerup.height > self.main_sprite.y)\
-                      and (powerup.y + powerup.height < self.main_sprite.y + self.main_sprite.height): # within boundaries of main sprite
-                if powerup.activated == False:                          # set so power up can only give mothership health once.
-                    self.mothership.health_amt += powerup.health_add    # increment mothership's health
-                    self.mothership.update_damage()                     # update motherships damage
-                    powerup.activated = True                            # activate powerup
-            if powerup.activated == True:
-                if powerup.powerup_display_timer > 25:                  # turn off powerup activate after counter has reached 25
-                    powerup.activated = False 
-                    Health_PowerUp.current_powerups.pop(Health_PowerUp.current_powerups.index(powerup))
-                    del powerup                                         # remove powerup from instance list and delete
+        Args
+            alpha (float): fraction of the way from the previous tick's positions to the current ones
 
-        for t_powerup in TimedPowerUp.current_powerups:
-            if (t_powerup.x > self.main_sprite.x) and (t_powerup.x < self.main_sprite.x + self.main_sprite.width)\
-                    and (t_powerup.y + t_powerup.height > self.main_sprite.y)\
-                         and (t_powerup.y + t_powerup.height < self.main_sprite.y + self.main_sprite.height): #within boundaries
-                if TimedPowerUp.activated == False:                     # only turn switch if False, this keeps actions from repeating
-                    TimedPowerUp.activated = True
-                    t_powerup.effect_timer = self.count                 # setting powerup timer to current game loop number
-            if TimedPowerUp.activated == True:
-                if self.count - t_powerup.effect_timer > t_powerup.powerup_duration: # ~10 seconds worth of powerup
-                    TimedPowerUp.activated = False                      # undos all effects from activation
-                    TimedPowerUp.current_powerups.pop(TimedPowerUp.current_powerups.index(t_powerup))
-                    del t_powerup                                       # remove of instance list and delete 
-        
-        for bullet in ShooterObject.shots_queue:
-            for asteroid in Asteroid.asteroid_lst:
-                if (bullet.start_x >= asteroid.x) and (bullet.start_x <= asteroid.x + asteroid.width)\
-                         and (bullet.end_y <= asteroid.y + asteroid.width): # check to see if bullet is within asteroid hit box
-                    # if within hit box, then more complex calculation to see if bullet is within radius is performed.
-                    if ((bullet.end_y - (asteroid.y + (asteroid.width/2)))**2 + (bullet.start_x - (asteroid.x + (asteroid.width/2)))**2)**0.5 < (asteroid.width/2):
-                        bullet.hit = True                                   # register hit and reduce asteroid health
-                        if (TimedPowerUp.activated == True) and (TimedPowerUp.current_option == 'Insta-Kill'): # powerup effect
-                            asteroid.health_amt = 0                         # instantly reduct asteroid health to zero.
-                            asteroid.damage_taken += bullet.damage
-                        else:
-                            asteroid.health_amt -= bullet.damage            # if no powerup then just reduce ast health by bullet damage
-                            asteroid.damage_taken += bullet.damage
-                        asteroid.update_health_bars()
-
-                if (asteroid.health_amt <= 0) or (asteroid.y + asteroid.width > 650):   # check deletion conditions
-                    if asteroid.health_amt <= 0:                        
-                        if (TimedPowerUp.activated == True) and (TimedPowerUp.current_option == 'Double XP'): # powerup effect
-                            self.score.score += (asteroid.width * 2)                    # double the amount of XP you receive
-                        else:
-                            self.score.score += asteroid.width                          # increment score asteroid width amt
-                        asteroid.destruction_method = 'negative health'                 # method informs that xp gain should be shown on screen
-                    elif (asteroid.y + asteroid.width > 650):                           # has made contact with mothership
-                        asteroid.destruction_method = 'off screen'
-                        self.mothership.health_amt -= asteroid.damage                   # update mothership health and damage
-                        self.mothership.damage_taken += asteroid.damage
-                        self.mothership.update_damage() 
-                        
-                    Asteroid.asteroid_lst.pop(Asteroid.asteroid_lst.index(asteroid))
-                    asteroid.generate_explosion()                                       # generate asteroid before deleting obj
-                    del asteroid 
-            
-            if (bullet.hit == True) or (bullet.start_y < 0):                            # check delete conditions
-                ShooterObject.shots_queue.pop(ShooterObject.shots_queue.index(bullet))
-                del bullet
-
-    def redraw_window(self):
-        '''Redraw all objects onto screen'''
-        self.display.window.blit(Boundary.back_ground, (0,0))                           # redrawing background.
-        pygame.draw.rect(self.display.window, (255,255,255), (475, 75, 15, 550), 2)     # empty rect for powerup display
-        self.mothership.draw(self.display.window)                                       # draw mothership
-        self.score.draw_score(self.display.window)                                      # draw score
-        self.main_sprite.draw(self.left_right_frame, self.center_frame,
-                             self.most_recent_key, self.display.window)                 # draw sprite
+        Returns
+            list: areas of the screen drawn to
+        '''
+        sim = self.simulation
+        window = self.display.window
+        if self.renderer is not None:
+            self.renderer.restore()                                                     # erase last frame's objects
+            rects = [sim.mothership.draw_health_bar(window)]                            # mothership image is in static layer
+        elif self.redraw_background():
+            window.blit(Boundary.back_ground, view.point(0, 0))                         # redrawing background.
+            pygame.draw.rect(window, (255,255,255), view.rect(*sim.powerup_bar), view.length(2))   # empty rect for powerup display
+            rects = [sim.mothership.draw(window)]                                       # draw mothership
+        else:
+            # only erase what was drawn last frame, the rest of the background is still on screen
+            origin_x, origin_y = view.point(0, 0)
+            for rect in self.previous_rects:
+                if rect:
+                    window.blit(Boundary.back_ground, rect, rect.move(-origin_x, -origin_y))
+            pygame.draw.rect(window, (255,255,255), view.rect(*sim.powerup_bar), view.length(2))   # empty rect for powerup display
+            rects = [sim.mothership.draw(window)]                                       # draw mothership
+        rects.append(sim.score.draw_score(window))                                      # draw score
+        rects.append(sim.main_sprite.draw(sim.left_right_frame, sim.center_frame,
+                                          sim.most_recent_key, window, alpha))          # draw sprite
         
-        # below progresses and draws asteroids/shooting objects
         for shot in ShooterObject.shots_queue:          # accessing every ShooterObject currently in creation (stored in current_shoots)      
-            shot.progress()                             # progressing each shot down the screen
-            shot.draw_line(self.display.window)         # drawing shot in new location
+            rects.append(shot.draw_line(window, alpha)) # drawing shot in new location
 
         for ast in Asteroid.asteroid_lst:               # iterating through list of asteroids generated
-            if self.count % 2 == 0:                     # move asteroids every other frame. keeps them from being too fast
-                ast.progress_down()
-            ast.draw_asteroid(self.display.window) 
+            rects.append(ast.draw_asteroid(window, alpha))
 
         for powerup in Health_PowerUp.current_powerups:
-            if powerup.activated == True:
-                if (self.count % 5) and (powerup.powerup_display_timer < 25):   # only display every five game loop frames if its been activate
-                    powerup.draw(self.display.window)
-                    powerup.powerup_display_timer += 1
-            else:    
-                powerup.progress()                                              # if in unactivated state then have it progress down the screen
-                powerup.draw(self.display.window)
+            if (powerup.activated == False) or powerup.text_visible:    # text only displayed every five game loop frames once activated
+                rects.append(powerup.draw(window, alpha))
 
         for powerup in TimedPowerUp.current_powerups:
             if TimedPowerUp.activated == True:
-                if (self.count % 5) and (powerup.powerup_display_timer < 25): 
-                    powerup.draw(self.display.window)
-                    powerup.powerup_display_timer += 1
-                if self.count - powerup.effect_timer < powerup.powerup_duration:    # if still under duration limit
+                if powerup.text_visible: 
+                    rects.append(powerup.draw(window))
+                if powerup.bar_height > 0:                                          # if still under duration limit
                     # fill powerup bar on right of screen with yellow
-                    pygame.draw.rect(self.display.window, (235, 204, 52), (475, 75, 15, 
-                                    round(powerup.powerup_duration * (1 - (self.count - powerup.effect_timer)/powerup.powerup_duration))))
+                    bar_x, bar_y, bar_width, _ = sim.powerup_bar
+                    rects.append(pygame.draw.rect(window, (235, 204, 52), view.rect(bar_x, bar_y, bar_width, powerup.bar_height)))
             else:    
-                powerup.progress()                                                  # if not activated progress down screen
-                powerup.draw(self.display.window)
+                rects.append(powerup.draw(window, alpha))
         
         for exp in Explosion.explosion_lst:
-            if self.count % 4 == 0:                                                 # switch explosion frame every four loops
-                exp.current_frame += 1
-
-            if exp.current_frame >= 11:                                             # past final frame so remove from explosion list and del object
-                Explosion.explosion_lst.pop(Explosion.explosion_lst.index(exp))
-                del exp
-            else: 
-                exp.draw(self.display.window)
+            rects.append(exp.draw(window))
+        return rects
     
     def __del__(self):
         '''Delete GameStart obj'''
         pass
 
     
+def parse_size(text):
+    '''Read a size given on the command line
+
+    Args
+        text (str): width and height such as 1920x1080
+
+    Returns
+        tuple: (width, height)
+    '''
+    try:
+        width, height = (int(size) for size in text.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'size must look like 1920x1080, not {text!r}')
+    return width, height
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Play Interstellar Escort. Options can be combined, e.g. '
+                                                 '--fullscreen --stream 127.0.0.1:7777 --record game.ier')
+    parser.add_argument('--replay', metavar='PATH',
+                        help='re-run a recorded game headless, check that it ends the same way and exit')
+    parser.add_argument('--record', metavar='PATH', help='save a replay of every game played')
+    parser.add_argument('--trace', metavar='PATH', default='frame_trace.json',
+                        help='file F4 exports the frame profile to')
+    parser.add_argument('--checkpoint', metavar='PATH', default='checkpoint.iec', help='file F6 saves a checkpoint to')
+    parser.add_argument('--resume', metavar='PATH', help='continue from a checkpoint saved with F6')
+    size = parser.add_mutually_exclusive_group()
+    size.add_argument('--resolution', type=parse_size, metavar='WxH',
+                      help='window size, sprites and fonts are scaled once when loaded')
+    size.add_argument('--offscreen', type=parse_size, metavar='WxH',
+                      help='window size, every frame is drawn at playfield size and scaled in one blit')
+    parser.add_argument('--fullscreen', action='store_true',
+                        help='open a fullscreen window, at the desktop resolution unless a size is given')
+    parser.add_argument('--playfield', type=parse_size, default=(500, 700), metavar='WxH',
+                        help='size of the playfield the game is played on')
+    parser.add_argument('--fps', type=int, default=60, help='frames drawn per second, 0 for as fast as possible')
+    parser.add_argument('--dirty-rects', action='store_true',
+                        help='only redraw the parts of the screen that change, cheaper on software rendering')
+    parser.add_argument('--full-quality', action='store_true', help='never lower drawing quality on slow frames')
+    parser.add_argument('--stream', metavar='ADDRESS', help='let spectators watch, e.g. 127.0.0.1:7777 or a socket path')
+    parser.add_argument('--spectate', metavar='ADDRESS', help='watch a game streamed with --stream instead of playing')
+    capture = parser.add_mutually_exclusive_group()
+    capture.add_argument('--capture', metavar='PATH', help='record every frame shown to a raw file')
+    capture.add_argument('--capture-png', metavar='DIR', help='record every frame shown to a directory of PNGs')
+    args = parser.parse_args(argv)
+
+    if args.replay is not None:                                     # re-run a recorded game headless and check the result
+        replay = Replay()
+        replay.load(args.replay)
+        start = time.perf_counter()
+        sim = replay.play()
+        elapsed = time.perf_counter() - start
+        print(f'{len(replay.inputs)} ticks in {elapsed:.2f}s, score {sim.score.score} (recorded {replay.final_score}), '
+              f'mothership health {sim.mothership.health_amt} (recorded {replay.final_health})')
+        return 0 if (sim.score.score == replay.final_score) and (sim.mothership.health_amt == replay.final_health) else 1
+
+    resolution = args.resolution or args.offscreen
+    if resolution is None and args.fullscreen:
+        resolution = (0, 0)                                         # playfield scaled to the desktop resolution
+    GameStart(dirty_rects=args.dirty_rects, fps=args.fps, replay_path=args.record, trace_path=args.trace,
+              resolution=resolution, scaling='offscreen' if args.offscreen else 'prescaled',
+              fullscreen=args.fullscreen, playfield=args.playfield, stream_address=args.stream,
+              spectate_address=args.spectate, checkpoint_path=args.checkpoint, resume_path=args.resume,
+              capture_path=args.capture or args.capture_png, capture_format='png' if args.capture_png else 'raw',
+              adaptive_quality=not args.full_quality)
+    return 0
+
+
 if __name__ == "__main__":
-    GameStart()  
\ No newline at end of file
+    sys.exit(main())
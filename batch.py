@@ -0,0 +1,211 @@
+import argparse
+import ast
+import concurrent.futures
+import importlib
+import itertools
+import json
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')   # games are run headless in every worker process
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import Interstellar_Escort as game
+
+try:
+    import numpy as np
+except ImportError:             # numpy is only needed to write .npz results
+    np = None
+
+
+# settings a sweep may change, by the name used on the command line
+PARAMETERS = {
+    'Asteroid.ast_diff_setting': (game.Asteroid, 'ast_diff_setting'),
+    'Asteroid.current_setting': (game.Asteroid, 'current_setting'),
+    'Asteroid.maximum_asteroid_amount': (game.Asteroid, 'maximum_asteroid_amount'),
+    'ShooterObject.shot_rate': (game.ShooterObject, 'shot_rate'),
+    'Simulation.health_powerup_cooldown': (game.Simulation, 'health_powerup_cooldown'),
+    'Simulation.powerup_cooldown': (game.Simulation, 'powerup_cooldown'),
+}
+
+# policies that can be named on the command line, anything else is looked up as module:callable
+POLICIES = {
+    'idle': None,
+    'autopilot': 'Interstellar_Escort:Autopilot',
+}
+
+STATS = ['survival_ticks', 'final_score', 'damage_taken', 'asteroids_killed']
+
+
+def load_policy(spec):
+    '''Create a policy from its name or import path
+
+    Args
+        spec (str): key of POLICIES or 'module:callable', where the callable takes no arguments and returns a
+            policy. A policy is called with the simulation before every tick and returns the inputs for it
+
+    Returns
+        callable: policy, None for a sprite that never moves
+    '''
+    spec = POLICIES.get(spec, spec)
+    if spec is None:
+        return None
+    module_name, _, attr = spec.partition(':')
+    factory = getattr(importlib.import_module(module_name), attr)
+    return factory()
+
+
+def play_game(task):
+    '''Play one headless game. Runs in a worker process
+
+    Args
+        task (tuple): settings as a tuple of (parameter name, value) pairs, seed, policy spec, maximum ticks,
+            whether to use vectorized collisions and a checkpoint file to start from (None for a new game)
+
+    Returns
+        tuple: survival ticks, final score, damage taken by the mothership and asteroids shot down
+    '''
+    settings, seed, policy_spec, max_ticks, vectorized, checkpoint_path = task
+    saved = {}
+    for name, value in settings:
+        cls, attr = PARAMETERS[name]
+        saved[name] = getattr(cls, attr)
+        setattr(cls, attr, value)
+    try:
+        sim = game.Simulation(seed=seed, vectorized_collisions=vectorized)
+        if checkpoint_path is not None:
+            load_checkpoint(checkpoint_path).restore(sim)
+            sim.reseed(seed)                        # every game forks from the checkpoint with its own dice
+        sim.run(load_policy(policy_spec), max_ticks)
+    finally:
+        for name, value in saved.items():           # workers are reused, so put the defaults back
+            cls, attr = PARAMETERS[name]
+            setattr(cls, attr, value)
+    return sim.count, sim.score.score, sim.mothership.damage_taken, sim.asteroids_destroyed
+
+
+checkpoints = {}                # loaded once per worker process, keyed by path
+
+
+def load_checkpoint(path):
+    '''Read a checkpoint file, or reuse it if this process has read it before
+
+    Args
+        path (str): checkpoint file saved with F6 or Checkpoint.save()
+
+    Returns
+        Checkpoint obj: loaded checkpoint
+    '''
+    if path not in checkpoints:
+        checkpoints[path] = game.Checkpoint()
+        checkpoints[path].load(path)
+    return checkpoints[path]
+
+
+def parse_settings(pairs):
+    '''Turn --set arguments into the grid of every combination of values
+
+    Args
+        pairs (list): lists of a parameter name followed by one or more Python literal values
+
+    Returns
+        list: settings of each grid point as tuples of (parameter name, value) pairs
+    '''
+    names = []
+    values = []
+    for name, *literals in pairs or []:
+        if name not in PARAMETERS:
+            raise SystemExit(f'unknown parameter {name}, choose from {", ".join(PARAMETERS)}')
+        if not literals:
+            raise SystemExit(f'no values given for {name}')
+        names.append(name)
+        values.append([ast.literal_eval(literal) for literal in literals])
+    return [tuple(zip(names, combination)) for combination in itertools.product(*values)]
+
+
+def write_results(path, columns):
+    '''Write results as columns, one list per field
+
+    Args
+        path (str): output file. A .npz file holds one numpy array per column, anything else is written as a
+            JSON object of lists
+        columns (dict): lists of values keyed by column name
+    '''
+    if path.endswith('.npz'):
+        if np is None:
+            raise SystemExit('writing .npz results requires numpy (pip install numpy)')
+        np.savez_compressed(path, **{name: np.array(values) for name, values in columns.items()})
+    else:
+        with open(path, 'w') as outfile:
+            json.dump(columns, outfile)
+
+
+def print_summary(columns, names):
+    '''Print the mean of every statistic for each grid point
+
+    Args
+        columns (dict): results keyed by column name
+        names (list): swept parameter names
+    '''
+    groups = {}
+    for row in range(len(columns['seed'])):
+        key = tuple(columns[name][row] for name in names)
+        groups.setdefault(key, []).append(row)
+    header = ''.join(f'{name.split(".")[-1]:>24}' for name in names) + ''.join(f'{stat:>18}' for stat in STATS)
+    print(header + f'{"games":>8}')
+    for key, rows in groups.items():
+        line = ''.join(f'{str(value):>24}' for value in key)
+        line += ''.join(f'{sum(columns[stat][row] for row in rows) / len(rows):>18.1f}' for stat in STATS)
+        print(line + f'{len(rows):>8}')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Play many headless Interstellar Escort games over a grid of '
+                                                 'settings on every core and collect per-game statistics.')
+    parser.add_argument('--games', type=int, default=100, help='games (seeds) per grid point')
+    parser.add_argument('--first-seed', type=int, default=0, help='seeds run from this value upwards')
+    parser.add_argument('--set', nargs='+', action='append', metavar=('NAME', 'VALUE'),
+                        help='parameter to sweep followed by its values as Python literals, may be repeated. '
+                             f'Parameters: {", ".join(PARAMETERS)}')
+    parser.add_argument('--policy', default='autopilot',
+                        help=f'player input: {", ".join(POLICIES)} or module:callable returning a policy')
+    parser.add_argument('--max-ticks', type=int, default=None, help='stop games that last longer than this')
+    parser.add_argument('--checkpoint', help='start every game from this checkpoint file, each with its seed '
+                                             'reseeding the random number generator')
+    parser.add_argument('--vectorized', action='store_true', help='use the numpy collision backend')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes, defaults to every core')
+    parser.add_argument('--output', default='batch_results.json', help='columnar results file (.json or .npz)')
+    args = parser.parse_args(argv)
+
+    grid = parse_settings(args.set)
+    names = [name for name, _ in grid[0]]
+    seeds = range(args.first_seed, args.first_seed + args.games)
+    tasks = [(settings, seed, args.policy, args.max_ticks, args.vectorized, args.checkpoint)
+             for settings in grid for seed in seeds]
+
+    columns = {name: [] for name in names}
+    columns['seed'] = []
+    columns.update({stat: [] for stat in STATS})
+    start = time.perf_counter()
+    workers = args.workers or os.cpu_count()
+    with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+        chunksize = max(1, len(tasks) // (workers * 8))         # few enough chunks to keep every worker busy
+        for done, (task, stats) in enumerate(zip(tasks, pool.map(play_game, tasks, chunksize=chunksize)), 1):
+            settings, seed = task[:2]
+            for name, value in settings:
+                columns[name].append(value if isinstance(value, (int, float)) else repr(value))
+            columns['seed'].append(seed)
+            for stat, value in zip(STATS, stats):
+                columns[stat].append(value)
+            if done % max(1, len(tasks) // 20) == 0:
+                print(f'{done}/{len(tasks)} games', file=sys.stderr)
+    elapsed = time.perf_counter() - start
+
+    write_results(args.output, columns)
+    print(f'{len(tasks)} games in {elapsed:.1f}s on {workers} workers, results written to {args.output}')
+    print_summary(columns, names)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,389 @@
+import argparse
+import json
+import os
+import platform
+import selectors
+import socket
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')   # benchmarks run without a screen or sound card
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+import Interstellar_Escort as game
+
+
+class Scenario:
+    '''A scripted game setup whose frame loop is measured by Benchmark.
+
+    The mothership is made invulnerable during a benchmark so that every scenario runs for the full number of
+    ticks.
+
+    Args
+        name (str): name used in reports and results files
+        description (str): one line description of the workload
+        settings (dict): class attribute overrides, keyed by (class, attribute name)
+        asteroid_fill (int): keep at least this many asteroids on screen, spawned at random heights
+        explosion_fill (int): keep at least this many explosions on screen
+        active_powerup (str): name of a TimedPowerUp that is active for the whole run
+
+    Attributes
+        name (str): storage of input argument name
+        description (str): storage of input argument description
+        settings (dict): storage of input argument settings
+        asteroid_fill (int): storage of input argument asteroid_fill
+        explosion_fill (int): storage of input argument explosion_fill
+        active_powerup (str): storage of input argument active_powerup
+        saved_settings (dict): class attribute values replaced by apply()
+    '''
+    def __init__(self, name, description, settings=None, asteroid_fill=0, explosion_fill=0, active_powerup=None):
+        self.name = name
+        self.description = description
+        self.settings = settings or {}
+        self.asteroid_fill = asteroid_fill
+        self.explosion_fill = explosion_fill
+        self.active_powerup = active_powerup
+        self.saved_settings = {}
+
+    def apply(self):
+        '''Set the scenario's class attribute overrides'''
+        for (cls, attr), value in self.settings.items():
+            self.saved_settings[(cls, attr)] = getattr(cls, attr)
+            setattr(cls, attr, value)
+
+    def restore(self):
+        '''Put back the class attributes replaced by apply()'''
+        for (cls, attr), value in self.saved_settings.items():
+            setattr(cls, attr, value)
+        self.saved_settings = {}
+
+    def setup(self, sim, ticks):
+        '''Prepare a new simulation before the first tick
+
+        Args
+            sim (Simulation obj): simulation about to be benchmarked
+            ticks (int): number of ticks that will be run
+        '''
+        if self.active_powerup is not None:
+            powerup = game.TimedPowerUp(self.active_powerup, sim.rng, sim.width)
+            game.TimedPowerUp.activated = True
+            powerup.effect_timer = 0
+            powerup.powerup_duration = ticks + 1                    # lasts for the whole run
+
+    def before_tick(self, sim):
+        '''Top up asteroids and explosions before a tick
+
+        Args
+            sim (Simulation obj): simulation about to be stepped
+        '''
+        while len(game.Asteroid.asteroid_lst) < self.asteroid_fill:
+            asteroid = game.Asteroid.pool.acquire(sim.rng, sim.width)
+            # anywhere between the top of the screen and the mothership
+            asteroid.y = asteroid.prev_y = sim.rng.randrange(-asteroid.width, sim.mothership.y - asteroid.width)
+        while len(game.Explosion.explosion_lst) < self.explosion_fill:
+            exp = game.Explosion.pool.acquire(sim.rng.randrange(0, sim.width - 100), sim.rng.randrange(0, sim.height - 100),
+                                              50, 'negative health')
+            sim.schedule_explosion_end(exp)
+
+    def after_tick(self, sim):
+        '''Keep the mothership alive
+
+        Args
+            sim (Simulation obj): simulation that was just stepped
+        '''
+        if sim.game_over or sim.mothership.health_amt < 500:
+            sim.mothership.health_amt = 1000
+            sim.mothership.update_damage()
+            sim.game_over = False
+
+
+SCENARIOS = [
+    Scenario('default', 'default difficulty'),
+    Scenario('asteroids_100', '100 asteroids on screen', {(game.Asteroid, 'maximum_asteroid_amount'): 100}, asteroid_fill=100),
+    Scenario('asteroids_1000', '1000 asteroids on screen', {(game.Asteroid, 'maximum_asteroid_amount'): 1000}, asteroid_fill=1000),
+    Scenario('shot_rate_3', 'a shot every 3 ticks instead of 15', {(game.ShooterObject, 'shot_rate'): 3}),
+    Scenario('explosion_storm', '60 explosions with score popups on screen', explosion_fill=60),
+    Scenario('powerup_active', 'Double XP active for the whole run', active_powerup='Double XP'),
+]
+
+
+class Benchmark:
+    '''Runs scenarios headless and measures the time and memory allocated by each phase of the frame loop.
+
+    Phases are timed by wrapping the methods of the simulation, main sprite and game window with timers, so the
+    code measured is exactly the code the game runs. Allocations are measured in a second, shorter pass with
+    tracemalloc enabled, since tracing slows everything down.
+
+    Asteroid and powerup spawning is timed as the run_events phase, which replaced the generate_asteroids and
+    generate_powerup phases when spawns moved onto the Scheduler. Results files saved before then have those two
+    phases instead, so --compare has no baseline for run_events against them.
+
+    Class Attributes
+        frame_budget_ms (float): time available per frame at 60 frames per second
+
+    Args
+        ticks (int): number of ticks timed per scenario
+        alloc_ticks (int): number of ticks traced for allocations per scenario
+        seed (int): seed of every scenario's simulation
+        vectorized_collisions (bool): use the numpy collision backend
+        spectators (int): stream every tick to this many spectators connected over local TCP, which read and
+            discard the stream on a background thread
+
+    Attributes
+        ticks (int): storage of input argument ticks
+        alloc_ticks (int): storage of input argument alloc_ticks
+        seed (int): storage of input argument seed
+        vectorized_collisions (bool): storage of input argument vectorized_collisions
+        game (GameStart obj): game window used for drawing, created without starting the game loop
+        samples (dict): lists of per tick durations in seconds keyed by phase name, for the current pass
+        allocations (dict): lists of per tick (peak, net) allocated bytes keyed by phase name
+        tracing (bool): whether the current pass is tracing allocations
+        stream (SpectatorServer obj): server the ticks are streamed to, None without spectators
+        spectator_sockets (list): sockets of the spectators
+    '''
+    frame_budget_ms = 1000 / 60
+
+    def __init__(self, ticks=2000, alloc_ticks=200, seed=0, vectorized_collisions=False, spectators=0):
+        self.ticks = ticks
+        self.alloc_ticks = alloc_ticks
+        self.seed = seed
+        self.vectorized_collisions = vectorized_collisions
+        self.game = game.GameStart(play=False)
+        self.samples = {}
+        self.allocations = {}
+        self.tracing = False
+        self.stream = None
+        self.spectator_sockets = []
+        if spectators:
+            self.stream = game.SpectatorServer('127.0.0.1:0')      # any free port
+            address = self.stream.listener.getsockname()
+            # spectators only drain the stream, a SpectatorClient would reset the simulation being measured
+            self.spectator_sockets = [socket.create_connection(address) for _ in range(spectators)]
+            threading.Thread(target=self.drain, daemon=True).start()
+
+    def drain(self):
+        '''Read and discard everything streamed to the spectator sockets. Runs on a background thread'''
+        selector = selectors.DefaultSelector()
+        for connection in self.spectator_sockets:
+            selector.register(connection, selectors.EVENT_READ)
+        while True:
+            for key, _ in selector.select():
+                if not key.fileobj.recv(1 << 16):
+                    selector.unregister(key.fileobj)
+
+    def timed(self, phase, func):
+        '''Wrap a function so that every call is added to the current tick's sample for a phase
+
+        Args
+            phase (str): name of phase
+            func (callable): function to wrap
+
+        Returns
+            callable: wrapped function
+        '''
+        def wrapper(*args, **kwargs):
+            if self.tracing:
+                start_size = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                result = func(*args, **kwargs)
+                size, peak = tracemalloc.get_traced_memory()
+                sample = self.allocations[phase][-1]
+                sample[0] += peak - start_size
+                sample[1] += size - start_size
+            else:
+                start = time.perf_counter()
+                result = func(*args, **kwargs)
+                self.samples[phase][-1] += time.perf_counter() - start
+            return result
+        return wrapper
+
+    def instrument(self, sim):
+        '''Wrap the methods of a simulation and the main sprite with timers
+
+        Args
+            sim (Simulation obj): simulation to instrument
+        '''
+        for phase in ['handle_inputs', 'generate_shots', 'run_events', 'build_grid', 'handle_powerups',
+                      'handle_collisions', 'advance_objects']:
+            setattr(sim, phase, self.timed(phase, getattr(sim, phase)))
+        sim.main_sprite.draw = self.timed('Character.draw', sim.main_sprite.draw)
+
+    def run_pass(self, scenario, ticks, tracing):
+        '''Run a scenario once, collecting either timings or allocations
+
+        Args
+            scenario (Scenario obj): scenario to run
+            ticks (int): number of ticks to run
+            tracing (bool): collect allocations instead of timings
+        '''
+        phases = ['tick', 'handle_inputs', 'generate_shots', 'run_events', 'build_grid', 'handle_powerups',
+                  'handle_collisions', 'advance_objects', 'redraw_window', 'Character.draw', 'display.update', 'frame']
+        if self.stream is not None:
+            phases.insert(phases.index('redraw_window'), 'stream.publish')
+        self.samples = {phase: [] for phase in phases}
+        self.allocations = {phase: [] for phase in phases}
+        self.tracing = tracing
+        pilot = game.Autopilot()
+        sim = game.Simulation(seed=self.seed, vectorized_collisions=self.vectorized_collisions)
+        self.instrument(sim)
+        self.game.simulation = sim
+        scenario.setup(sim, ticks)
+        step = self.timed('tick', sim.step)
+        redraw = self.timed('redraw_window', self.game.redraw_window)
+        update = self.timed('display.update', pygame.display.update)
+        if self.stream is not None:
+            publish = self.timed('stream.publish', self.stream.publish)
+        frame_start = 0
+        if tracing:
+            tracemalloc.start()
+        for _ in range(ticks):
+            for phase in phases:
+                self.samples[phase].append(0)
+                self.allocations[phase].append([0, 0])
+            scenario.before_tick(sim)
+            inputs = pilot(sim)
+            frame_start = time.perf_counter()
+            step(inputs)
+            if self.stream is not None:
+                publish(sim)
+            redraw()
+            update()
+            self.samples['frame'][-1] = time.perf_counter() - frame_start
+            scenario.after_tick(sim)
+            pygame.event.pump()
+        if tracing:
+            tracemalloc.stop()
+
+    def run(self, scenario):
+        '''Benchmark one scenario
+
+        Args
+            scenario (Scenario obj): scenario to run
+
+        Returns
+            dict: per phase p50, p99 and mean milliseconds per tick, allocated bytes per tick and whether the
+                p99 frame time is over the 60 FPS budget
+        '''
+        scenario.apply()
+        try:
+            stream_start = self.stream.stats() if self.stream is not None else None
+            self.run_pass(scenario, self.ticks, tracing=False)
+            timings = {phase: self.summarize(samples) for phase, samples in self.samples.items()}
+            stream = self.stream_summary(stream_start) if self.stream is not None else None
+            self.run_pass(scenario, self.alloc_ticks, tracing=True)
+            allocations = {phase: {'peak_bytes': sum(s[0] for s in samples) // len(samples),
+                                   'net_bytes': sum(s[1] for s in samples) // len(samples)}
+                           for phase, samples in self.allocations.items() if phase != 'frame'}
+        finally:
+            scenario.restore()
+        return {'description': scenario.description, 'ticks': self.ticks, 'phases': timings,
+                'allocations': allocations, 'stream': stream,
+                'over_budget': timings['frame']['p99_ms'] > self.frame_budget_ms}
+
+    def stream_summary(self, start):
+        '''Bandwidth of the stream since earlier statistics were taken
+
+        Args
+            start (dict): SpectatorServer.stats() before the ticks being summarized
+
+        Returns
+            dict: spectators connected, mean bytes per delta frame, bytes per second sent to each spectator at
+                the tick rate, keyframes sent and frames skipped for spectators that fell behind
+        '''
+        end = self.stream.stats()
+        frames = end['frames'] - start['frames']
+        encoded = end['bytes_per_frame'] * end['frames'] - start['bytes_per_frame'] * start['frames']
+        bytes_per_frame = encoded / frames if frames else 0
+        return {'spectators': end['spectators'], 'bytes_per_frame': bytes_per_frame,
+                'bytes_per_second': bytes_per_frame * game.Simulation.tick_rate,
+                'keyframes': end['keyframes'] - start['keyframes'], 'skipped': end['skipped'] - start['skipped']}
+
+    def summarize(self, samples):
+        '''Percentiles of a list of durations
+
+        Args
+            samples (list): durations in seconds
+
+        Returns
+            dict: p50, p99 and mean in milliseconds
+        '''
+        ordered = sorted(samples)
+        return {'p50_ms': ordered[len(ordered) // 2] * 1000,
+                'p99_ms': ordered[min(len(ordered) - 1, (len(ordered) * 99) // 100)] * 1000,
+                'mean_ms': sum(ordered) / len(ordered) * 1000}
+
+
+def git_commit():
+    '''Short hash of the checked out commit, None if it can't be determined'''
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(results, baseline=None):
+    '''Print a table of p50/p99 times per phase, with the change from a baseline results file if given
+
+    Args
+        results (dict): results produced by main()
+        baseline (dict): earlier results to compare against
+    '''
+    for name, result in results['scenarios'].items():
+        flag = '  OVER 16.7 ms BUDGET' if result['over_budget'] else ''
+        print(f"\n{name}: {result['description']}{flag}")
+        print(f"  {'phase':<20}{'p50 ms':>10}{'p99 ms':>10}{'alloc B':>10}{'p99 change':>12}")
+        for phase, timing in result['phases'].items():
+            change = ''
+            if baseline and name in baseline['scenarios'] and phase in baseline['scenarios'][name]['phases']:
+                old = baseline['scenarios'][name]['phases'][phase]['p99_ms']
+                if old:
+                    change = f"{(timing['p99_ms'] - old) / old * 100:+.0f}%"
+            alloc = result['allocations'].get(phase, {}).get('peak_bytes', '')
+            print(f"  {phase:<20}{timing['p50_ms']:>10.3f}{timing['p99_ms']:>10.3f}{alloc:>10}{change:>12}")
+        stream = result.get('stream')
+        if stream:
+            print(f"  streamed to {stream['spectators']} spectators: {stream['bytes_per_frame']:.0f} B per tick "
+                  f"({stream['bytes_per_second'] / 1024:.1f} KiB/s each), {stream['keyframes']} keyframes, "
+                  f"{stream['skipped']} frames skipped")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the Interstellar Escort frame loop headless.')
+    parser.add_argument('--ticks', type=int, default=2000, help='ticks timed per scenario')
+    parser.add_argument('--alloc-ticks', type=int, default=200, help='ticks traced for allocations per scenario')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--scenario', action='append', choices=[s.name for s in SCENARIOS],
+                        help='scenario to run, may be repeated. Runs all scenarios by default')
+    parser.add_argument('--vectorized', action='store_true', help='use the numpy collision backend')
+    parser.add_argument('--spectators', type=int, default=0,
+                        help='stream every tick to this many local spectators and measure the cost')
+    parser.add_argument('--output', help='write results to this JSON file')
+    parser.add_argument('--compare', help='JSON results file from an earlier run to compare against')
+    args = parser.parse_args(argv)
+
+    bench = Benchmark(args.ticks, args.alloc_ticks, args.seed, args.vectorized, args.spectators)
+    results = {'commit': git_commit(), 'python': platform.python_version(), 'pygame': pygame.version.ver,
+               'seed': args.seed, 'vectorized_collisions': args.vectorized, 'scenarios': {}}
+    for scenario in SCENARIOS:
+        if args.scenario and scenario.name not in args.scenario:
+            continue
+        results['scenarios'][scenario.name] = bench.run(scenario)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as infile:
+            baseline = json.load(infile)
+    print_report(results, baseline)
+    if args.output:
+        with open(args.output, 'w') as outfile:
+            json.dump(results, outfile, indent=2)
+    return 1 if any(result['over_budget'] for result in results['scenarios'].values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,6 @@
+import os
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')   # the tests never open a window or play sound
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
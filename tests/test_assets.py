@@ -0,0 +1,39 @@
+import threading
+
+import pygame
+
+import Interstellar_Escort as game
+
+
+def test_background_fonts_are_created_on_the_main_thread(monkeypatch):
+    threads = []
+    sysfont = pygame.font.SysFont
+
+    def record(*args):
+        threads.append(threading.current_thread())
+        return sysfont(*args)
+
+    monkeypatch.setattr(pygame.font, 'SysFont', record)
+    cache = game.AssetCache()
+    cache.load_async({'fonts': [('comicsans', 30, True), ('arial', 20)]})
+    cache.wait()
+    assert threads == [threading.main_thread()] * 2
+    assert cache.font_loaded('comicsans', game.view.length(30), True)
+    assert cache.font_loaded('arial', game.view.length(20))
+    assert cache.stats()['misses'] == 2 and cache.stats()['pending'] == 0
+
+
+def test_sprite_requests_are_counted_once(tmp_path, monkeypatch):
+    path = str(tmp_path / 'square.png')
+    pygame.image.save(pygame.Surface((10, 10)), path)
+    cache = game.AssetCache()
+    cache.sprite(path)
+    cache.sprite(path)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    monkeypatch.setattr(game.view, 'scale', 2)
+    scaled = cache.sprite(path)
+    assert scaled.get_size() == (20, 20)
+    assert cache.sprite(path) is scaled
+    assert (cache.hits, cache.misses) == (2, 2)
+    assert cache.stats()['sprites'] == 1
@@ -0,0 +1,69 @@
+import Interstellar_Escort as game
+
+
+def state(sim):
+    return (sim.count, sim.score.score, sim.mothership.health_amt, sim.asteroids_destroyed, sim.main_sprite.x,
+            len(game.Asteroid.asteroid_lst), len(game.ShooterObject.shots_queue))
+
+
+def play_on(sim, ticks):
+    policy = game.Autopilot()
+    for _ in range(ticks):
+        if sim.game_over:
+            break
+        sim.step(policy(sim))
+    return state(sim)
+
+
+def test_save_and_restore_continues_the_same_game(tmp_path):
+    sim = game.Simulation(seed=3)
+    play_on(sim, 900)
+    checkpoint = game.Checkpoint()
+    checkpoint.capture(sim)
+    path = str(tmp_path / 'checkpoint.iec')
+    checkpoint.save(path)
+    expected = play_on(sim, 1500)
+
+    loaded = game.Checkpoint()
+    loaded.load(path)
+    resumed = game.Simulation(seed=99)              # everything, the random number generator too, comes from the file
+    loaded.restore(resumed)
+    assert resumed.count == 900
+    assert play_on(resumed, 1500) == expected
+
+
+def test_rewind_goes_back_to_an_earlier_checkpoint():
+    sim = game.Simulation(seed=3)
+    ring = game.CheckpointRing(slots=5, interval=60)
+    policy = game.Autopilot()
+    for _ in range(600):
+        sim.step(policy(sim))
+        ring.record(sim)
+    assert len(ring.kept()) == 5                    # older checkpoints were overwritten
+    assert ring.rewind(sim, 2) == 480
+    assert sim.count == 480
+    assert ring.latest().tick == 480
+
+    expected = play_on(sim, 300)
+    ring.latest().restore(sim)
+    assert play_on(sim, 300) == expected
+
+
+def test_reseeded_forks_redraw_pending_spawns():
+    sim = game.Simulation(seed=3)
+    play_on(sim, 900)
+    checkpoint = game.Checkpoint()
+    checkpoint.capture(sim)
+    original = sim.events.pending()
+
+    spawns = []
+    for seed in [10, 11]:
+        fork = game.Simulation(seed=seed)
+        checkpoint.restore(fork)
+        fork.reseed(seed)
+        assert fork.seed == seed
+        pending = fork.events.pending()
+        assert [name for _, name, _ in pending].count('spawn_asteroid') == 1
+        spawns.append([event for event in pending if event[1].startswith('spawn')])
+    assert spawns[0] != spawns[1]
+    assert spawns[0] != [event for event in original if event[1].startswith('spawn')]
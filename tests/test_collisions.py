@@ -0,0 +1,39 @@
+import pytest
+
+import Interstellar_Escort as game
+
+
+def play(seed, vectorized):
+    sim = game.Simulation(seed=seed, vectorized_collisions=vectorized)
+    sim.run(game.Autopilot(), 20000)
+    return sim.count, sim.score.score, sim.asteroids_destroyed, sim.mothership.health_amt
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2, 7])
+def test_vectorized_matches_scalar(seed):
+    pytest.importorskip('numpy')
+    assert play(seed, True) == play(seed, False)
+
+
+def test_shot_hits_first_asteroid_along_its_path():
+    sim = game.Simulation(seed=0)
+    near = game.Asteroid.pool.acquire(sim.rng, sim.width)
+    far = game.Asteroid.pool.acquire(sim.rng, sim.width)
+    for asteroid, y in [(near, 300), (far, 200)]:
+        asteroid.x, asteroid.width, asteroid.y, asteroid.prev_y = 100, 50, y, y
+    shot = game.ShooterObject.pool.acquire('normal', 125, 400)
+    shot.prev_start_y = 430                         # tip swept from 420 right through the near asteroid
+    shot.start_y, shot.end_y = 250, 240             # and ends inside the far one
+    sim.build_grid()
+    assert sim.shot_hits() == [(shot, near)]
+
+
+def test_shot_does_not_hit_asteroid_beside_its_path():
+    sim = game.Simulation(seed=0)
+    asteroid = game.Asteroid.pool.acquire(sim.rng, sim.width)
+    asteroid.x, asteroid.width, asteroid.y, asteroid.prev_y = 100, 50, 300, 300
+    shot = game.ShooterObject.pool.acquire('normal', 160, 400)
+    shot.prev_start_y = 430
+    shot.start_y, shot.end_y = 250, 240
+    sim.build_grid()
+    assert sim.shot_hits() == []
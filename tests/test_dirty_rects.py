@@ -0,0 +1,32 @@
+import Interstellar_Escort as game
+
+
+def test_only_the_areas_drawn_last_frame_and_this_frame_are_updated():
+    start = game.GameStart(dirty_rects=True, play=False)
+    sim = start.simulation = game.Simulation(seed=0)
+    renderer = start.renderer
+    renderer.reset(sim)
+    window = start.display.window
+    updates = []
+    start.display.update = lambda rects=None: updates.append(rects)
+
+    def frame():
+        renderer.restore()
+        rects = start.redraw_window()
+        renderer.update(rects)
+        return [rect for rect in rects if rect]
+
+    first = frame()
+    assert updates == [None] and renderer.updated_area == 1      # the whole screen after a reset
+    sprite = sim.main_sprite
+    old_center = (sprite.x + sprite.width//2, sprite.y + sprite.height//2)
+    marker = (1, 300)                                            # nothing is drawn here
+    window.set_at(marker, (255, 0, 0))
+    for _ in range(30):
+        sim.step(game.INPUT_LEFT)
+    second = frame()
+    assert updates[1] == first + second
+    assert 0 < renderer.updated_area < 0.5
+    assert tuple(window.get_at(marker))[:3] == (255, 0, 0)       # outside the dirty areas, left alone
+    assert sprite.x + sprite.width < old_center[0]
+    assert window.get_at(old_center) == renderer.static.get_at(old_center)  # where the sprite was is erased
@@ -0,0 +1,52 @@
+import pytest
+
+import Interstellar_Escort as game
+
+
+def make_pool():
+    store = game.EntityStore([('y', 'i'), ('velocity', 'i')], capacity=2)
+
+    class Body:
+        __slots__ = ('pool_index',)
+        y = store.field('y')
+        velocity = store.field('velocity')
+
+        def reset(self, y, velocity):
+            self.y = y
+            self.velocity = velocity
+
+    live = []
+    return store, live, game.ObjectPool(Body, live, store=store)
+
+
+def test_rows_follow_their_objects():
+    store, live, pool = make_pool()
+    bodies = [pool.acquire(y, y // 10) for y in [10, 20, 30, 40, 50]]
+    assert store.count == 5 and store.capacity == 8     # grown by doubling
+    assert list(store.columns['y'][:5]) == [10, 20, 30, 40, 50]
+
+    pool.release(bodies[1])                             # last row moves into the gap along with its object
+    assert store.count == 4
+    assert list(store.columns['y'][:4]) == [10, 50, 30, 40]
+    assert [body.y for body in live] == [10, 50, 30, 40]
+    bodies[4].y = 55
+    assert store.columns['y'][1] == 55
+    pool.release_all()
+    assert store.count == 0
+
+
+@pytest.mark.parametrize('numpy_rows', [0, 1000])
+def test_column_passes_only_touch_live_rows(monkeypatch, numpy_rows):
+    if numpy_rows == 0:
+        pytest.importorskip('numpy')
+    monkeypatch.setattr(game.EntityStore, 'numpy_rows', numpy_rows)
+    store, live, pool = make_pool()
+    for y in [10, 20, 30]:
+        pool.acquire(y, 2)
+    pool.release(live[2])                               # dead row still holds 30, 2
+    store.shift('y', 'velocity')
+    assert list(store.columns['y'][:3]) == [12, 22, 30]
+    store.shift('y', 'velocity', -1)
+    store.shift('y', 'velocity', -1)
+    store.copy('velocity', 'y')
+    assert list(store.columns['velocity'][:3]) == [8, 18, 2]
@@ -0,0 +1,51 @@
+import Interstellar_Escort as game
+
+
+def read_lines(path):
+    with open(path) as infile:
+        return infile.read().splitlines()
+
+
+def test_append_and_top(tmp_path):
+    path = tmp_path / 'highscores.log'
+    store = game.HighScoreStore(str(path), legacy_path=None)
+    for score in [5, 40, 10, 30, 20, 50]:
+        store.add(score)
+    assert store.top() == [50, 40, 30, 20, 10]      # only the best five are kept in memory
+    store.close()
+    assert read_lines(path) == ['5', '40', '10', '30', '20', '50']
+
+    reopened = game.HighScoreStore(str(path), legacy_path=None)
+    assert reopened.count == 6
+    assert reopened.top(3) == [50, 40, 30]
+    reopened.close()
+
+
+def test_compaction_drops_damaged_lines(tmp_path):
+    path = tmp_path / 'highscores.log'
+    path.write_text('10\n20\nbroken\n30')           # a damaged line and a torn last write
+    store = game.HighScoreStore(str(path), compact_every=2, legacy_path=None)
+    assert store.damaged_lines == 2
+    assert store.top() == [20, 10]
+    store.add(40)
+    store.add(50)
+    store.close()
+    assert read_lines(path) == ['10', '20', '40', '50']
+    assert not (tmp_path / 'highscores.log.tmp').exists()
+
+
+def test_legacy_import_is_lazy(tmp_path):
+    path = tmp_path / 'highscores.log'
+    legacy = tmp_path / 'highscores.txt'
+    legacy.write_text('300\n100\n200\n')
+    store = game.HighScoreStore(str(path), legacy_path=str(legacy))
+    assert store.top() == [300, 200, 100]
+    store.flush()
+    assert not path.exists()                        # opening a store writes nothing
+    store.add(150)
+    store.close()
+    assert read_lines(path) == ['300', '100', '200', '150']
+
+    reopened = game.HighScoreStore(str(path), legacy_path=str(legacy))
+    assert reopened.count == 4                      # the legacy file isn't imported twice
+    reopened.close()
@@ -0,0 +1,35 @@
+import Interstellar_Escort as game
+
+
+class Item:
+    def reset(self, value):
+        self.value = value
+
+
+def test_release_swaps_the_last_live_object_into_the_gap():
+    live = []
+    pool = game.ObjectPool(Item, live, size=2)
+    first, second, third = (pool.acquire(value) for value in [1, 2, 3])
+    assert live == [first, second, third]
+    assert [item.pool_index for item in live] == [0, 1, 2]
+
+    pool.release(first)
+    assert live == [third, second]
+    assert (third.pool_index, second.pool_index, first.pool_index) == (0, 1, -1)
+    pool.release(second)                            # the last one, nothing moves
+    assert live == [third] and third.pool_index == 0
+
+    again = pool.acquire(4)
+    assert again is second and again.value == 4 and again.pool_index == 1
+    assert pool.stats() == {'live': 2, 'free': 1, 'created': 3, 'reused': 1, 'high_water': 3}
+
+
+def test_release_all_frees_every_object():
+    live = []
+    pool = game.ObjectPool(Item, live)
+    items = [pool.acquire(value) for value in range(5)]
+    pool.release_all()
+    assert live == [] and len(pool.free) == 5
+    assert all(item.pool_index == -1 for item in items)
+    assert pool.acquire(9) in items
+    assert pool.stats()['created'] == 5
@@ -0,0 +1,37 @@
+import json
+
+import pytest
+
+import Interstellar_Escort as game
+
+
+def test_ring_buffers_keep_the_latest_frames_and_their_spans(tmp_path, monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(game.time, 'perf_counter', lambda: now[0])
+    profiler = game.FrameProfiler(frames=2, spans=12)
+    for i in range(5):                              # frame i takes 4 + 2*i ms
+        profiler.begin_frame()
+        now[0] += 0.001
+        profiler.lap('clock.tick')
+        now[0] += 0.002 * (i + 1)
+        profiler.lap('redraw')
+        now[0] += 0.001
+        profiler.lap('redraw')                      # a phase can run twice in a frame
+        profiler.end_frame()
+
+    slots = profiler.recent_frames()
+    assert slots == [1, 0]                          # frames 3 and 4, oldest first
+    assert [profiler.frame_times[slot] for slot in slots] == pytest.approx([0.010, 0.012])
+    assert profiler.slowest_phase(slots[-1]) == ('redraw', pytest.approx(0.011))
+    assert profiler.recent_frames(1) == [0]
+
+    path = str(tmp_path / 'trace.json')
+    profiler.export_trace(path)
+    with open(path) as infile:
+        events = json.load(infile)['traceEvents']
+    frames = [event for event in events if event['name'] == 'frame']
+    assert [event['ts'] for event in frames] == pytest.approx([18000, 28000])
+    assert [event['dur'] for event in frames] == pytest.approx([10000, 12000])
+    spans = [event for event in events if event['name'] in ('clock.tick', 'redraw')]
+    assert len(spans) == 6                          # spans of overwritten frames are left out
+    assert spans[0]['ts'] == pytest.approx(18000)
@@ -0,0 +1,53 @@
+import pytest
+
+import Interstellar_Escort as game
+
+
+@pytest.fixture(autouse=True)
+def drawing_settings(monkeypatch):
+    # the governor sets these class attributes, put them back after every test
+    monkeypatch.setattr(game.Asteroid, 'draw_health_bars', game.Asteroid.draw_health_bars)
+    monkeypatch.setattr(game.Explosion, 'frame_step', game.Explosion.frame_step)
+    monkeypatch.setattr(game.Explosion, 'show_popups', game.Explosion.show_popups)
+
+
+def measure(governor, profiler, busy):
+    '''Record a frame that was busy for the given seconds and let the governor see it'''
+    slot = profiler.frame_count % len(profiler.frame_times)
+    profiler.phase_times[slot][profiler.phase_index['clock.tick']] = 0.0
+    profiler.frame_times[slot] = busy
+    profiler.frame_count += 1
+    governor.update(profiler)
+
+
+def test_slow_frames_lower_quality_until_reset():
+    profiler = game.FrameProfiler()
+    governor = game.QualityGovernor(1/60, window=2)
+    for _ in range(4):
+        measure(governor, profiler, 0.05)
+    assert governor.level == 2
+    assert not game.Asteroid.draw_health_bars and game.Explosion.frame_step == 2
+    measure(governor, profiler, 0.05)               # half a window left over from the last game
+    governor.reset()
+    assert governor.level == 0 and governor.busy == []
+    assert game.Asteroid.draw_health_bars and game.Explosion.frame_step == 1
+    measure(governor, profiler, 0.05)
+    assert governor.level == 0
+
+
+@pytest.mark.parametrize('level, redrawn', [(0, [True] * 8),
+                                            (4, [True, False, False, False, True, False, False, False])])
+def test_lowest_level_redraws_the_background_every_few_frames(level, redrawn):
+    start = game.GameStart(play=False)
+    start.simulation = game.Simulation(seed=0)
+    start.governor.set_level(level)
+    window = start.display.window
+    marker = game.view.point(1, 300)                # background that nothing is drawn over
+    drawn = []
+    for _ in range(8):
+        window.set_at(marker, (255, 0, 0))
+        start.profiler.begin_frame()
+        start.previous_rects = start.redraw_window()
+        start.profiler.end_frame()
+        drawn.append(tuple(window.get_at(marker))[:3] != (255, 0, 0))
+    assert drawn == redrawn
@@ -0,0 +1,47 @@
+import os
+
+import pygame
+
+import Interstellar_Escort as game
+
+
+def frame(surface, color):
+    surface.fill((0, 0, 0))
+    surface.fill(color, (5, 3, 20, 10))
+    surface.set_at((39, 29), (10, 200, 30))
+    return pygame.image.tostring(surface, 'RGB')
+
+
+def test_png_frames_hold_the_captured_pixels(tmp_path):
+    surface = pygame.Surface((40, 30))
+    recorder = game.FrameRecorder(str(tmp_path), surface, 'png')
+    expected = []
+    for color in [(255, 0, 0), (0, 0, 255)]:
+        expected.append(frame(surface, color))
+        assert recorder.capture()
+    recorder.close()
+    assert sorted(os.listdir(tmp_path)) == ['frame_000000.png', 'frame_000001.png']
+    for number, pixels in enumerate(expected):
+        image = pygame.image.load(str(tmp_path / f'frame_{number:06d}.png'))
+        assert image.get_size() == (40, 30)
+        assert pygame.image.tostring(image, 'RGB') == pixels
+    assert recorder.stats()['written'] == 2 and recorder.stats()['waiting'] == 0
+
+
+def test_raw_recording_layout(tmp_path):
+    surface = pygame.Surface((40, 30))
+    path = str(tmp_path / 'frames.raw')
+    recorder = game.FrameRecorder(path, surface, 'raw')
+    frame(surface, (255, 0, 0))
+    pixels = bytes(surface.get_buffer())
+    recorder.capture()
+    recorder.close()
+    with open(path, 'rb') as infile:
+        data = infile.read()
+    magic, width, height, pitch, bytesize, *_ = game.FrameRecorder.header.unpack_from(data)
+    assert (magic, width, height, pitch, bytesize) == (b'IEF1', 40, 30, surface.get_pitch(), surface.get_bytesize())
+    offset = game.FrameRecorder.header.size
+    number, seconds = game.FrameRecorder.frame_header.unpack_from(data, offset)
+    offset += game.FrameRecorder.frame_header.size
+    assert number == 0 and seconds >= 0
+    assert data[offset:] == pixels
@@ -0,0 +1,58 @@
+import pytest
+
+import Interstellar_Escort as game
+
+
+def record(width, height, seed, ticks=3000):
+    sim = game.Simulation(width, height, seed=seed)
+    replay = game.Replay(sim.seed, sim.width, sim.height)
+    policy = game.Autopilot()
+    while not sim.game_over and sim.count < ticks:
+        inputs = policy(sim)
+        replay.record(inputs)
+        sim.step(inputs)
+    replay.finish(sim)
+    return sim, replay
+
+
+@pytest.mark.parametrize('width, height', [(500, 700), (800, 600)])
+def test_record_and_verify(tmp_path, width, height):
+    sim, replay = record(width, height, seed=4)
+    path = str(tmp_path / 'game.ier')
+    replay.save(path)
+
+    loaded = game.Replay()
+    loaded.load(path)
+    assert (loaded.width, loaded.height) == (width, height)
+    assert loaded.inputs == replay.inputs
+    assert loaded.verify()
+    replayed = loaded.play()
+    assert (replayed.count, replayed.score.score) == (sim.count, sim.score.score)
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / 'old.ier'
+    path.write_bytes(b'IER3' + bytes(40))           # replay from before the playfield size was stored
+    with pytest.raises(ValueError):
+        game.Replay().load(str(path))
+
+
+def test_replay_checks_final_score_and_health(tmp_path):
+    sim, replay = record(500, 700, seed=1)
+    assert (replay.final_score, replay.final_health) == (sim.score.score, sim.mothership.health_amt)
+    path = str(tmp_path / 'game.ier')
+    replay.save(path)
+    loaded = game.Replay()
+    loaded.load(path)
+    assert (loaded.final_score, loaded.final_health) == (sim.score.score, sim.mothership.health_amt)
+    assert loaded.verify()
+
+    loaded.seed += 1                                # a different game with the same inputs
+    assert not loaded.verify()
+
+
+def test_same_seed_plays_the_same_game():
+    first, _ = record(500, 700, seed=6, ticks=1500)
+    first_state = (first.count, first.score.score, first.mothership.health_amt)
+    second, _ = record(500, 700, seed=6, ticks=1500)
+    assert (second.count, second.score.score, second.mothership.health_amt) == first_state
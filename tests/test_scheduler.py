@@ -0,0 +1,36 @@
+import Interstellar_Escort as game
+
+
+def test_events_run_by_tick_then_in_scheduling_order():
+    events = game.Scheduler()
+    ran = []
+    events.schedule(5, ran.append, 'b')
+    events.schedule(3, ran.append, 'a')
+    events.schedule(5, ran.append, 'c')
+    late = events.schedule(9, ran.append, 'late')
+    events.run_due(4)
+    assert ran == ['a']
+    events.run_due(5)
+    assert ran == ['a', 'b', 'c']
+    assert [(tick, name, args) for tick, name, args in events.pending()] == [(9, 'append', ('late',))]
+    events.cancel(late)
+    events.cancel(late)                             # cancelling twice does nothing
+    events.run_due(100)
+    assert ran == ['a', 'b', 'c']
+    assert (events.fired, events.cancelled) == (3, 1)
+
+
+def test_callbacks_can_schedule_events_due_the_same_tick():
+    events = game.Scheduler()
+    ran = []
+
+    def chain(n):
+        ran.append(n)
+        if n < 3:
+            events.schedule(2, chain, n + 1)
+
+    events.schedule(2, chain, 0)
+    events.schedule(2, ran.append, 'after')
+    events.run_due(2)
+    assert ran == [0, 'after', 1, 2, 3]
+    assert events.pending() == []
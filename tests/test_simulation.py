@@ -0,0 +1,56 @@
+import pytest
+
+import Interstellar_Escort as game
+
+
+def test_runs_headless_until_the_mothership_is_destroyed():
+    sim = game.Simulation(seed=2)
+    score = sim.run()                               # nobody at the controls
+    assert sim.game_over
+    assert sim.mothership.health_amt <= 0
+    assert score == sim.score.score > 0
+    count = sim.count
+    assert sim.step() is True                       # a finished game doesn't move on
+    assert sim.count == count
+
+
+def test_inputs_move_the_main_sprite():
+    sim = game.Simulation(seed=2)
+    start = sim.main_sprite.x
+    for _ in range(10):
+        sim.step(game.INPUT_LEFT)
+    assert sim.main_sprite.x < start
+    for _ in range(20):
+        sim.step(game.INPUT_RIGHT)
+    assert sim.main_sprite.x > start
+
+
+def test_only_the_newest_simulation_can_be_used():
+    first = game.Simulation(seed=2)
+    first.step()
+    checkpoint = game.Checkpoint()
+    checkpoint.capture(first)
+    second = game.Simulation(seed=3)                # empties the shared entity lists
+    with pytest.raises(RuntimeError):
+        first.step()
+    with pytest.raises(RuntimeError):
+        checkpoint.capture(first)
+    with pytest.raises(RuntimeError):
+        checkpoint.restore(first)
+    checkpoint.restore(second)                      # a fork takes the newest simulation
+    second.step()
+    assert second.count == 2
+
+
+def test_difficulty_change_redraws_the_next_asteroid_spawn(monkeypatch):
+    sim = game.Simulation(seed=2)
+    for _ in range(10):
+        sim.step()
+    monkeypatch.setitem(game.Asteroid.ast_diff_setting, 8, 0)     # an asteroid every tick
+    monkeypatch.setattr(game.Asteroid, 'current_setting', 8)
+    sim.difficulty_changed()
+    assert [tick for tick, name, _ in sim.events.pending() if name == 'spawn_asteroid'] == [sim.count]
+    asteroids = len(game.Asteroid.asteroid_lst)
+    for _ in range(5):
+        sim.step()
+    assert len(game.Asteroid.asteroid_lst) == asteroids + 5
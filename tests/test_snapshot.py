@@ -0,0 +1,89 @@
+import operator
+
+import Interstellar_Escort as game
+
+
+def blocks(snapshot):
+    return {kind: list(block) for kind, block in snapshot.blocks.items()}, dict(snapshot.counts)
+
+
+def captured(sim):
+    snapshot = game.Snapshot()
+    snapshot.capture(sim)
+    return snapshot
+
+
+def test_keyframe_and_deltas_round_trip():
+    sim = game.Simulation(seed=5)
+    policy = game.Autopilot()
+    previous = received = None
+    for _ in range(600):                            # counts of every kind change along the way
+        sim.step(policy(sim))
+        snapshot = captured(sim)
+        decoded = game.Snapshot()
+        if previous is None:
+            decoded.decode(snapshot.encode())
+        else:
+            decoded.decode(snapshot.encode(previous), received)
+        assert decoded.scalars == snapshot.scalars
+        assert blocks(decoded) == blocks(snapshot)
+        previous, received = snapshot, decoded
+
+
+def test_delta_handles_changing_counts():
+    sim = game.Simulation(seed=5)
+    before = captured(sim)
+    game.Health_PowerUp(sim.rng, sim.width)
+    game.Health_PowerUp(sim.rng, sim.width)
+    after = captured(sim)
+    decoded = game.Snapshot()
+    decoded.decode(after.encode(before), before)
+    assert blocks(decoded) == blocks(after)
+    del game.Health_PowerUp.current_powerups[:]
+    emptied = captured(sim)
+    decoded.decode(emptied.encode(after), after)
+    assert blocks(decoded) == blocks(emptied)
+
+
+def test_out_of_range_coordinates():
+    sim = game.Simulation(seed=10)
+    sim.step(0)
+    powerup = game.Health_PowerUp(sim.rng, sim.width)
+    powerup.y = -30000
+    before = captured(sim)
+    powerup.y = 40000                               # doesn't fit in 16 bits
+    after = captured(sim)
+    assert list(after.column('health_powerups', 'y')) == [32767]
+
+    delta = after.delta('health_powerups', before, operator.sub)     # 32767 - -30000 wraps around
+    assert all(-32768 <= value <= 32767 for value in delta)
+    decoded = game.Snapshot()
+    decoded.decode(after.encode(before), before)
+    assert blocks(decoded) == blocks(after)
+
+
+def test_missed_powerups_leave_the_snapshot():
+    sim = game.Simulation(seed=10)
+    sim.step(0)
+    powerup = game.Health_PowerUp(sim.rng, sim.width)
+    powerup.x = 0                                   # out of the main sprite's reach
+    for _ in range(sim.height):
+        sim.step(0)
+        if powerup not in game.Health_PowerUp.current_powerups:
+            break
+        assert -32768 < powerup.y < sim.height      # only powerups on the playfield are kept
+    assert powerup not in game.Health_PowerUp.current_powerups
+    assert captured(sim).counts['health_powerups'] == len(game.Health_PowerUp.current_powerups)
+
+
+def test_server_captures_nothing_without_spectators():
+    sim = game.Simulation(seed=5)
+    server = game.SpectatorServer('127.0.0.1:0')
+    try:
+        assert server.parse_address('127.0.0.1:7777') == game.SpectatorServer.parse_address('127.0.0.1:7777')
+        sim.step(0)
+        server.publish(sim)
+        assert server.stats()['frames'] == 0
+        assert server.previous is None
+    finally:
+        server.close()
@@ -0,0 +1,61 @@
+import random
+
+import Interstellar_Escort as game
+
+
+class Thing:
+    pass
+
+
+class Other:
+    pass
+
+
+def test_query_finds_objects_sharing_a_cell_once():
+    grid = game.SpatialGrid(cell_size=100)
+    wide, small, far, other = Thing(), Thing(), Thing(), Other()
+    grid.insert(wide, 50, 50, 200, 20)              # spans three cells
+    grid.insert(small, 120, 60, 10, 10)
+    grid.insert(far, 450, 650, 10, 10)
+    grid.insert(other, 130, 70, 10, 10)
+    assert grid.query(0, 0, 300, 100) == [wide, small, other]
+    assert grid.query(0, 0, 300, 100, Thing) == [wide, small]
+    assert grid.query_point(260, 80) == [wide]
+    assert grid.query(-100, -100, 10, 10) == []     # above the playfield is allowed
+
+
+def test_move_and_remove_update_the_cells():
+    grid = game.SpatialGrid(cell_size=100)
+    thing = Thing()
+    grid.insert(thing, 10, 10, 20, 20)
+    grid.move(thing, 15, 40, 20, 20)                # same cell
+    assert grid.bounds[thing] == (15, 40, 20, 20)
+    grid.move(thing, 15, 340, 20, 20)
+    assert grid.query_point(20, 20) == []
+    assert grid.query_point(20, 350) == [thing]
+    grid.remove(thing)
+    assert grid.query(0, 0, 500, 700) == [] and not grid.bounds
+
+
+def test_nearest_matches_brute_force():
+    rng = random.Random(4)
+    grid = game.SpatialGrid(cell_size=100)
+    boxes = {}
+    for _ in range(60):
+        thing = Thing()
+        boxes[thing] = (rng.randrange(-100, 500), rng.randrange(-100, 700), rng.randrange(5, 100), rng.randrange(5, 100))
+        grid.insert(thing, *boxes[thing])
+
+    def distance_sq(thing, x, y):
+        bx, by, bw, bh = boxes[thing]
+        return (bx + bw/2 - x)**2 + (by + bh/2 - y)**2
+
+    for _ in range(200):
+        x, y = rng.randrange(-200, 700), rng.randrange(-200, 900)
+        found = grid.nearest(x, y)
+        assert distance_sq(found, x, y) == min(distance_sq(thing, x, y) for thing in boxes)
+        within = grid.nearest(x, y, max_distance=80)
+        close = [thing for thing in boxes if distance_sq(thing, x, y) <= 80**2]
+        assert (within is None) == (not close)
+        if close:
+            assert distance_sq(within, x, y) == min(distance_sq(thing, x, y) for thing in close)
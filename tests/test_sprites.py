@@ -0,0 +1,29 @@
+import os
+import subprocess
+import sys
+
+import pygame
+
+import Interstellar_Escort as game
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_nothing_is_loaded_on_import():
+    code = 'import Interstellar_Escort as game; print(game.Mothership.image, game.assets.stats()["images"])'
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy')
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    assert result.stdout.split()[-2:] == ['None', '0']
+
+
+def test_sprites_are_loaded_converted_to_the_display_format():
+    game.GameStart(play=False)                      # loads the sprites once the window exists
+    assert game.Mothership.image.get_size() == (game.view.width, 50)
+    assert sorted(game.Asteroid.asteroid_images) == game.Asteroid.width_options
+    for width, images in game.Asteroid.asteroid_images.items():
+        assert len(images) == 5 and all(image.get_size() == (width, width) for image in images)
+    assert len(game.Explosion.explosion_images) == 11
+    assert 'Mothership/mothership_3_2.png' in game.assets.converted
+    display_format = pygame.display.get_surface().get_bitsize()
+    assert game.Character.center_images[0].get_bitsize() == display_format
+    assert game.Character.center_images[0].get_flags() & pygame.SRCALPHA  # transparency is kept
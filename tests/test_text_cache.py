@@ -0,0 +1,34 @@
+import pygame
+
+import Interstellar_Escort as game
+
+
+def font():
+    pygame.font.init()
+    return pygame.font.Font(None, 20)
+
+
+def test_least_recently_used_surface_is_evicted():
+    cache = game.TextCache(capacity=2)
+    small = font()
+    white = (255, 255, 255)
+    first = cache.render(small, 'a', white)
+    cache.render(small, 'b', white)
+    assert cache.render(small, 'a', white) is first         # now the most recently used
+    cache.render(small, 'c', white)                         # full, 'b' goes
+    assert [key[1] for key in cache.surfaces] == ['a', 'c']
+    assert cache.render(small, 'a', white) is first
+    cache.render(small, 'b', white)
+    assert [key[1] for key in cache.surfaces] == ['a', 'b']
+    assert cache.stats() == {'hits': 2, 'misses': 4, 'evictions': 2, 'hit_rate': 2/6, 'size': 2}
+
+
+def test_numbers_are_drawn_from_cached_characters():
+    cache = game.TextCache()
+    small = font()
+    surface = pygame.Surface((200, 50))
+    rect = cache.blit_number(surface, small, '+1010', (255, 255, 255), (10, 5))
+    assert cache.misses == 3 and cache.hits == 2             # '+', '1' and '0' rendered once each
+    assert (rect.x, rect.y) == (10, 5)
+    assert rect.size == cache.number_size(small, '+1010', (255, 255, 255))
+    assert cache.misses == 3
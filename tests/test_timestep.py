@@ -0,0 +1,29 @@
+import time
+
+import pygame
+
+import Interstellar_Escort as game
+
+
+def test_simulation_steps_once_per_full_tick_of_real_time():
+    start = game.GameStart(play=False)
+    start.new_game()
+    tick = 1 / game.Simulation.tick_rate
+    start.last_time = time.perf_counter() - 2.5*tick
+    start.advance_simulation(0)
+    assert start.simulation.count == 2
+    assert 0.5*tick <= start.accumulator < 0.9*tick  # the leftover half tick is kept for interpolation
+
+    start.last_time = time.perf_counter() - 1.0     # a long stall only catches up max_ticks_per_frame ticks
+    start.advance_simulation(0)
+    assert start.simulation.count == 2 + start.max_ticks_per_frame
+    assert start.accumulator < tick
+
+
+def test_shots_are_drawn_between_their_last_two_positions():
+    sim = game.Simulation(seed=0)
+    shot = game.ShooterObject.pool.acquire('normal', 100, 400)
+    sim.advance_objects()                           # from 425 to 422
+    surface = pygame.Surface((500, 700))
+    tops = [shot.draw_line(surface, alpha).top for alpha in [0, 0.5, 1]]
+    assert tops == [425 - shot.height, 423 - shot.height, 422 - shot.height]
@@ -0,0 +1,121 @@
+import pytest
+
+import Interstellar_Escort as game
+
+np = pytest.importorskip('numpy')
+vector_env = pytest.importorskip('vector_env')
+
+# asteroids as (x, y, prev_y, width, health) and shots as (x, start_y, prev_start_y)
+ASTEROIDS = [(100, 300, 300, 50, 100),              # hit by the first shot before it reaches
+             (100, 200, 200, 50, 100),              # the one above it
+             (300, 200, 200, 60, 20),               # destroyed by one shot
+             (200, 620, 620, 50, 100)]              # reaching the mothership
+SHOTS = [(125, 250, 430),
+         (330, 230, 233),
+         (160, 250, 430)]                           # beside the first two asteroids
+
+
+def sim_tick(asteroids, shots, option=None):
+    '''Set up a Simulation, then activate powerups and resolve collisions on it'''
+    sim = game.Simulation(seed=0)
+    sim.mothership.health_amt = 600
+    placed = []
+    for x, y, prev_y, width, health in asteroids:
+        asteroid = game.Asteroid.pool.acquire(sim.rng, sim.width)
+        asteroid.x, asteroid.y, asteroid.prev_y, asteroid.width = x, y, prev_y, width
+        asteroid.health_amt, asteroid.damage = health, width*2
+        placed.append(asteroid)
+    fired = []
+    for x, start_y, prev_start_y in shots:
+        shot = game.ShooterObject.pool.acquire('normal', x, start_y - 25)
+        shot.prev_start_y = prev_start_y
+        fired.append(shot)
+    if option is not None:
+        game.TimedPowerUp(option, sim.rng, sim.width)
+        game.TimedPowerUp.activated = True
+    sim.build_grid()
+    sim.handle_powerups()
+    sim.handle_collisions()
+    alive = [asteroid in game.Asteroid.asteroid_lst for asteroid in placed]
+    return (alive, [asteroid.health_amt for asteroid, live in zip(placed, alive) if live],
+            [shot in game.ShooterObject.shots_queue for shot in fired],
+            sim.score.score, sim.asteroids_destroyed, sim.mothership.health_amt)
+
+
+def env_tick(asteroids, shots, option=None):
+    '''Set up the same positions in a 1-game VectorEnv, then activate powerups and resolve collisions on it'''
+    env = vector_env.VectorEnv(1, seed=0)
+    env.health[0] = 600
+    for slot, (x, y, prev_y, width, health) in enumerate(asteroids):
+        env.ast_alive[0, slot] = True
+        env.ast_x[0, slot], env.ast_y[0, slot], env.ast_prev_y[0, slot] = x, y, prev_y
+        env.ast_width[0, slot], env.ast_health[0, slot] = width, health
+    for slot, (x, start_y, prev_start_y) in enumerate(shots):
+        env.shot_alive[0, slot] = True
+        env.shot_x[0, slot], env.shot_y[0, slot], env.shot_prev_y[0, slot] = x, start_y, prev_start_y
+    if option is not None:
+        env.activated[0] = True
+        env.current_option[0] = game.TimedPowerUp.power_up_options.index(option)
+    env.handle_powerups()
+    env.handle_collisions()
+    alive = list(env.ast_alive[0, :len(asteroids)])
+    return (alive, [int(env.ast_health[0, slot]) for slot, live in enumerate(alive) if live],
+            list(env.shot_alive[0, :len(shots)]),
+            int(env.score[0]), int(env.asteroids_destroyed[0]), int(env.health[0]))
+
+
+@pytest.mark.parametrize('option', [None, 'Insta-Kill', 'Double XP'])
+def test_collisions_match_simulation(option):
+    expected = sim_tick(ASTEROIDS, SHOTS, option)
+    assert env_tick(ASTEROIDS, SHOTS, option) == expected
+    alive, _, shots, _, _, health = expected
+    assert alive[1] and not alive[3] and health == 500
+    assert shots == [False, False, True]
+
+
+def test_powerup_activation_matches_simulation():
+    sim = game.Simulation(seed=0)
+    sim.main_sprite.x = 200
+    sim.mothership.health_amt = 600
+    taken, missed = game.Health_PowerUp(sim.rng, sim.width), game.Health_PowerUp(sim.rng, sim.width)
+    timed = game.TimedPowerUp('Double XP', sim.rng, sim.width)
+    for powerup, x in [(taken, 250), (missed, 100), (timed, 230)]:
+        powerup.x, powerup.y = x, sim.main_sprite.y + 20
+    sim.build_grid()
+    sim.handle_powerups()
+
+    env = vector_env.VectorEnv(1, seed=0)
+    env.ship_x[0] = 200
+    env.health[0] = 600
+    env.health_alive[0, 0] = True                   # one powerup slot, the missed powerup is only in the Simulation
+    env.health_x[0, 0], env.health_y[0, 0] = 250, env.ship_y + 20
+    env.timed_alive[0, 0] = True
+    env.timed_x[0, 0], env.timed_y[0, 0] = 230, env.ship_y + 20
+    env.timed_type[0, 0] = env.current_option[0] = game.TimedPowerUp.power_up_options.index('Double XP')
+    env.handle_powerups()
+
+    assert [taken.activated, missed.activated] == [True, False]
+    assert not env.health_alive[0, 0]
+    assert env.health[0] == sim.mothership.health_amt == 850
+    assert env.activated[0] and game.TimedPowerUp.activated
+    assert game.TimedPowerUp.power_up_options[env.current_option[0]] == game.TimedPowerUp.current_option
+
+
+def test_step_resets_games_that_end():
+    env = vector_env.VectorEnv(3, seed=0)
+    env.health[1] = 10
+    env.score[1] = 42
+    env.ast_alive[1, 0] = True                      # about to reach the mothership
+    env.ast_x[1, 0], env.ast_width[1, 0], env.ast_health[1, 0] = 100, 50, 100
+    env.ast_y[1, 0] = env.ast_prev_y[1, 0] = env.mothership_y - 40
+
+    obs, rewards, done = env.step(np.zeros(3, np.int64))
+
+    assert obs.shape == (3, env.obs_size)
+    assert rewards.shape == (3,)
+    assert list(done) == [False, True, False]
+    assert env.final_score[1] == 43 and env.final_count[1] == 1
+    assert list(env.count) == [1, 0, 1]
+    assert env.health[1] == env.max_health and env.score[1] == 0
+    assert obs[1, 1] == env.max_health
+    assert list(env.final_count) == [0, 1, 0]
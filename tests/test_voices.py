@@ -0,0 +1,28 @@
+import pygame
+import pytest
+
+import Interstellar_Escort as game
+
+
+@pytest.fixture
+def sounds():
+    if not pygame.mixer.get_init():
+        try:
+            pygame.mixer.init()
+        except pygame.error:
+            pytest.skip('no audio device')
+    yield [pygame.mixer.Sound(buffer=bytes(4 * 44100 * (i + 1))) for i in range(4)]    # seconds of silence
+    pygame.mixer.stop()
+
+
+def test_voices_are_limited_stolen_by_priority_and_repeats_dropped(sounds):
+    pool = game.VoicePool(voices=2, repeat_window=0.05)
+    shot, explosion, popup, music_cue = sounds
+    first = pool.play(shot, 0, now=0.0)
+    assert first is not None
+    assert pool.play(shot, 0, now=0.01) is None                 # repeat within the window
+    assert pool.play(explosion, 1, now=0.1) not in (None, first)
+    assert pool.play(popup, 0, now=0.2) is first                # steals the oldest voice of no higher priority
+    assert pool.play(music_cue, -1, now=0.3) is None            # nothing of low enough priority to steal
+    assert pool.play(shot, 0, now=0.4) is first                 # repeats are fine once the window has passed
+    assert pool.stats() == {'played': 4, 'dropped': 2, 'stolen': 2, 'busy': 2}
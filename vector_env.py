@@ -0,0 +1,454 @@
+import numpy as np
+
+import Interstellar_Escort as game
+
+
+NEVER = 2**62                   # tick of an event that isn't scheduled
+
+
+class VectorEnv:
+    '''Many independent games stepped in lockstep, with the state of every game held in numpy arrays.
+
+    Each game follows the rules of Simulation: inputs move the ship, shots are fired every shot_rate ticks and
+    tested along their swept path against the asteroid circles, asteroids and powerups spawn with the same
+    per-tick chances and cooldowns as the Scheduler events, and asteroids reaching the mothership damage it.
+    Games draw their random numbers from one numpy generator, so a game here doesn't replay a Simulation with
+    the same seed, but the two play out the same way on average. Nothing is drawn and there are no objects;
+    one step() advances every game by one tick with a fixed number of array operations, so the cost per game
+    tick shrinks as num_games grows.
+
+    Entities live in fixed slots per game. Shots and powerups all move at the same speed, so they leave the
+    screen in the order they were created and are given slots round robin; asteroids take the first free slot.
+    Games that end are reset at the end of the step that ended them.
+
+    Difficulty settings are read from the Asteroid, ShooterObject and Simulation class attributes when the
+    environment is created.
+
+    Class Attributes
+        ship_width (int): width of the ship, as Character.width
+        ship_velocity (int): pixels the ship moves per tick, as Character.velocity
+        shot_velocity (int): pixels a shot moves per tick
+        shot_height (int): length of a shot
+        shot_damage (int): health taken from an asteroid by a shot
+        powerup_width (int): width of health and timed powerups
+        powerup_height (int): height of health and timed powerups
+        powerup_velocity (int): pixels a powerup falls per tick
+        health_add (int): mothership health given by a health powerup
+        max_health (int): mothership health at the start of a game
+        powerup_duration (int): ticks a timed powerup is active
+        timed_chance (float): chance per tick of a timed powerup spawn while it's eligible
+
+    Args
+        num_games (int): number of games
+        width (int): width of playfield in number of pixels
+        height (int): height of playfield in number of pixels
+        seed (int): seed of the random number generator. A random seed is chosen if None
+
+    Attributes
+        num_games (int): storage of input argument num_games
+        width (int): storage of input argument width
+        height (int): storage of input argument height
+        rng (Generator obj): numpy random number generator shared by every game
+        asteroid_chance (float): chance per tick of an asteroid spawn
+        max_asteroids (int): asteroid slots per game, Asteroid.maximum_asteroid_amount
+        shot_rate (int): ticks between shots
+        health_cooldown (int): ticks after a health powerup before another can spawn
+        timed_cooldown (int): ticks after a timed powerup before another can spawn
+        ship_y (int): y coordinate of the ship
+        mothership_y (int): y coordinate asteroids damage the mothership at
+        shot_slots (int): shot slots per game, enough for every shot on screen
+        powerup_slots (int): health and timed powerup slots per game, enough for every powerup on screen
+        obs_size (int): length of the observation of one game
+        count (ndarray): ticks simulated in each game
+        ship_x (ndarray): x coordinate of each ship
+        health (ndarray): mothership health
+        damage_taken (ndarray): damage dealt to the mothership
+        score (ndarray): score
+        asteroids_destroyed (ndarray): asteroids shot down
+        ast_alive (ndarray): (num_games, max_asteroids) whether the slot holds an asteroid
+        ast_x, ast_y, ast_prev_y, ast_velocity, ast_width, ast_health (ndarray): asteroid columns
+        shot_alive (ndarray): (num_games, shot_slots) whether the slot holds a shot
+        shot_x, shot_y, shot_prev_y (ndarray): x and start y of every shot, and start y before the last tick
+        shots_fired (ndarray): shots fired, which picks the next shot slot
+        health_alive, health_x, health_y (ndarray): (num_games, powerup_slots) health powerups
+        health_spawned (ndarray): health powerups spawned, which picks the next health powerup slot
+        timed_alive, timed_x, timed_y, timed_type (ndarray): (num_games, powerup_slots) timed powerups, the type
+            is an index into TimedPowerUp.power_up_options
+        timed_spawned (ndarray): timed powerups spawned, which picks the next timed powerup slot
+        activated (ndarray): whether a timed powerup is active
+        current_option (ndarray): index of the most recently spawned timed powerup type, -1 for none
+        active_slot (ndarray): slot of the active timed powerup
+        effect_end (ndarray): tick the active timed powerup ends on
+        next_asteroid (ndarray): tick of the next asteroid spawn
+        next_health (ndarray): tick of the next health powerup spawn, NEVER if none is scheduled
+        next_timed (ndarray): (num_games, 2) tick of the next spawn of each timed powerup type, NEVER if none
+        health_timer (ndarray): tick the health powerup cooldown ends on
+        powerup_timer (ndarray): tick the timed powerup cooldown ends on
+        final_score (ndarray): score each game had when it last ended
+        final_count (ndarray): ticks each game lasted when it last ended
+        games (ndarray): index of every game, for fancy indexing
+    '''
+    ship_width = 96
+    ship_velocity = 5
+    shot_velocity = 3
+    shot_height = 10
+    shot_damage = 20
+    powerup_width = 25
+    powerup_height = 20
+    powerup_velocity = 3
+    health_add = 250
+    max_health = 1000
+    powerup_duration = 550
+    timed_chance = 1/1001
+
+    def __init__(self, num_games, width=500, height=700, seed=None):
+        self.num_games = num_games
+        self.width = width
+        self.height = height
+        self.rng = np.random.default_rng(seed)
+        self.asteroid_chance = 1 / (game.Asteroid.ast_diff_setting[game.Asteroid.current_setting] + 1)
+        self.max_asteroids = game.Asteroid.maximum_asteroid_amount
+        self.shot_rate = game.ShooterObject.shot_rate
+        self.health_cooldown = game.Simulation.health_powerup_cooldown
+        self.timed_cooldown = game.Simulation.powerup_cooldown
+        self.ship_y = height - 160
+        self.mothership_y = height - 50
+        self.shot_slots = (self.ship_y + 25) // (self.shot_velocity * self.shot_rate) + 2
+        fall_ticks = (height + self.powerup_height) // self.powerup_velocity + 1
+        self.powerup_slots = fall_ticks // min(self.health_cooldown, self.timed_cooldown) + 1
+        self.obs_size = 5 + 5*self.max_asteroids + 3*self.powerup_slots + 4*self.powerup_slots
+
+        n, a, s, p = num_games, self.max_asteroids, self.shot_slots, self.powerup_slots
+        self.count = np.zeros(n, np.int64)
+        self.ship_x = np.zeros(n, np.int32)
+        self.health = np.zeros(n, np.int32)
+        self.damage_taken = np.zeros(n, np.int32)
+        self.score = np.zeros(n, np.int64)
+        self.asteroids_destroyed = np.zeros(n, np.int32)
+        self.ast_alive = np.zeros((n, a), bool)
+        self.ast_x = np.zeros((n, a), np.int16)
+        self.ast_y = np.zeros((n, a), np.int16)
+        self.ast_prev_y = np.zeros((n, a), np.int16)
+        self.ast_velocity = np.zeros((n, a), np.int16)
+        self.ast_width = np.zeros((n, a), np.int16)
+        self.ast_health = np.zeros((n, a), np.int32)
+        self.shot_alive = np.zeros((n, s), bool)
+        self.shot_x = np.zeros((n, s), np.int16)
+        self.shot_y = np.zeros((n, s), np.int16)
+        self.shot_prev_y = np.zeros((n, s), np.int16)
+        self.shots_fired = np.zeros(n, np.int64)
+        self.health_alive = np.zeros((n, p), bool)
+        self.health_x = np.zeros((n, p), np.int32)
+        self.health_y = np.zeros((n, p), np.int32)
+        self.health_spawned = np.zeros(n, np.int64)
+        self.timed_alive = np.zeros((n, p), bool)
+        self.timed_x = np.zeros((n, p), np.int32)
+        self.timed_y = np.zeros((n, p), np.int32)
+        self.timed_type = np.zeros((n, p), np.int8)
+        self.timed_spawned = np.zeros(n, np.int64)
+        self.activated = np.zeros(n, bool)
+        self.current_option = np.full(n, -1, np.int8)
+        self.active_slot = np.zeros(n, np.int64)
+        self.effect_end = np.full(n, NEVER, np.int64)
+        self.next_asteroid = np.zeros(n, np.int64)
+        self.next_health = np.full(n, NEVER, np.int64)
+        self.next_timed = np.full((n, 2), NEVER, np.int64)
+        self.health_timer = np.zeros(n, np.int64)
+        self.powerup_timer = np.zeros(n, np.int64)
+        self.final_score = np.zeros(n, np.int64)
+        self.final_count = np.zeros(n, np.int64)
+        self.games = np.arange(n)
+        self.reset()
+
+    def reset(self, games=None):
+        '''Start new games
+
+        Args
+            games (ndarray): boolean mask of the games to restart, every game if None
+
+        Returns
+            ndarray: observations of every game
+        '''
+        if games is None:
+            games = np.ones(self.num_games, bool)
+        for column in [self.count, self.damage_taken, self.score, self.asteroids_destroyed, self.ast_alive,
+                       self.shot_alive, self.shots_fired, self.health_alive, self.health_spawned, self.timed_alive,
+                       self.timed_spawned, self.activated, self.health_timer, self.powerup_timer]:
+            column[games] = 0
+        self.ship_x[games] = self.width//2 - 50
+        self.health[games] = self.max_health
+        self.current_option[games] = -1
+        self.effect_end[games] = NEVER
+        self.next_health[games] = NEVER
+        self.next_timed[games] = NEVER
+        self.next_asteroid[games] = self.rng.geometric(self.asteroid_chance, np.count_nonzero(games)) - 1
+        self.health_changed(games)
+        return self.observe()
+
+    def schedule_health_powerup(self, games):
+        '''Redraw the next health powerup spawn for the mothership's current health, as
+        Simulation.schedule_health_powerup()
+
+        Args
+            games (ndarray): boolean mask of games whose mothership health changed
+        '''
+        damaged = games & (self.health != self.max_health)
+        self.next_health[games & ~damaged] = NEVER
+        if damaged.any():
+            chance = 1 / np.maximum(self.health[damaged]*2 + 301, 1)
+            first = np.maximum(self.count[damaged] + 1, self.health_timer[damaged] + 1)
+            self.next_health[damaged] = first + self.rng.geometric(chance) - 1
+
+    def schedule_timed_powerups(self, games):
+        '''Schedule Double XP while the mothership has at least half its health and Insta-Kill while it has at
+        most half, as long as neither is active, as Simulation.schedule_timed_powerups()
+
+        Args
+            games (ndarray): boolean mask of games whose health, cooldown or activation changed
+        '''
+        options = game.TimedPowerUp.power_up_options
+        inactive = games & ~self.activated
+        for option, eligible in [(options.index('Insta-Kill'), inactive & (self.health <= 500)),
+                                 (options.index('Double XP'), inactive & (self.health >= 500))]:
+            column = self.next_timed[:, option]
+            column[games & ~eligible] = NEVER
+            new = eligible & (column == NEVER)                  # a chance that stays the same isn't redrawn
+            if new.any():
+                first = np.maximum(self.count[new] + 1, self.powerup_timer[new] + 1)
+                column[new] = first + self.rng.geometric(self.timed_chance, np.count_nonzero(new)) - 1
+
+    def health_changed(self, games):
+        '''Redraw powerup spawns that depend on the mothership's health
+
+        Args
+            games (ndarray): boolean mask of games whose mothership health changed
+        '''
+        self.schedule_health_powerup(games)
+        self.schedule_timed_powerups(games)
+
+    def step(self, actions):
+        '''Advance every game by one tick
+
+        Args
+            actions (ndarray): inputs of each game, bitmasks of INPUT_LEFT and INPUT_RIGHT as for Simulation.step()
+
+        Returns
+            tuple: observations (num_games, obs_size), rewards (score gained this tick) and done flags. Games that
+                are done have already been reset, their final score and length are in final_score and final_count
+        '''
+        actions = np.asarray(actions)
+        start_score = self.score.copy()
+        count = self.count
+        games = self.games
+
+        # inputs, as Simulation.handle_inputs()
+        left = (actions & game.INPUT_LEFT) != 0
+        right = ~left & ((actions & game.INPUT_RIGHT) != 0)
+        self.ship_x -= np.where(left & (self.ship_x > 0), self.ship_velocity, 0).astype(np.int32)
+        self.ship_x += np.where(right & (self.ship_x < self.width - self.ship_width), self.ship_velocity, 0).astype(np.int32)
+
+        # shots, as Simulation.generate_shots()
+        firing = count % self.shot_rate == 0
+        if firing.any():
+            slots = self.shots_fired[firing] % self.shot_slots
+            rows = games[firing]
+            self.shot_alive[rows, slots] = True
+            self.shot_x[rows, slots] = self.ship_x[firing] + self.ship_width//2
+            self.shot_y[rows, slots] = self.ship_y + 25
+            self.shot_prev_y[rows, slots] = self.ship_y + 25
+            self.shots_fired += firing
+
+        self.run_events()
+        self.handle_powerups()
+        self.handle_collisions()
+
+        self.score += count % 5 == 0
+        self.advance_objects()
+        self.count += 1
+
+        rewards = (self.score - start_score).astype(np.float32)
+        done = self.health <= 0
+        if done.any():
+            self.final_score[done] = self.score[done]
+            self.final_count[done] = self.count[done]
+            return self.reset(done), rewards, done
+        return self.observe(), rewards, done
+
+    def run_events(self):
+        '''Spawn asteroids and powerups and end timed powerups that are due this tick, as Simulation.run_events()'''
+        count = self.count
+        games = self.games
+
+        ending = self.activated & (self.effect_end <= count)
+        if ending.any():
+            self.activated[ending] = False
+            self.timed_alive[games[ending], self.active_slot[ending]] = False
+            self.effect_end[ending] = NEVER
+            self.schedule_timed_powerups(ending)
+
+        due = self.next_asteroid <= count
+        if due.any():
+            # a spawn that comes up while the screen is full is skipped
+            spawning = due & (self.ast_alive.sum(axis=1) < self.max_asteroids)
+            if spawning.any():
+                rows = games[spawning]
+                slots = np.argmin(self.ast_alive[spawning], axis=1)     # first free slot
+                size = len(rows)
+                width = self.rng.choice(game.Asteroid.width_options, size)
+                self.ast_alive[rows, slots] = True
+                self.ast_width[rows, slots] = width
+                self.ast_x[rows, slots] = self.rng.integers(50, self.width - width)
+                self.ast_y[rows, slots] = -width
+                self.ast_prev_y[rows, slots] = -width
+                self.ast_velocity[rows, slots] = np.where(width < 80, self.rng.integers(2, 4, size), self.rng.integers(1, 3, size))
+                self.ast_health[rows, slots] = width*2
+            self.next_asteroid[due] = count[due] + self.rng.geometric(self.asteroid_chance, np.count_nonzero(due))
+
+        due = self.next_health <= count
+        if due.any():
+            rows = games[due]
+            slots = self.health_spawned[due] % self.powerup_slots
+            self.health_alive[rows, slots] = True
+            self.health_x[rows, slots] = self.rng.integers(25, self.width - 2*self.powerup_width + 1, len(rows))
+            self.health_y[rows, slots] = -self.powerup_height
+            self.health_spawned += due
+            self.health_timer[due] = count[due] + self.health_cooldown
+            self.next_health[due] = NEVER
+            self.schedule_health_powerup(due)
+
+        for option in range(2):
+            due = self.next_timed[:, option] <= count
+            if not due.any():
+                continue
+            self.next_timed[due, option] = NEVER
+            spawning = due & ~self.activated
+            rows = games[spawning]
+            slots = self.timed_spawned[spawning] % self.powerup_slots
+            self.timed_alive[rows, slots] = True
+            self.timed_x[rows, slots] = self.rng.integers(25, self.width - 2*self.powerup_width + 1, len(rows))
+            self.timed_y[rows, slots] = -self.powerup_height
+            self.timed_type[rows, slots] = option
+            self.timed_spawned += spawning
+            self.current_option[spawning] = option
+            self.powerup_timer[spawning] = count[spawning] + self.timed_cooldown
+            self.next_timed[spawning] = NEVER                   # the other type waits for the cooldown too
+            self.schedule_timed_powerups(spawning)
+
+    def touching(self, alive, x, y):
+        '''Powerups touching the ship, with the boundaries used by Simulation.handle_powerups()
+
+        Args
+            alive (ndarray): whether each powerup slot is in use
+            x (ndarray): powerup x coordinates
+            y (ndarray): powerup y coordinates
+
+        Returns
+            ndarray: boolean mask of powerups touching the ship
+        '''
+        ship_x = self.ship_x[:, None]
+        bottom = y + self.powerup_height
+        return alive & (x > ship_x) & (x < ship_x + self.ship_width) & (bottom > self.ship_y) & \
+            (bottom < self.ship_y + self.ship_width)
+
+    def handle_powerups(self):
+        '''Activate powerups the ship is touching, as Simulation.handle_powerups()'''
+        touched = self.touching(self.health_alive, self.health_x, self.health_y)
+        gained = touched.sum(axis=1)
+        if gained.any():
+            self.health_alive &= ~touched                       # its text is all that would still be shown
+            self.health = np.minimum(self.health + self.health_add*gained, self.max_health).astype(np.int32)
+            self.health_changed(gained > 0)
+
+        touched = self.touching(self.timed_alive, self.timed_x, self.timed_y) & ~self.activated[:, None]
+        activating = touched.any(axis=1)
+        if activating.any():
+            self.activated |= activating
+            self.active_slot[activating] = np.argmax(touched[activating], axis=1)
+            self.effect_end[activating] = self.count[activating] + self.powerup_duration + 1
+            self.schedule_timed_powerups(activating)            # no new timed powerups while one is active
+
+    def handle_collisions(self):
+        '''Damage every asteroid hit by a shot this tick, each shot hitting the first asteroid along its path, and
+        destroy finished asteroids, as Simulation.handle_collisions() and remove_finished()'''
+        options = game.TimedPowerUp.power_up_options
+        # cheap integer test of every (game, shot, asteroid) for a shot in line with the asteroid whose swept tip
+        # could reach it, then the exact test of Simulation.shot_hits() on the few pairs that pass
+        tip = (self.shot_y - self.shot_height)[:, :, None]
+        back = (self.shot_prev_y - self.shot_y)[:, :, None]
+        candidates = self.shot_alive[:, :, None] & self.ast_alive[:, None, :] & \
+            (np.abs(2*self.shot_x[:, :, None] - (2*self.ast_x + self.ast_width)[:, None, :]) < self.ast_width[:, None, :]) & \
+            (tip <= (self.ast_y + self.ast_width)[:, None, :]) & (tip + back >= self.ast_prev_y[:, None, :])
+        pairs = np.flatnonzero(candidates)                      # much faster than nonzero() on three axes
+        rows, pairs = np.divmod(pairs, self.shot_slots*self.max_asteroids)
+        shots, slots = np.divmod(pairs, self.max_asteroids)
+        radius = self.ast_width[rows, slots] / 2
+        dx = self.shot_x[rows, shots] - (self.ast_x[rows, slots] + radius)
+        chord_sq = radius*radius - dx*dx
+        y_1 = tip[rows, shots, 0] - (self.ast_y[rows, slots] + radius)
+        y_0 = y_1 + back[rows, shots, 0] + self.ast_y[rows, slots] - self.ast_prev_y[rows, slots]
+        inside = y_0*y_0 < chord_sq
+        entering = ~inside & (y_0 > 0) & ((y_1 <= 0) | (y_1*y_1 < chord_sq))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            t = np.where(entering, (y_0 - np.sqrt(np.maximum(chord_sq, 0))) / (y_0 - y_1), np.inf)
+        t[inside] = 0.0
+        hit = t < np.inf
+        rows, shots, slots, t = rows[hit], shots[hit], slots[hit], t[hit]
+        order = np.lexsort((slots, t, shots, rows))             # each shot's first asteroid, ties to the lower slot
+        rows, shots, slots = rows[order], shots[order], slots[order]
+        first = np.ones(len(rows), bool)
+        first[1:] = (rows[1:] != rows[:-1]) | (shots[1:] != shots[:-1])
+        rows, shots, slots = rows[first], shots[first], slots[first]
+        hits = np.zeros(self.ast_alive.shape, np.int32)
+        np.add.at(hits, (rows, slots), 1)
+        self.shot_alive[rows, shots] = False
+        insta_kill = (self.activated & (self.current_option == options.index('Insta-Kill')))[:, None]
+        self.ast_health = np.where(insta_kill & (hits > 0), 0, self.ast_health - self.shot_damage*hits).astype(np.int32)
+        self.shot_alive &= self.shot_y >= 0
+
+        destroyed = self.ast_alive & (self.ast_health <= 0)
+        contact = self.ast_alive & ~destroyed & (self.ast_y + self.ast_width > self.mothership_y)
+        double_xp = self.activated & (self.current_option == options.index('Double XP'))
+        self.score += np.where(destroyed, self.ast_width, 0).sum(axis=1) * np.where(double_xp, 2, 1)
+        self.asteroids_destroyed += destroyed.sum(axis=1).astype(np.int32)
+        damage = np.where(contact, self.ast_width*2, 0).sum(axis=1).astype(np.int32)
+        self.ast_alive &= ~(destroyed | contact)
+        if damage.any():
+            self.health -= damage
+            self.damage_taken += damage
+            self.health_changed(damage > 0)
+
+    def advance_objects(self):
+        '''Progress shots, asteroids and powerups by one tick, as Simulation.advance_objects(). Powerups that have
+        fallen off the screen can't be touched any more and free their slot'''
+        self.shot_prev_y[:] = self.shot_y
+        self.shot_y -= self.shot_alive * np.int16(self.shot_velocity)         # empty slots stay put
+        self.ast_prev_y[:] = self.ast_y
+        moving = self.ast_alive & (self.count % 2 == 0)[:, None]                # asteroids move every other tick
+        self.ast_y += moving * self.ast_velocity
+        self.health_y += self.powerup_velocity
+        self.health_alive &= self.health_y < self.height
+        self.timed_y += np.where(self.activated[:, None], 0, self.powerup_velocity).astype(np.int32)
+        self.timed_alive &= (self.timed_y < self.height) | self.activated[:, None]
+
+    def observe(self):
+        '''Observations of every game, in pixels and ticks
+
+        Each row is the ship x, mothership health, whether a timed powerup is active, ticks left of it, the
+        current timed powerup type (-1 none, else an index into TimedPowerUp.power_up_options), then for every
+        asteroid slot whether it's in use, x, y, width and health, for every health powerup slot whether it's in
+        use, x and y, and for every timed powerup slot whether it's in use, x, y and type. Unused slots are zeros
+
+        Returns
+            ndarray: float32 array of shape (num_games, obs_size)
+        '''
+        remaining = np.where(self.activated, self.effect_end - self.count, 0)
+        ast_alive = self.ast_alive
+        health_alive = self.health_alive
+        timed_alive = self.timed_alive
+        return np.concatenate([
+            np.stack([self.ship_x, self.health, self.activated, remaining, self.current_option], axis=1),
+            ast_alive, self.ast_x * ast_alive, self.ast_y * ast_alive, self.ast_width * ast_alive,
+            self.ast_health * ast_alive,
+            health_alive, self.health_x * health_alive, self.health_y * health_alive,
+            timed_alive, self.timed_x * timed_alive, self.timed_y * timed_alive, self.timed_type * timed_alive,
+        ], axis=1, dtype=np.float32)